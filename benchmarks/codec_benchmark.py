@@ -0,0 +1,131 @@
+"""Micro-benchmark of the PETLIBRO JSON codec.
+
+Compares encoding request bodies and decoding responses with orjson (as used by codec.py when it is
+installed) and with the standard library, over payloads shaped like the device/list, realInfo and
+wetListV3 responses. Run with ``python benchmarks/codec_benchmark.py``.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import json
+import sys
+import timeit
+
+from pathlib import Path
+
+CODEC_PATH = Path(__file__).resolve().parent.parent / "custom_components" / "petlibro" / "codec.py"
+ROUNDS = 5
+NUMBER = 2000
+
+
+def _load_codec():
+    """Load codec.py on its own, without importing Home Assistant through the package."""
+    spec = importlib.util.spec_from_file_location("petlibro_codec", CODEC_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _device(index: int) -> dict:
+    return {
+        "deviceSn": f"AF0301{index:010d}",
+        "productIdentifier": "PLAF103",
+        "productName": "Granary Smart Feeder",
+        "name": f"Feeder {index}",
+        "mac": f"AA:BB:CC:DD:EE:{index:02X}",
+        "online": True,
+        "electricQuantity": 87,
+        "wifiRssi": -58,
+        "softwareVersion": "1.2.30",
+        "hardwareVersion": "1.0.0",
+        "timezone": "America/Chicago",
+        "enableFeedingPlan": True,
+        "nextFeedingDay": "2026-10-17",
+        "nextFeedingTime": "18:00",
+        "nextFeedingEndTime": "18:30",
+        "surplusGrain": True,
+        "batteryState": "HIGH",
+    }
+
+
+REAL_INFO = {
+    "deviceSn": "AF0301000000000",
+    "mac": "AA:BB:CC:DD:EE:00",
+    "online": True,
+    "onlineList": [{"time": 1760680000000 + i * 60000, "online": i % 7 != 0} for i in range(48)],
+    "wifiSsid": "home",
+    "wifiRssi": -58,
+    "electricQuantity": 87,
+    "batteryState": "HIGH",
+    "batteryDisplayType": "percentage",
+    "enableFeedingPlan": True,
+    "enableSound": True,
+    "enableLight": True,
+    "childLockSwitch": False,
+    "soundSwitch": True,
+    "lightSwitch": True,
+    "screenDisplaySwitch": True,
+    "changeDesiccantFrequency": 30,
+    "remainingDesiccantDays": 12,
+    "grainOutletState": True,
+    "barnDoorState": True,
+    "surplusGrain": True,
+    "runningState": "IDLE",
+    "whetherInSleepMode": False,
+    "weight": 812.5,
+    "weightPercent": 64,
+    "unitType": 1,
+}
+
+WET_LIST = {
+    "templateName": "Weekdays",
+    "plan": [
+        {
+            "id": 1000 + plate,
+            "plate": plate,
+            "label": f"Plate {plate}",
+            "state": 1,
+            "cancelState": False,
+            "executionStartTime": f"2026-10-17 {6 + plate * 4:02d}:00",
+            "executionEndTime": f"2026-10-17 {6 + plate * 4:02d}:30",
+            "timezone": "America/Chicago",
+            "repeatDay": [1, 2, 3, 4, 5],
+        }
+        for plate in range(1, 4)
+    ],
+}
+
+PAYLOADS = {
+    "device/list (20 devices)": {"code": 0, "msg": None, "data": [_device(i) for i in range(20)]},
+    "realInfo": {"code": 0, "msg": None, "data": REAL_INFO},
+    "wetListV3": {"code": 0, "msg": None, "data": WET_LIST},
+}
+
+
+def _best(statement) -> float:
+    """Return the best time of one call, in microseconds."""
+    return min(timeit.repeat(statement, repeat=ROUNDS, number=NUMBER)) / NUMBER * 1e6
+
+
+def main() -> None:
+    codec = _load_codec()
+    if codec.orjson is None:
+        print("orjson is not installed, codec.py uses the standard library; nothing to compare.")
+        return
+
+    print(f"Python {sys.version.split()[0]}, orjson {codec.orjson.__version__}, best of {ROUNDS} x {NUMBER} calls")
+    print(f"{'payload':<26}{'bytes':>8}{'stdlib loads':>15}{'codec loads':>14}{'stdlib dumps':>15}{'codec dumps':>14}")
+    for name, payload in PAYLOADS.items():
+        raw = json.dumps(payload).encode()
+        print(
+            f"{name:<26}{len(raw):>8}"
+            f"{_best(lambda: json.loads(raw)):>13.1f}us"
+            f"{_best(lambda: codec.loads(raw)):>12.1f}us"
+            f"{_best(lambda: json.dumps(payload).encode()):>13.1f}us"
+            f"{_best(lambda: codec.dumps(payload)):>12.1f}us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+"""Benchmark of the sensor state path over synthetic devices of every model.
+
+Builds the sensors of one synthetic device per supported model and times reading their state and
+unit, as Home Assistant does on every state write. The resolved value and unit functions are
+compared with the if/elif dispatch they replaced. Needs Home Assistant installed; run from the
+repository root with ``python benchmarks/sensor_benchmark.py``.
+"""
+
+from __future__ import annotations
+
+import sys
+import timeit
+
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from custom_components.petlibro.devices import product_name_map  # noqa: E402
+from custom_components.petlibro.devices.models import parse_endpoint  # noqa: E402
+from custom_components.petlibro.sensor import DEVICE_SENSOR_MAP, PetLibroDescribedSensorEntity  # noqa: E402
+
+ROUNDS = 5
+NUMBER = 200
+
+REAL_INFO = {
+    "deviceSn": "AF0301000000000",
+    "mac": "AA:BB:CC:DD:EE:00",
+    "online": True,
+    "wifiSsid": "home",
+    "wifiRssi": -58,
+    "electricQuantity": 87,
+    "batteryState": "HIGH",
+    "enableFeedingPlan": True,
+    "changeDesiccantFrequency": 30,
+    "remainingDesiccantDays": 12,
+    "remainingReplacementDays": 20,
+    "remainingCleaningDays": 5,
+    "runningState": "IDLE",
+    "weight": 812.5,
+    "weightPercent": 64,
+    "useWaterInterval": 30,
+    "useWaterDuration": 2,
+    "unitType": 1,
+}
+GRAIN_STATUS = {"todayFeedingQuantity": 24, "todayFeedingTimes": 3, "todayEatingTimes": 5, "petEatingTime": 120}
+
+
+def _device(product_name: str, device_type: type) -> Any:
+    data = {
+        "deviceSn": f"SN-{device_type.__name__}",
+        "productName": product_name,
+        "productIdentifier": device_type.__name__,
+        "name": product_name,
+        "softwareVersion": "1.0.0",
+        "timezone": "America/Chicago",
+        "nextFeedingDay": "2026-10-17",
+        "nextFeedingTime": "18:00",
+        "nextFeedingEndTime": "18:30",
+        **REAL_INFO,
+    }
+    device = device_type(data, None)
+    payloads = {"realInfo": REAL_INFO, "grainStatus": GRAIN_STATUS}
+    device.update_data({
+        endpoint: parse_endpoint(endpoint, payloads.get(endpoint, {})) for endpoint in device.NESTED_ENDPOINTS
+    })
+    return device
+
+
+def _sensors(device: Any) -> list[PetLibroDescribedSensorEntity]:
+    coordinator = SimpleNamespace(last_update_success=True)
+    sensors = [
+        sensor for sensor in device.build_sensors(coordinator) if isinstance(sensor, PetLibroDescribedSensorEntity)
+    ]
+    if sensors:
+        return sensors
+    return [
+        PetLibroDescribedSensorEntity(device, coordinator, description)
+        for device_type, descriptions in DEVICE_SENSOR_MAP.items()
+        if isinstance(device, device_type)
+        for description in descriptions
+    ]
+
+
+def _legacy_state(sensor: PetLibroDescribedSensorEntity) -> tuple[Any, Any]:
+    """The value and unit dispatch before the functions were resolved when building the entity."""
+    device, description = sensor.device, sensor.entity_description
+    key = description.key
+    if key == "feeding_plan_state":
+        value = "On" if getattr(device, key, False) else "Off"
+    elif key == "today_eating_time":
+        value = getattr(device, key, 0)
+    elif key == "today_feeding_quantity":
+        conversion_factor = 1 / 12
+        if hasattr(device, "conversion_mode") and device.conversion_mode == "1/24":
+            conversion_factor = 1 / 24
+        value = f"{round(getattr(device, key, 0) * conversion_factor, 2)}"
+    elif key == "wifi_rssi":
+        value = getattr(device, key, None)
+    elif key == "weight":
+        value = round(getattr(device, key, 0.0) * 0.035274, 2)
+    elif description.should_report(device):
+        value = getattr(device, key, None)
+    else:
+        value = None
+
+    if key == "temperature":
+        unit = "°F"
+    elif key == "today_feeding_quantity":
+        unit = "cups"
+    elif key == "today_eating_time":
+        unit = "s"
+    elif key == "wifi_rssi":
+        unit = "dBm"
+    elif key == "weight":
+        unit = "oz"
+    elif key in ["use_water_interval", "use_water_duration"]:
+        unit = "min"
+    elif key in ("weight_percent", "electric_quantity"):
+        unit = "%"
+    else:
+        unit = description.native_unit_of_measurement_fn(device)
+    return value, unit
+
+
+def _best(statement) -> float:
+    """Return the best time of one call, in microseconds."""
+    return min(timeit.repeat(statement, repeat=ROUNDS, number=NUMBER)) / NUMBER * 1e6
+
+
+def main() -> None:
+    print(f"Python {sys.version.split()[0]}, best of {ROUNDS} x {NUMBER} writes of every sensor")
+    print(f"{'model':<32}{'sensors':>8}{'legacy':>12}{'resolved':>12}")
+    total_legacy = total_resolved = 0.0
+    for product_name, device_type in product_name_map.items():
+        sensors = _sensors(_device(product_name, device_type))
+        legacy = _best(lambda: [_legacy_state(sensor) for sensor in sensors])
+        resolved = _best(lambda: [(sensor.native_value, sensor.native_unit_of_measurement) for sensor in sensors])
+        total_legacy += legacy
+        total_resolved += resolved
+        print(f"{product_name:<32}{len(sensors):>8}{legacy:>10.1f}us{resolved:>10.1f}us")
+    print(f"{'all models':<32}{'':>8}{total_legacy:>10.1f}us{total_resolved:>10.1f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,4 @@
-import logging
+from .log import get_logger
 
 from datetime import timedelta  # For managing the update interval
 from homeassistant.core import HomeAssistant
@@ -18,7 +18,7 @@ from .devices.fountains.dockstream_smart_rfid_fountain import DockstreamSmartRFI
 from .const import DOMAIN, CONF_EMAIL, CONF_PASSWORD, PLATFORMS, UPDATE_INTERVAL_SECONDS  # Assuming UPDATE_INTERVAL_SECONDS is defined in const
 from .hub import PetLibroHub
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 
 # Define the platforms for each device type
@@ -104,17 +104,26 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         # Load devices only once here
         await hub.load_devices()
 
-        # Start the coordinator for periodic updates
-        await hub.coordinator.async_config_entry_first_refresh()
+        # Open the pooled connections the first refresh will use
+        await hub.api.warm_up()
+
+        # Start the account and device coordinators for periodic updates
+        await hub.async_first_refresh()
 
         # Forward entry setups for each platform
         await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-        _LOGGER.info(f"Successfully set up PetLibro integration for {email}")
+        # Only a hub that is set up keeps polling
+        hub.start_polling()
+
+        _LOGGER.info("Successfully set up PetLibro integration for %s", email)
         return True
 
     except Exception as err:
-        _LOGGER.error(f"Failed to set up PetLibro integration: {err}", exc_info=True)
+        _LOGGER.error("Failed to set up PetLibro integration: %s", err, exc_info=True)
+        # Do not leave a half set up hub behind
+        if (hub := hass.data.get(DOMAIN, {}).pop(entry.entry_id, None)) is not None:
+            await hub.async_unload()
         return False
 
 
@@ -124,17 +133,17 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hub = hass.data[DOMAIN].pop(entry.entry_id, None)
 
     if hub is None:
-        _LOGGER.warning(f"PetLibro hub for entry {entry.entry_id} not found.")
+        _LOGGER.warning("PetLibro hub for entry %s not found.", entry.entry_id)
         return False
 
     # Unload platforms associated with the entry
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        _LOGGER.info(f"Successfully unloaded PetLibro entry for {entry.data.get(CONF_EMAIL)}")
+        _LOGGER.info("Successfully unloaded PetLibro entry for %s", entry.data.get(CONF_EMAIL))
         await hub.async_unload()  # If you have any cleanup to do in the hub
     else:
-        _LOGGER.error(f"Failed to unload PetLibro entry for {entry.data.get(CONF_EMAIL)}")
+        _LOGGER.error("Failed to unload PetLibro entry for %s", entry.data.get(CONF_EMAIL))
 
     return unload_ok
 
@@ -6,32 +6,116 @@
 # https://api.us.petlibro.com/device/setting/getAttributeSetting
 # https://api.us.petlibro.com/device/data/grainStatus
 
-from logging import getLogger
+import asyncio
+
+from .log import Payload, Secret, get_logger
+from collections.abc import Iterable
 from hashlib import md5
+from time import monotonic
 from urllib.parse import urljoin
 from typing import Any, Dict, List, TypeAlias
 from datetime import datetime, timedelta
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from homeassistant.exceptions import ConfigEntryAuthFailed
-from .exceptions import PetLibroAPIError, PetLibroInvalidAuth
+from . import codec
+from .cache import FRESH, STALE, ResponseCache
+from .capabilities import EndpointCapabilities
+from .const import (
+    CAPABILITY_MAX_MISSES,
+    CAPABILITY_RECHECK_SECONDS,
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_RESET_SECONDS,
+    COMMAND_LEDGER_TTL_SECONDS,
+    HTTP_CONNECT_TIMEOUT_SECONDS,
+    HTTP_CONNECTIONS_PER_HOST,
+    HTTP_DNS_CACHE_SECONDS,
+    HTTP_KEEPALIVE_SECONDS,
+    HTTP_REQUEST_TIMEOUT_SECONDS,
+    HTTP_WARM_CONNECTIONS,
+    POLL_BURST_SECONDS,
+    RATE_LIMIT_COMMAND_BURST,
+    RATE_LIMIT_COMMANDS_PER_SECOND,
+    RATE_LIMIT_DEFAULT_RETRY_AFTER_SECONDS,
+    RATE_LIMIT_READ_BURST,
+    RATE_LIMIT_READS_PER_SECOND,
+    RETRY_BASE_DELAY_SECONDS,
+    RETRY_MAX_ATTEMPTS,
+    RETRY_MAX_DELAY_SECONDS,
+)
+from .exceptions import (
+    PetLibroAPIError,
+    PetLibroHTTPStatusError,
+    PetLibroInvalidAuth,
+    PetLibroRateLimitedError,
+    PetLibroResponseCodeError,
+)
+from .retry import AUTH, FATAL, NOT_SENT, RETRYABLE, CircuitBreaker, CommandLedger, RetryPolicy, classify
+from .throttle import COMMAND, READ, RateLimiter
 from aiohttp import ClientSession, ClientError
 
 import aiohttp
+import ssl
 import uuid  # To generate unique request IDs
 
 async def make_api_call(session, url, data):
     async with session.post(url, json=data) as response:
         return await response.json()
 
+def create_websession(ssl_context: ssl.SSLContext | bool = True) -> ClientSession:
+    """Create a client session with a connection pool tuned for the PetLibro cloud."""
+    connector = aiohttp.TCPConnector(
+        limit_per_host=HTTP_CONNECTIONS_PER_HOST,
+        keepalive_timeout=HTTP_KEEPALIVE_SECONDS,
+        ttl_dns_cache=HTTP_DNS_CACHE_SECONDS,
+        ssl=ssl_context,
+    )
+    timeout = aiohttp.ClientTimeout(total=HTTP_REQUEST_TIMEOUT_SECONDS, connect=HTTP_CONNECT_TIMEOUT_SECONDS)
+    return ClientSession(connector=connector, timeout=timeout)
+
+def new_request_id() -> str:
+    """Generate the requestId identifying one logical command across all of its retries."""
+    return uuid.uuid4().hex
+
 JSON: TypeAlias = dict[str, "JSON"] | list["JSON"] | str | int | float | bool | None
-_LOGGER = getLogger(__name__)
+_LOGGER = get_logger(__name__)
+
+# Fraction of the observed token lifetime after which the token is renewed ahead of time
+TOKEN_REFRESH_MARGIN = 0.9
+# Growth of the lifetime estimate each time a token is replaced ahead of time without ever being
+# rejected, so one early rejection (a revoke, clock skew) does not shorten every later token
+TOKEN_LIFETIME_GROWTH = 2
+
+# Endpoints that only read data; everything else is throttled with the command budget
+READ_PATHS = frozenset({
+    "/device/device/list",
+    "/device/device/baseInfo",
+    "/device/device/realInfo",
+    "/device/setting/getAttributeSetting",
+    "/device/data/grainStatus",
+    "/device/feedingPlan/todayNew",
+    "/device/feedingPlanTemplate/list",
+    "/device/wetFeedingPlan/wetListV3",
+})
+
+class _Flight:
+    """A request on the wire and the number of callers waiting for it."""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task) -> None:
+        self.task = task
+        self.waiters = 0
+
 
 class PetLibroSession:
     """PetLibro AIOHTTP session"""
     
-    def __init__(self, base_url: str, websession: ClientSession, email: str, password: str, region: str, token: str | None = None):
+    def __init__(self, base_url: str, websession: ClientSession | None, email: str, password: str, region: str, token: str | None = None,
+                 rate_limiter: RateLimiter | None = None, retry_policy: RetryPolicy | None = None,
+                 circuit_breaker: CircuitBreaker | None = None, ssl_context: ssl.SSLContext | bool = True):
         self.base_url = base_url
-        self.websession = websession
+        self.owns_websession = websession is None  # Only a session created here is closed here
+        self.websession = websession if websession is not None else create_websession(ssl_context)
         self.token = token
         self.email = email
         self.password = password
@@ -42,6 +126,66 @@ class PetLibroSession:
             "timezone": "America/Chicago",
             "version": "1.3.45",
         }
+        self.rate_limiter = rate_limiter or RateLimiter(
+            RATE_LIMIT_READS_PER_SECOND,
+            RATE_LIMIT_READ_BURST,
+            RATE_LIMIT_COMMANDS_PER_SECOND,
+            RATE_LIMIT_COMMAND_BURST,
+            RATE_LIMIT_DEFAULT_RETRY_AFTER_SECONDS,
+        )
+        self.retry_policy = retry_policy or RetryPolicy(
+            RETRY_MAX_ATTEMPTS, RETRY_BASE_DELAY_SECONDS, RETRY_MAX_DELAY_SECONDS
+        )
+        self.circuit_breaker = circuit_breaker or CircuitBreaker(
+            CIRCUIT_BREAKER_FAILURE_THRESHOLD, CIRCUIT_BREAKER_RESET_SECONDS
+        )
+        self.command_ledger = CommandLedger(COMMAND_LEDGER_TTL_SECONDS)
+        self._inflight: Dict[bytes, _Flight] = {}  # Requests currently on the wire, by request key
+        self._login_task: asyncio.Task | None = None  # Login shared by every request waiting for a new token
+        self._token_issued_at: float | None = None  # Unknown for a token restored from the config entry
+        self._token_lifetime: float | None = None  # Lifetime estimated from the API answering 1009
+        self._token_was_rejected = False  # Whether the API rejected the current token
+
+    def set_token(self, token: str) -> None:
+        """Use a freshly issued token."""
+        if self._token_lifetime is not None and self._token_issued_at is not None and not self._token_was_rejected:
+            # The previous token was replaced ahead of time and never rejected, it may have lived longer
+            self._token_lifetime *= TOKEN_LIFETIME_GROWTH
+            _LOGGER.debug("Raising the estimated token lifetime to %.0f seconds", self._token_lifetime)
+        self.token = token
+        self._token_issued_at = monotonic()
+        self._token_was_rejected = False
+
+    def _token_expiring(self) -> bool:
+        """Return True if the token is about to reach its observed lifetime."""
+        if self.token is None or self._token_issued_at is None or self._token_lifetime is None:
+            return False
+        return monotonic() - self._token_issued_at >= self._token_lifetime * TOKEN_REFRESH_MARGIN
+
+    def _token_rejected(self, token: str | None) -> None:
+        """Learn the token lifetime from the API rejecting a token we issued."""
+        if token is None or token != self.token or self._token_issued_at is None or self._token_was_rejected:
+            return
+        self._token_was_rejected = True
+        self._token_lifetime = monotonic() - self._token_issued_at
+        _LOGGER.debug("Observed token lifetime of %.0f seconds", self._token_lifetime)
+
+    async def warm_up(self, connections: int = HTTP_WARM_CONNECTIONS) -> None:
+        """Open pooled connections to the API ahead of the first poll."""
+
+        async def connect() -> None:
+            try:
+                async with self.websession.head(self.base_url, allow_redirects=False):
+                    pass
+            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+                _LOGGER.debug("Warming up a connection to %s failed: %s", self.base_url, err)
+
+        await asyncio.gather(*(connect() for _ in range(connections)))
+
+    async def close(self) -> None:
+        """Close the client session if it is owned by this session."""
+        if self.owns_websession and not self.websession.closed:
+            await self.websession.close()
 
     async def post(self, path: str, **kwargs: Any) -> JSON:
         """POST method for PetLibro API."""
@@ -55,67 +199,163 @@ class PetLibroSession:
         kwargs["json"] = json_data
         return await self.request("POST", path, **kwargs)
 
+    @staticmethod
+    def _request_key(method: str, url: str, kwargs: Dict[str, Any]) -> bytes:
+        """Build the key identifying identical requests (same method, path and JSON body)."""
+        return b"%s %s %s" % (method.encode(), url.encode(), codec.dumps_sorted(kwargs.get("json")))
+
     async def request(self, method: str, url: str, **kwargs: Any) -> JSON:
-        """Make a request."""
-        joined_url = urljoin(self.base_url, url)
-        _LOGGER.debug(f"Making {method} request to {joined_url}")
+        """Make a request, sharing the result with identical requests already in flight.
 
-        if "headers" not in kwargs:
-            kwargs["headers"] = {}
+        The request runs in its own task that every caller awaits through a shield, so a cancelled
+        caller only stops waiting itself. The request is cancelled once no caller waits for it anymore.
+        """
+        key = self._request_key(method, url, kwargs)
+
+        if (flight := self._inflight.get(key)) is not None:
+            _LOGGER.debug("Joining in-flight %s request to %s", method, url)
+        else:
+            flight = self._inflight[key] = _Flight(
+                asyncio.get_running_loop().create_task(self._request(method, url, **kwargs))
+            )
+            flight.task.add_done_callback(
+                lambda _: self._inflight.pop(key) if self._inflight.get(key) is flight else None
+            )
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if not flight.waiters and not flight.task.done():
+                flight.task.cancel()  # The last caller gave up waiting
+
+    async def _request(self, method: str, url: str, **kwargs: Any) -> JSON:
+        """Make a request, retrying it as the retry policy and circuit breaker allow."""
+        is_read = url in READ_PATHS
+        # The API runs a command with a requestId only once, so it is as safe to resend as a read
+        request_id = (kwargs.get("json") or {}).get("requestId")
+        if request_id is not None and (entry := self.command_ledger.get(request_id)) and entry.succeeded:
+            _LOGGER.debug("Command %s already succeeded, not sending it again", request_id)
+            return entry.result
+        attempt = 1
+        logged_in = False
+
+        while True:
+            if self._token_expiring():
+                _LOGGER.debug("Token is about to expire, logging in ahead of time")
+                await self.re_login()
+            token = self.token
+
+            # Only now, so a failed or cancelled login cannot hold the trial slot of a half-open breaker
+            self.circuit_breaker.before_request()
+
+            try:
+                result = await self._send(method, url, token, **kwargs)
+            except asyncio.CancelledError:
+                self.circuit_breaker.record_cancelled()
+                raise
+            except Exception as err:
+                error_class = classify(err)
+
+                if error_class == AUTH and not logged_in:
+                    self.circuit_breaker.record_success()
+                    self._token_rejected(token)
+                    if self.token is None or self.token == token:
+                        _LOGGER.warning("NOT_YET_LOGIN error occurred for %s. Trying re-login.", url)
+                        await self.re_login()
+                    # Otherwise another request already logged in again while this one was on the wire
+                    logged_in = True
+                    continue
+
+                if error_class != RETRYABLE:
+                    self.circuit_breaker.record_success()
+                    if request_id is not None:
+                        self.command_ledger.record(request_id, False)
+                    raise
+
+                self.circuit_breaker.record_failure()
+                # Other commands are only resent when they certainly never reached the API
+                if attempt >= self.retry_policy.max_attempts or not (
+                        is_read or request_id is not None or isinstance(err, NOT_SENT)):
+                    if request_id is not None:
+                        self.command_ledger.record(request_id, False)
+                    raise
+
+                delay = self.retry_policy.delay(attempt, err)
+                _LOGGER.debug("Request to %s failed (%s), retry %d in %.2f seconds", url, err, attempt, delay)
+                await asyncio.sleep(delay)
+                attempt += 1
+            else:
+                self.circuit_breaker.record_success()
+                if request_id is not None:
+                    self.command_ledger.record(request_id, True, result)
+                return result
+
+    async def _send(self, method: str, url: str, token: str | None, **kwargs: Any) -> JSON:
+        """Send a single request and return its data, raising on any kind of failure."""
+        kind = READ if url in READ_PATHS else COMMAND
+        joined_url = urljoin(self.base_url, url)
+        _LOGGER.debug("Making %s request to %s", method, joined_url)
 
         # Add default headers
+        kwargs = dict(kwargs)  # Keep the caller's kwargs intact for retries
         headers = self.headers.copy()
-        headers.update(kwargs["headers"].copy())
+        headers.update(kwargs.get("headers", {}))
         kwargs["headers"] = headers
 
+        # Encode the body ourselves, with the fast codec
+        if "json" in kwargs:
+            kwargs["data"] = codec.dumps(kwargs.pop("json"))
+
         # Set Content-Type to JSON explicitly
         kwargs["headers"]["Content-Type"] = "application/json"
 
-        if self.token is not None:
-            kwargs["headers"]["token"] = self.token
-            _LOGGER.debug(f"Using token: {self.token}")
+        if token is not None:
+            kwargs["headers"]["token"] = token
+            _LOGGER.debug("Using token: %s", Secret(token))
         else:
             _LOGGER.warning("No token available for request. Attempting to log in...")
 
         # Send the request
+        await self.rate_limiter.acquire(kind)
         async with self.websession.request(method, joined_url, **kwargs) as resp:
-            _LOGGER.debug(f"Received response status: {resp.status}")
-            try:
-                data = await resp.json()
-            except Exception as e:
-                raise PetLibroAPIError(f"Error parsing response JSON: {e}")
-
-            _LOGGER.debug(f"Response data: {data}")
+            _LOGGER.debug("Received response status: %s", resp.status)
+            if resp.status == 429:
+                retry_after = self.rate_limiter.defer(resp.headers.get("Retry-After"))
+                raise PetLibroRateLimitedError(f"Rate limited on {url}", retry_after)
 
             if resp.status != 200:
-                raise PetLibroAPIError(f"Request failed with status: {resp.status}")
+                raise PetLibroHTTPStatusError(f"Request failed with status: {resp.status}", resp.status)
 
-            if data.get("code") == 1009:  # NOT_YET_LOGIN error code
-                _LOGGER.warning(f"NOT_YET_LOGIN error occurred for {joined_url}. Trying re-login.")
-                # Trigger a re-login and get the new token
-                new_token = await self.re_login()
-                kwargs["headers"]["token"] = new_token
-                _LOGGER.debug(f"Retrying request with new token: {new_token}")
+            raw = await resp.read()
 
-                # Retry the request with the new token
-                async with self.websession.request(method, joined_url, **kwargs) as retry_resp:
-                    retry_data = await retry_resp.json()
-                    _LOGGER.debug(f"Retry response: {retry_data}")
-                    return retry_data.get("data")
+        try:
+            data = codec.loads(raw)
+        except ValueError as e:
+            raise PetLibroAPIError(f"Error parsing response JSON: {e}")
+
+        _LOGGER.debug("Response data: %s", Payload(data))
 
-            if data.get("code") != 0:
-                raise PetLibroAPIError(f"Code: {data.get('code')}, Message: {data.get('msg')}")
+        if data.get("code") != 0:
+            raise PetLibroResponseCodeError(f"Code: {data.get('code')}, Message: {data.get('msg')}", data.get("code"))
 
-            return data.get("data")
+        return data.get("data")
 
     async def re_login(self) -> str:
+        """Re-login to get a new token, sharing a single login between all concurrent callers."""
+        if self._login_task is None or self._login_task.done():
+            self._login_task = asyncio.get_running_loop().create_task(self._re_login())
+        return await asyncio.shield(self._login_task)
+
+    async def _re_login(self) -> str:
         """Re-login to get a new token when the old one expires."""
         try:
-            _LOGGER.debug(f"Attempting re-login with email: {self.email} and region: {self.region}")
+            _LOGGER.debug("Attempting re-login with email: %s and region: %s", self.email, self.region)
 
             async with self.websession.post(
                 urljoin(self.base_url, "/member/auth/login"),
-                json={
+                data=codec.dumps({
                     "appId": PetLibroAPI.APPID,
                     "appSn": PetLibroAPI.APPSN,
                     "country": self.region,
@@ -126,27 +366,27 @@ class PetLibroSession:
                     "timezone": self.headers["timezone"],
                     "thirdId": None,
                     "type": None
-                },
-                headers=self.headers
+                }),
+                headers={**self.headers, "Content-Type": "application/json"}
             ) as response:
-                _LOGGER.debug(f"Re-login response status: {response.status}")
+                _LOGGER.debug("Re-login response status: %s", response.status)
 
                 if response.status != 200:
                     raise PetLibroAPIError(f"Failed to login, status: {response.status}")
 
-                response_data = await response.json()
-                _LOGGER.debug(f"Re-login response data: {response_data}")
+                response_data = codec.loads(await response.read())
+                _LOGGER.debug("Re-login response data: %s", Payload(response_data))
 
                 if not isinstance(response_data, dict) or "token" not in response_data.get("data", {}):
                     raise PetLibroAPIError("Token not found during login.")
 
                 # Get the new token from response data
                 new_token = response_data["data"]["token"]
-                self.token = new_token  # Update the session token
+                self.set_token(new_token)  # Update the session token
 
                 # Save the new token in the config entry
                 if hasattr(self, 'api') and self.api.hass and self.api.config_entry:
-                    _LOGGER.debug(f"Saving new token to config entry: {self.token}")
+                    _LOGGER.debug("Saving new token to config entry: %s", Secret(self.token))
                     self.api.hass.config_entries.async_update_entry(
                         self.api.config_entry,
                         data={**self.api.config_entry.data, "token": self.token}
@@ -155,11 +395,11 @@ class PetLibroSession:
                 return new_token
 
         except aiohttp.ClientError as e:
-            _LOGGER.error(f"Re-login failed due to a client error: {e}")
+            _LOGGER.error("Re-login failed due to a client error: %s", e)
             raise PetLibroAPIError(f"Client error during re-login: {e}")
 
         except Exception as e:
-            _LOGGER.error(f"Re-login attempt failed due to an unexpected error: {e}")
+            _LOGGER.error("Re-login attempt failed due to an unexpected error: %s", e)
             raise PetLibroAPIError(f"Unexpected error during re-login: {e}")
 
 class PetLibroAPI:
@@ -170,10 +410,52 @@ class PetLibroAPI:
     API_URLS = {
         "US": "https://api.us.petlibro.com"
     }
+    # Device read endpoints, by the name their data is stored under
+    DEVICE_ENDPOINTS: Dict[str, str] = {
+        "baseInfo": "/device/device/baseInfo",
+        "realInfo": "/device/device/realInfo",
+        "getAttributeSetting": "/device/setting/getAttributeSetting",
+        "grainStatus": "/device/data/grainStatus",
+        "feedingPlanTodayNew": "/device/feedingPlan/todayNew",
+        "feedingPlanTemplates": "/device/feedingPlanTemplate/list",
+        "wetFeedingPlan": "/device/wetFeedingPlan/wetListV3",
+    }
+    # DEVICE_ENDPOINTS every model answers; endpoint support is only learned for the others
+    CORE_ENDPOINTS: tuple[str, ...] = ("baseInfo", "realInfo")
+    # DEVICE_ENDPOINTS whose data each command changes, by method; other commands affect every endpoint
+    COMMAND_ENDPOINTS: Dict[str, tuple[str, ...]] = {
+        "set_feeding_plan": ("realInfo", "feedingPlanTodayNew"),
+        "set_child_lock": ("realInfo",),
+        "set_light_enable": ("realInfo",),
+        "set_light_switch": ("realInfo",),
+        "set_sound_enable": ("realInfo",),
+        "set_desiccant_frequency": ("realInfo",),
+        "set_sound_switch": ("realInfo",),
+        "set_sound_level": ("getAttributeSetting",),
+        "set_manual_feed": ("realInfo", "grainStatus"),
+        "set_desiccant_reset": ("realInfo",),
+        "set_manual_lid_open": ("realInfo",),
+        "set_display_on": ("realInfo",),
+        "set_display_off": ("realInfo",),
+        "set_sound_on": ("realInfo",),
+        "set_sound_off": ("realInfo",),
+    }
+    # Seconds a read stays fresh, and how much longer it may be served while it is refetched in the background
+    CACHE_TTLS: Dict[str, tuple[float, float]] = {
+        "/device/device/baseInfo": (3600, 3600),
+        "/device/device/realInfo": (POLL_BURST_SECONDS, 0),  # Never older than the fastest poll cadence
+        "/device/setting/getAttributeSetting": (300, 300),
+        "/device/data/grainStatus": (30, 0),
+        "/device/feedingPlan/todayNew": (120, 120),
+        "/device/feedingPlanTemplate/list": (3600, 3600),
+        "/device/wetFeedingPlan/wetListV3": (300, 300),
+    }
 
-    def __init__(self, session: ClientSession, time_zone: str, region: str, email: str, password: str, token: str | None = None, config_entry=None, hass=None):
-        """Initialize."""
-        self.session = PetLibroSession(self.API_URLS[region], session, email, password, region, token)
+    def __init__(self, session: ClientSession | None, time_zone: str, region: str, email: str, password: str, token: str | None = None, config_entry=None, hass=None,
+                 rate_limiter: RateLimiter | None = None, ssl_context: ssl.SSLContext | bool = True):
+        """Initialize. Without a client session, a dedicated one tuned for the PetLibro cloud is created."""
+        self.session = PetLibroSession(self.API_URLS[region], session, email, password, region, token, rate_limiter,
+                                       ssl_context=ssl_context)
         self.region = region
         self.time_zone = time_zone
         self.email = email  # Store email for login/re-login
@@ -188,10 +470,11 @@ class PetLibroAPI:
         # Load the saved token if available
         if config_entry and "token" in config_entry.data:
             self.token = config_entry.data["token"]
-            _LOGGER.debug(f"Loaded saved token: {self.token}")
+            _LOGGER.debug("Loaded saved token: %s", Secret(self.token))
 
-        self._last_api_call_times = {}  # To store last call time per device
-        self._cached_responses = {}  # To store cached responses for short periods
+        self._cache = ResponseCache()
+        self._revalidations: Dict[tuple[str, str], asyncio.Task] = {}  # Background refreshes of stale entries
+        self.capabilities = EndpointCapabilities(CAPABILITY_MAX_MISSES, CAPABILITY_RECHECK_SECONDS)
 
     @staticmethod
     def hash_password(password: str) -> str:
@@ -218,92 +501,27 @@ class PetLibroAPI:
             })
 
             if not isinstance(data, dict) or "token" not in data or not isinstance(data["token"], str):
-                _LOGGER.error("No token found during login. Response data: %s", data)
+                _LOGGER.error("No token found during login. Response data: %s", Payload(data))
                 raise PetLibroAPIError("No token found during login.")
 
-            self.session.token = data["token"]
-            _LOGGER.debug(f"Login successful, token: {self.session.token}")
+            self.session.set_token(data["token"])
+            _LOGGER.debug("Login successful, token: %s", Secret(self.session.token))
             return self.session.token
 
         except Exception as e:
-            _LOGGER.error(f"Login failed: {e}")
+            _LOGGER.error("Login failed: %s", e)
             raise PetLibroAPIError(f"Login attempt failed: {e}")
 
-    async def get_device_real_info(self, device_id: str) -> dict:
-        """Fetch real-time information for a device, with caching to prevent frequent requests."""
-        now = datetime.utcnow()
-        last_call_time = self._last_api_call_times.get(f"{device_id}_realInfo")
+    async def warm_up(self) -> None:
+        """Open pooled connections to the API ahead of the first poll."""
+        await self.session.warm_up()
 
-        # If we made the request within the last 10 seconds, return cached response
-        if last_call_time and (now - last_call_time) < timedelta(seconds=10):
-            _LOGGER.debug(f"Skipping realInfo request for {device_id}, using cached response.")
-            return self._cached_responses.get(f"{device_id}_realInfo", {})
-
-        # Otherwise, make the API call and update cache
-        try:
-            response = await self.session.request("POST", "/device/device/realInfo", json={
-                "id": device_id,
-                "deviceSn": device_id
-            })
-
-            # Store the time of the API call and the cached response
-            self._last_api_call_times[f"{device_id}_realInfo"] = now
-            self._cached_responses[f"{device_id}_realInfo"] = response
-
-            return response
-        except Exception as e:
-            _LOGGER.error(f"Error fetching realInfo for device {device_id}: {e}")
-            raise PetLibroAPIError(f"Error fetching getAttributeSetting for device {device_id}: {e}")
-
-    async def get_device_attribute_settings(self, device_id: str) -> dict:
-        """Fetch real-time information for a device, with caching to prevent frequent requests."""
-        now = datetime.utcnow()
-        last_call_time = self._last_api_call_times.get(f"{device_id}_getAttributeSetting")
-
-        # If we made the request within the last 10 seconds, return cached response
-        if last_call_time and (now - last_call_time) < timedelta(seconds=10):
-            _LOGGER.debug(f"Skipping getAttributeSetting request for {device_id}, using cached response.")
-            return self._cached_responses.get(f"{device_id}_getAttributeSetting", {})
-
-        # Otherwise, make the API call and update cache
-        try:
-            response = await self.session.request("POST", "/device/setting/getAttributeSetting", json={
-                "id": device_id,
-            })
-
-            # Store the time of the API call and the cached response
-            self._last_api_call_times[f"{device_id}_getAttributeSetting"] = now
-            self._cached_responses[f"{device_id}_getAttributeSetting"] = response
-
-            return response
-        except Exception as e:
-            _LOGGER.error(f"Error fetching getAttributeSetting for device {device_id}: {e}")
-            raise PetLibroAPIError(f"Error fetching getAttributeSetting for device {device_id}: {e}")
-
-    async def get_device_base_info(self, device_id: str) -> dict:
-        """Fetch real-time information for a device, with caching to prevent frequent requests."""
-        now = datetime.utcnow()
-        last_call_time = self._last_api_call_times.get(f"{device_id}_baseInfo")
-
-        # If we made the request within the last 10 seconds, return cached response
-        if last_call_time and (now - last_call_time) < timedelta(seconds=10):
-            _LOGGER.debug(f"Skipping baseInfo request for {device_id}, using cached response.")
-            return self._cached_responses.get(f"{device_id}_baseInfo", {})
-
-        # Otherwise, make the API call and update cache
-        try:
-            response = await self.session.request("POST", "/device/setting/baseInfo", json={
-                "id": device_id,
-            })
-
-            # Store the time of the API call and the cached response
-            self._last_api_call_times[f"{device_id}_baseInfo"] = now
-            self._cached_responses[f"{device_id}_baseInfo"] = response
-
-            return response
-        except Exception as e:
-            _LOGGER.error(f"Error fetching baseInfo for device {device_id}: {e}")
-            raise PetLibroAPIError(f"Error fetching baseInfo for device {device_id}: {e}")
+    async def close(self) -> None:
+        """Stop background work and close the connections owned by the API."""
+        for task in list(self._revalidations.values()):
+            task.cancel()
+        self._revalidations.clear()
+        await self.session.close()
 
     async def logout(self):
         """Logout of the API and reset the token"""
@@ -322,30 +540,115 @@ class PetLibroAPI:
         return await self.session.post("/device/device/list", json={})  # Ensure JSON is passed here
 
     async def device_base_info(self, serial: str) -> Dict[str, Any]:
-        return await self.session.post_serial("/device/device/baseInfo", serial)
+        return await self._cached_read("/device/device/baseInfo", serial)
 
     async def device_real_info(self, serial: str) -> Dict[str, Any]:
-        return await self.session.post_serial("/device/device/realInfo", serial)
+        return await self._cached_read("/device/device/realInfo", serial)
 
     async def device_attribute_settings(self, serial: str) -> Dict[str, Any]:
-        return await self.session.post_serial("/device/setting/getAttributeSetting", serial)
+        return await self._cached_read("/device/setting/getAttributeSetting", serial)
 
     async def device_grain_status(self, serial: str) -> Dict[str, Any]:
-        return await self.session.post_serial("/device/data/grainStatus", serial)
+        return await self._cached_read("/device/data/grainStatus", serial)
 
     async def device_feeding_plan_today_new(self, serial: str) -> Dict[str, Any]:
-        return await self.session.post_serial("/device/feedingPlan/todayNew", serial)
+        return await self._cached_read("/device/feedingPlan/todayNew", serial)
 
     async def device_feeding_plan_templates(self, serial: str) -> Dict[str, Any]:
-        return await self.session.post_serial("/device/feedingPlanTemplate/list", serial)
+        return await self._cached_read("/device/feedingPlanTemplate/list", serial)
 
     async def device_wet_feeding_plan(self, serial: str) -> Dict[str, Any]:
-        return await self.session.post_serial("/device/wetFeedingPlan/wetListV3", serial)
+        return await self._cached_read("/device/wetFeedingPlan/wetListV3", serial)
+
+    async def device_endpoint(self, serial: str, endpoint: str, profile: str | None = None,
+                              fresh: bool = False) -> Dict[str, Any]:
+        """Read one of the DEVICE_ENDPOINTS of a device.
+
+        Served from the response cache unless ``fresh`` is set, as for scheduled polls, which always
+        reach the API (and refill the cache). With the profile (model and firmware) of the device,
+        whether the API supports the endpoint is recorded in the endpoint capabilities: any answer,
+        even an empty one (e.g. no feeding plan set up), counts as supported, only a refusal does not.
+        """
+        path = self.DEVICE_ENDPOINTS[endpoint]
+        read = self._fetch_and_cache if fresh else self._cached_read
+        if profile is None or endpoint in self.CORE_ENDPOINTS:
+            return await read(path, serial)
+        try:
+            value = await read(path, serial)
+        except (PetLibroResponseCodeError, PetLibroHTTPStatusError) as err:
+            # Only a definite refusal says something about the endpoint, not a network or login problem
+            if classify(err) == FATAL:
+                self._record_capability(profile, endpoint, False)
+            raise
+        self._record_capability(profile, endpoint, True)
+        return value
+
+    def endpoint_supported(self, profile: str | None, endpoint: str) -> bool:
+        """Return False if the endpoint is known to be refused for the device profile."""
+        return profile is None or endpoint in self.CORE_ENDPOINTS or not self.capabilities.should_skip(profile, endpoint)
+
+    def _record_capability(self, profile: str, endpoint: str, supported: bool) -> None:
+        if self.capabilities.record(profile, endpoint, supported):
+            _LOGGER.info(
+                "%s was refused for %s %s times in a row, skipping it for %s seconds",
+                endpoint, profile, self.capabilities.max_misses, self.capabilities.recheck_after
+            )
+
+    async def _cached_read(self, path: str, serial: str) -> Dict[str, Any]:
+        """Read a device endpoint through the response cache."""
+        value, state = self._cache.get(serial, path)
+        if state == FRESH:
+            return value
+        if state == STALE:
+            self._revalidate(path, serial)
+            return value
+        return await self._fetch_and_cache(path, serial)
+
+    async def _fetch_and_cache(self, path: str, serial: str) -> Dict[str, Any]:
+        value = await self.session.post_serial(path, serial)
+        ttl, stale_ttl = self.CACHE_TTLS[path]
+        self._cache.set(serial, path, value, ttl, stale_ttl)
+        return value
+
+    def _revalidate(self, path: str, serial: str) -> None:
+        """Refetch a stale entry in the background, at most once at a time."""
+        key = (serial, path)
+        if key in self._revalidations:
+            return
+
+        async def revalidate() -> None:
+            try:
+                await self._fetch_and_cache(path, serial)
+            except Exception as err:
+                _LOGGER.debug("Background refresh of %s for %s failed: %s", path, serial, err)
+            finally:
+                self._revalidations.pop(key, None)
+
+        self._revalidations[key] = asyncio.get_running_loop().create_task(revalidate())
+
+    def invalidate_device_cache(self, serial: str, endpoints: Iterable[str] | None = None) -> None:
+        """Forget the cached reads of some (or all) DEVICE_ENDPOINTS of a device, e.g. after sending it a command."""
+        if endpoints is None:
+            self._cache.invalidate(serial)
+        else:
+            self._cache.invalidate(serial, tuple(self.DEVICE_ENDPOINTS[endpoint] for endpoint in endpoints))
+
+    @property
+    def cache_stats(self) -> Dict[str, int]:
+        """Return the response cache counters."""
+        return self._cache.stats
+
+    async def _post_command(self, command: str, path: str, serial: str, **kwargs: Any) -> JSON:
+        """Send a command and drop the cached reads of the endpoints it affects."""
+        try:
+            return await self.session.post(path, **kwargs)
+        finally:
+            self.invalidate_device_cache(serial, self.COMMAND_ENDPOINTS.get(command))
 
     # Support for new switch functions
     async def set_feeding_plan(self, serial: str, enable: bool):
         """Set the feeding plan on/off."""
-        await self.session.post("/device/setting/updateFeedingPlanSwitch", json={
+        await self._post_command("set_feeding_plan", "/device/setting/updateFeedingPlanSwitch", serial, json={
             "deviceSn": serial,
             "enable": enable
         })
@@ -353,34 +656,34 @@ class PetLibroAPI:
     async def set_child_lock(self, serial: str, enable: bool):
         """Enable or disable the child lock functionality."""
         try:
-            response = await self.session.post(
-                "/device/setting/updateChildLockSwitch", 
+            response = await self._post_command(
+                "set_child_lock", "/device/setting/updateChildLockSwitch", serial,
                 json={"deviceSn": serial, "enable": enable}
             )
 
-            _LOGGER.debug(f"Child lock response status: {response.status}")
-            _LOGGER.debug(f"Child lock response data: {await response.text()}")
+            _LOGGER.debug("Child lock response status: %s", response.status)
+            _LOGGER.debug("Child lock response data: %s", await response.text())
 
             response.raise_for_status()
         except aiohttp.ClientError as err:
-            _LOGGER.error(f"Failed to set child lock for device {serial}: {err}")
+            _LOGGER.error("Failed to set child lock for device %s: %s", serial, err)
             raise PetLibroAPIError(f"Error setting child lock: {err}")
 
     async def set_light_enable(self, serial: str, enable: bool):
         """Enable or disable the light functionality with error handling."""
         try:
-            response = await self.session.post(
-                "/device/setting/updateLightEnableSwitch",
+            response = await self._post_command(
+                "set_light_enable", "/device/setting/updateLightEnableSwitch", serial,
                 json={"deviceSn": serial, "enable": enable}
             )
             response.raise_for_status()
         except aiohttp.ClientError as err:
-            _LOGGER.error(f"Failed to set light enable for device {serial}: {err}")
+            _LOGGER.error("Failed to set light enable for device %s: %s", serial, err)
             raise PetLibroAPIError(f"Error setting light enable: {err}")
 
     async def set_light_switch(self, serial: str, enable: bool):
         """Turn the light on or off."""
-        await self.session.post("/device/setting/updateLightSwitch", json={
+        await self._post_command("set_light_switch", "/device/setting/updateLightSwitch", serial, json={
             "deviceSn": serial,
             "enable": enable
         })
@@ -388,21 +691,20 @@ class PetLibroAPI:
     async def set_sound_enable(self, serial: str, enable: bool):
         """Enable or disable the sound functionality."""
         try:
-            response = await self.session.post("/device/setting/updateSoundEnableSwitch", json={"deviceSn": serial, "enable": enable}
+            response = await self._post_command("set_sound_enable", "/device/setting/updateSoundEnableSwitch", serial, json={"deviceSn": serial, "enable": enable}
             )
             response.raise_for_status()
         except aiohttp.ClientError as err:
-            _LOGGER.error(f"Failed to set sound enable for device {serial}: {err}")
+            _LOGGER.error("Failed to set sound enable for device %s: %s", serial, err)
             raise PetLibroAPIError(f"Error setting sound enable: {err}")
 
-    async def set_desiccant_frequency(self, serial: str, value: float) -> JSON:
-        """Set the desiccant frequency."""
-        _LOGGER.debug(f"Setting desiccant frequency: serial={serial}, value={value}")
+    async def set_desiccant_frequency(self, serial: str, value: float, request_id: str | None = None) -> JSON:
+        """Set the desiccant frequency. Pass the same request_id to retry the same command."""
+        _LOGGER.debug("Setting desiccant frequency: serial=%s, value=%s", serial, value)
         try:
-            # Generate a dynamic request ID for the manual feeding
-            request_id = str(uuid.uuid4()).replace("-", "")
+            request_id = request_id or new_request_id()
 
-            response = await self.session.post("/device/device/maintenanceFrequencySetting", json={
+            response = await self._post_command("set_desiccant_frequency", "/device/device/maintenanceFrequencySetting", serial, json={
                     "deviceSn": serial,
                     "key": "DESICCANT",  # Try and find a way to make this dynamic as different devices may have a different key. if too difficult we could just duplicate this block for each key type.
                     "frequency": value,
@@ -410,43 +712,43 @@ class PetLibroAPI:
                     "timeout": 5000
                 },
             )
-            _LOGGER.debug(f"Desiccant frequency set successfully: {response}")
+            _LOGGER.debug("Desiccant frequency set successfully: %s", Payload(response))
             return response
         except Exception as e:
-            _LOGGER.error(f"Failed to set desiccant frequency for device {serial}: {e}")
+            _LOGGER.error("Failed to set desiccant frequency for device %s: %s", serial, e)
             raise
 
     async def set_sound_switch(self, serial: str, enable: bool):
         """Turn the sound on or off."""
-        await self.session.post("/device/setting/updateSoundSwitch", json={
+        await self._post_command("set_sound_switch", "/device/setting/updateSoundSwitch", serial, json={
             "deviceSn": serial,
             "enable": enable
         })
 
     async def set_sound_level(self, serial: str, value: float):
         """Set the sound level."""
-        _LOGGER.debug(f"Setting sound level: serial={serial}, value={value}")
+        _LOGGER.debug("Setting sound level: serial=%s, value=%s", serial, value)
         try:
-            response = await self.session.post("/device/setting/updateVolumeSetting", json={
+            response = await self._post_command("set_sound_level", "/device/setting/updateVolumeSetting", serial, json={
                 "deviceSn": serial,
                 "volume": value
             })
-            _LOGGER.debug(f"Sound level set successfully: {response}")
+            _LOGGER.debug("Sound level set successfully: %s", Payload(response))
             return response
         except Exception as e:
-            _LOGGER.error(f"Failed to set sound level for device {serial}: {e}")
+            _LOGGER.error("Failed to set sound level for device %s: %s", serial, e)
             raise
 
-    async def set_manual_feed(self, serial: str) -> JSON:
-        """Trigger manual feeding for a specific device."""
-        _LOGGER.debug(f"Triggering manual feeding for device with serial: {serial}")
+    async def set_manual_feed(self, serial: str, request_id: str | None = None) -> JSON:
+        """Trigger manual feeding for a specific device. Pass the same request_id to retry the same feed."""
+        _LOGGER.debug("Triggering manual feeding for device with serial: %s", serial)
         
         try:
-            # Generate a dynamic request ID for the manual feeding
-            request_id = str(uuid.uuid4()).replace("-", "")
+            # One request ID per feed, reused by every retry so the feeder never dispenses twice
+            request_id = request_id or new_request_id()
 
             # Send the POST request to trigger manual feeding
-            response = await self.session.post("/device/device/manualFeeding", json={
+            response = await self._post_command("set_manual_feed", "/device/device/manualFeeding", serial, json={
                 "deviceSn": serial,
                 "grainNum": 1,  # Number of grains dispensed
                 "requestId": request_id  # Use dynamic request ID
@@ -454,12 +756,12 @@ class PetLibroAPI:
 
             # Check if response is already parsed (since response is an integer here)
             if isinstance(response, int):
-                _LOGGER.debug(f"Manual feeding successful, returned code: {response}")
+                _LOGGER.debug("Manual feeding successful, returned code: %s", response)
                 return response
             
             # If response is a dictionary (JSON), handle it
             response_data = await response.json()
-            _LOGGER.debug(f"Manual feeding response data: {response_data}")
+            _LOGGER.debug("Manual feeding response data: %s", Payload(response_data))
             
             # Check if the response indicates success
             if response.status != 200 or response_data.get("code") != 0:
@@ -468,20 +770,19 @@ class PetLibroAPI:
             return response_data
 
         except aiohttp.ClientError as err:
-            _LOGGER.error(f"Failed to trigger manual feeding for device {serial}: {err}")
+            _LOGGER.error("Failed to trigger manual feeding for device %s: %s", serial, err)
             raise PetLibroAPIError(f"Error triggering manual feeding: {err}")
 
 
-    async def set_desiccant_reset(self, serial: str) -> JSON:
-        """Trigger desiccant reset for a specific device."""
-        _LOGGER.debug(f"Triggering desiccant reset for device with serial: {serial}")
+    async def set_desiccant_reset(self, serial: str, request_id: str | None = None) -> JSON:
+        """Trigger desiccant reset for a specific device. Pass the same request_id to retry the same reset."""
+        _LOGGER.debug("Triggering desiccant reset for device with serial: %s", serial)
         
         try:
-            # Generate a dynamic request ID for the manual feeding
-            request_id = str(uuid.uuid4()).replace("-", "")
+            request_id = request_id or new_request_id()
 
-            # Send the POST request to trigger manual feeding
-            response = await self.session.post("/device/device/desiccantReset", json={
+            # Send the POST request to trigger the desiccant reset
+            response = await self._post_command("set_desiccant_reset", "/device/device/desiccantReset", serial, json={
                 "deviceSn": serial,
                 "requestId": request_id,  # Use dynamic request ID
                 "timeout": 5000
@@ -489,12 +790,12 @@ class PetLibroAPI:
 
             # Check if response is already parsed (since response is an integer here)
             if isinstance(response, int):
-                _LOGGER.debug(f"Desiccant reset set successfully, returned code: {response}")
+                _LOGGER.debug("Desiccant reset set successfully, returned code: %s", response)
                 return response
             
             # If response is a dictionary (JSON), handle it
             response_data = await response.json()
-            _LOGGER.debug(f"Desiccant reset response data: {response_data}")
+            _LOGGER.debug("Desiccant reset response data: %s", Payload(response_data))
             
             # Check if the response indicates success
             if response.status != 200 or response_data.get("code") != 0:
@@ -503,12 +804,12 @@ class PetLibroAPI:
             return response_data
 
         except aiohttp.ClientError as err:
-            _LOGGER.error(f"Failed to trigger desiccant reset for device {serial}: {err}")
+            _LOGGER.error("Failed to trigger desiccant reset for device %s: %s", serial, err)
             raise PetLibroAPIError(f"Error triggering desiccant reset: {err}")
 
     async def set_manual_lid_open(self, serial: str):
         """Trigger manual lid opening for a specific device."""
-        await self.session.post("/device/device/doorStateChange", json={
+        await self._post_command("set_manual_lid_open", "/device/device/doorStateChange", serial, json={
             "deviceSn": serial,
             "barnDoorState": True,
             "timeout": 8000
@@ -516,7 +817,7 @@ class PetLibroAPI:
     
     async def set_display_on(self, serial: str):
         """Trigger turn display on"""
-        await self.session.post("/device/setting/updateDisplayMatrixSetting", json={
+        await self._post_command("set_display_on", "/device/setting/updateDisplayMatrixSetting", serial, json={
             "deviceSn": serial,
             "screenDisplayAgingType": 1,
             "screenDisplayStartTime": None,
@@ -526,7 +827,7 @@ class PetLibroAPI:
     
     async def set_display_off(self, serial: str):
         """Trigger turn display off"""
-        await self.session.post("/device/setting/updateDisplayMatrixSetting", json={
+        await self._post_command("set_display_off", "/device/setting/updateDisplayMatrixSetting", serial, json={
             "deviceSn": serial,
             "screenDisplayAgingType": 1,
             "screenDisplayStartTime": None,
@@ -536,7 +837,7 @@ class PetLibroAPI:
 
     async def set_sound_on(self, serial: str):
         """Trigger turn sound on"""
-        await self.session.post("/device/setting/updateSoundSetting", json={
+        await self._post_command("set_sound_on", "/device/setting/updateSoundSetting", serial, json={
             "deviceSn": serial,
             "soundSwitch": True,
             "soundAgingType": 1,
@@ -546,7 +847,7 @@ class PetLibroAPI:
     
     async def set_sound_off(self, serial: str):
         """Trigger turn sound off"""
-        await self.session.post("/device/setting/updateSoundSetting", json={
+        await self._post_command("set_sound_off", "/device/setting/updateSoundSetting", serial, json={
             "deviceSn": serial,
             "soundSwitch": False,
             "soundAgingType": 1,
@@ -558,7 +859,7 @@ class PetLibroAPI:
 class PetLibroDataCoordinator(DataUpdateCoordinator):
     def __init__(self, hass, api):
         self.api = api
-        super().__init__(hass, _LOGGER, name="PetLibroData", update_interval=timedelta(minutes=1))
+        super().__init__(hass, _LOGGER.logger, name="PetLibroData", update_interval=timedelta(minutes=1))
 
     async def _async_update_data(self):
         # Fetch data from the API once per update cycle
@@ -10,7 +10,7 @@ from dataclasses import dataclass
 from collections.abc import Callable
 from functools import cached_property
 from typing import Optional
-import logging
+from .log import get_logger
 from .const import DOMAIN
 from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
@@ -23,7 +23,7 @@ from homeassistant.config_entries import ConfigEntry  # Added ConfigEntry import
 from .hub import PetLibroHub  # Adjust the import path as necessary
 
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 from .devices import Device
 from .devices.device import Device
@@ -81,9 +81,9 @@ class PetLibroBinarySensorEntity(PetLibroEntity[_DeviceT], BinarySensorEntity):
         elif last_state != state:
             # Log state changes: log online with INFO and offline with WARNING
             if state:
-                _LOGGER.info(f"Device {self.device.name} is online.")
+                _LOGGER.info("Device %s is online.", self.device.name)
             else:
-                _LOGGER.warning(f"Device {self.device.name} is offline.")
+                _LOGGER.warning("Device %s is offline.", self.device.name)
 
         # Store the last state for future comparisons
         self._last_state = state
@@ -97,6 +97,7 @@ DEVICE_BINARY_SENSOR_MAP: dict[type[Device], list[PetLibroBinarySensorEntityDesc
     AirSmartFeeder: [
         PetLibroBinarySensorEntityDescription[AirSmartFeeder](
             key="food_dispenser_state",
+            fields=frozenset({"realInfo"}),
             translation_key="food_dispenser_state",
             icon="mdi:bowl-outline",
             device_class=BinarySensorDeviceClass.PROBLEM,
@@ -105,6 +106,7 @@ DEVICE_BINARY_SENSOR_MAP: dict[type[Device], list[PetLibroBinarySensorEntityDesc
         ),
         PetLibroBinarySensorEntityDescription[AirSmartFeeder](
             key="food_low",
+            fields=frozenset({"realInfo"}),
             translation_key="food_low",
             icon="mdi:bowl-mix-outline",
             device_class=BinarySensorDeviceClass.PROBLEM,
@@ -113,6 +115,7 @@ DEVICE_BINARY_SENSOR_MAP: dict[type[Device], list[PetLibroBinarySensorEntityDesc
         ),
         PetLibroBinarySensorEntityDescription[AirSmartFeeder](
             key="online",
+            fields=frozenset({"realInfo"}),
             translation_key="online",
             icon="mdi:wifi",
             device_class=BinarySensorDeviceClass.CONNECTIVITY,
@@ -121,6 +124,7 @@ DEVICE_BINARY_SENSOR_MAP: dict[type[Device], list[PetLibroBinarySensorEntityDesc
         ),
         PetLibroBinarySensorEntityDescription[AirSmartFeeder](
             key="whether_in_sleep_mode",
+            fields=frozenset({"realInfo"}),
             translation_key="whether_in_sleep_mode",
             icon="mdi:sleep",
             device_class=BinarySensorDeviceClass.POWER,
@@ -129,6 +133,7 @@ DEVICE_BINARY_SENSOR_MAP: dict[type[Device], list[PetLibroBinarySensorEntityDesc
         ),
         PetLibroBinarySensorEntityDescription[AirSmartFeeder](
             key="enable_low_battery_notice",
+            fields=frozenset({"realInfo"}),
             translation_key="enable_low_battery_notice",
             icon="mdi:battery-alert",
             device_class=BinarySensorDeviceClass.BATTERY,
@@ -139,6 +144,7 @@ DEVICE_BINARY_SENSOR_MAP: dict[type[Device], list[PetLibroBinarySensorEntityDesc
     GranarySmartFeeder: [
         PetLibroBinarySensorEntityDescription[GranarySmartFeeder](
             key="food_dispenser_state",
+            fields=frozenset({"realInfo"}),
             translation_key="food_dispenser_state",
             icon="mdi:bowl-outline",
             device_class=BinarySensorDeviceClass.PROBLEM,
@@ -147,6 +153,7 @@ DEVICE_BINARY_SENSOR_MAP: dict[type[Device], list[PetLibroBinarySensorEntityDesc
         ),
         PetLibroBinarySensorEntityDescription[GranarySmartFeeder](
             key="food_low",
+            fields=frozenset({"realInfo"}),
             translation_key="food_low",
             icon="mdi:bowl-mix-outline",
             device_class=BinarySensorDeviceClass.PROBLEM,
@@ -155,6 +162,7 @@ DEVICE_BINARY_SENSOR_MAP: dict[type[Device], list[PetLibroBinarySensorEntityDesc
         ),
         PetLibroBinarySensorEntityDescription[GranarySmartFeeder](
             key="online",
+            fields=frozenset({"realInfo"}),
             translation_key="online",
             icon="mdi:wifi",
             device_class=BinarySensorDeviceClass.CONNECTIVITY,
@@ -163,6 +171,7 @@ DEVICE_BINARY_SENSOR_MAP: dict[type[Device], list[PetLibroBinarySensorEntityDesc
         ),
         PetLibroBinarySensorEntityDescription[GranarySmartFeeder](
             key="whether_in_sleep_mode",
+            fields=frozenset({"realInfo"}),
             translation_key="whether_in_sleep_mode",
             icon="mdi:sleep",
             device_class=BinarySensorDeviceClass.POWER,
@@ -171,6 +180,7 @@ DEVICE_BINARY_SENSOR_MAP: dict[type[Device], list[PetLibroBinarySensorEntityDesc
         ),
         PetLibroBinarySensorEntityDescription[GranarySmartFeeder](
             key="enable_low_battery_notice",
+            fields=frozenset({"realInfo"}),
             translation_key="enable_low_battery_notice",
             icon="mdi:battery-alert",
             device_class=BinarySensorDeviceClass.BATTERY,
@@ -181,6 +191,7 @@ DEVICE_BINARY_SENSOR_MAP: dict[type[Device], list[PetLibroBinarySensorEntityDesc
     GranarySmartCameraFeeder: [
         PetLibroBinarySensorEntityDescription[GranarySmartCameraFeeder](
             key="food_dispenser_state",
+            fields=frozenset({"realInfo"}),
             translation_key="food_dispenser_state",
             icon="mdi:bowl-outline",
             device_class=BinarySensorDeviceClass.PROBLEM,
@@ -189,6 +200,7 @@ DEVICE_BINARY_SENSOR_MAP: dict[type[Device], list[PetLibroBinarySensorEntityDesc
         ),
         PetLibroBinarySensorEntityDescription[GranarySmartCameraFeeder](
             key="food_low",
+            fields=frozenset({"realInfo"}),
             translation_key="food_low",
             icon="mdi:bowl-mix-outline",
             device_class=BinarySensorDeviceClass.PROBLEM,
@@ -197,6 +209,7 @@ DEVICE_BINARY_SENSOR_MAP: dict[type[Device], list[PetLibroBinarySensorEntityDesc
         ),
         PetLibroBinarySensorEntityDescription[GranarySmartCameraFeeder](
             key="online",
+            fields=frozenset({"realInfo"}),
             translation_key="online",
             icon="mdi:wifi",
             device_class=BinarySensorDeviceClass.CONNECTIVITY,
@@ -205,6 +218,7 @@ DEVICE_BINARY_SENSOR_MAP: dict[type[Device], list[PetLibroBinarySensorEntityDesc
         ),
         PetLibroBinarySensorEntityDescription[GranarySmartCameraFeeder](
             key="whether_in_sleep_mode",
+            fields=frozenset({"realInfo"}),
             translation_key="whether_in_sleep_mode",
             icon="mdi:sleep",
             device_class=BinarySensorDeviceClass.POWER,
@@ -213,6 +227,7 @@ DEVICE_BINARY_SENSOR_MAP: dict[type[Device], list[PetLibroBinarySensorEntityDesc
         ),
         PetLibroBinarySensorEntityDescription[GranarySmartCameraFeeder](
             key="enable_low_battery_notice",
+            fields=frozenset({"realInfo"}),
             translation_key="enable_low_battery_notice",
             icon="mdi:battery-alert",
             device_class=BinarySensorDeviceClass.BATTERY,
@@ -223,6 +238,7 @@ DEVICE_BINARY_SENSOR_MAP: dict[type[Device], list[PetLibroBinarySensorEntityDesc
     OneRFIDSmartFeeder: [
         PetLibroBinarySensorEntityDescription[OneRFIDSmartFeeder](
             key="door_state",
+            fields=frozenset({"realInfo"}),
             translation_key="door_state",
             icon="mdi:door",
             device_class=BinarySensorDeviceClass.DOOR,
@@ -231,6 +247,7 @@ DEVICE_BINARY_SENSOR_MAP: dict[type[Device], list[PetLibroBinarySensorEntityDesc
         ),
         PetLibroBinarySensorEntityDescription[OneRFIDSmartFeeder](
             key="food_dispenser_state",
+            fields=frozenset({"realInfo"}),
             translation_key="food_dispenser_state",
             icon="mdi:bowl-outline",
             device_class=BinarySensorDeviceClass.PROBLEM,
@@ -239,6 +256,7 @@ DEVICE_BINARY_SENSOR_MAP: dict[type[Device], list[PetLibroBinarySensorEntityDesc
         ),
         PetLibroBinarySensorEntityDescription[OneRFIDSmartFeeder](
             key="door_blocked",
+            fields=frozenset({"realInfo"}),
             translation_key="door_blocked",
             icon="mdi:door",
             device_class=BinarySensorDeviceClass.PROBLEM,
@@ -247,6 +265,7 @@ DEVICE_BINARY_SENSOR_MAP: dict[type[Device], list[PetLibroBinarySensorEntityDesc
         ),
         PetLibroBinarySensorEntityDescription[OneRFIDSmartFeeder](
             key="food_low",
+            fields=frozenset({"realInfo"}),
             translation_key="food_low",
             icon="mdi:bowl-mix-outline",
             device_class=BinarySensorDeviceClass.PROBLEM,
@@ -255,6 +274,7 @@ DEVICE_BINARY_SENSOR_MAP: dict[type[Device], list[PetLibroBinarySensorEntityDesc
         ),
         PetLibroBinarySensorEntityDescription[OneRFIDSmartFeeder](
             key="online",
+            fields=frozenset({"realInfo"}),
             translation_key="online",
             icon="mdi:wifi",
             device_class=BinarySensorDeviceClass.CONNECTIVITY,
@@ -263,6 +283,7 @@ DEVICE_BINARY_SENSOR_MAP: dict[type[Device], list[PetLibroBinarySensorEntityDesc
         ),
         PetLibroBinarySensorEntityDescription[OneRFIDSmartFeeder](
             key="whether_in_sleep_mode",
+            fields=frozenset({"realInfo"}),
             translation_key="whether_in_sleep_mode",
             icon="mdi:sleep",
             device_class=BinarySensorDeviceClass.POWER,
@@ -271,6 +292,7 @@ DEVICE_BINARY_SENSOR_MAP: dict[type[Device], list[PetLibroBinarySensorEntityDesc
         ),
         PetLibroBinarySensorEntityDescription[OneRFIDSmartFeeder](
             key="enable_low_battery_notice",
+            fields=frozenset({"realInfo"}),
             translation_key="enable_low_battery_notice",
             icon="mdi:battery-alert",
             device_class=BinarySensorDeviceClass.BATTERY,
@@ -279,6 +301,7 @@ DEVICE_BINARY_SENSOR_MAP: dict[type[Device], list[PetLibroBinarySensorEntityDesc
         ),
         PetLibroBinarySensorEntityDescription[OneRFIDSmartFeeder](
             key="sound_switch",
+            fields=frozenset({"realInfo"}),
             translation_key="sound_switch",
             icon="mdi:volume-high",
             should_report=lambda device: device.sound_switch is not None,
@@ -286,6 +309,7 @@ DEVICE_BINARY_SENSOR_MAP: dict[type[Device], list[PetLibroBinarySensorEntityDesc
         ),
         PetLibroBinarySensorEntityDescription[OneRFIDSmartFeeder](
             key="child_lock_switch",
+            fields=frozenset({"realInfo"}),
             translation_key="child_lock_switch",
             icon="mdi:lock",
             device_class=BinarySensorDeviceClass.LOCK,
@@ -294,6 +318,7 @@ DEVICE_BINARY_SENSOR_MAP: dict[type[Device], list[PetLibroBinarySensorEntityDesc
         ),
         PetLibroBinarySensorEntityDescription[OneRFIDSmartFeeder](
             key="display_switch",
+            fields=frozenset({"realInfo"}),
             translation_key="display_switch",
             icon="mdi:monitor-star",
             should_report=lambda device: device.display_switch is not None,
@@ -303,6 +328,7 @@ DEVICE_BINARY_SENSOR_MAP: dict[type[Device], list[PetLibroBinarySensorEntityDesc
     PolarWetFoodFeeder: [
         PetLibroBinarySensorEntityDescription[PolarWetFoodFeeder](
             key="online",
+            fields=frozenset({"realInfo"}),
             translation_key="online",
             icon="mdi:wifi",
             device_class=BinarySensorDeviceClass.CONNECTIVITY,
@@ -311,6 +337,7 @@ DEVICE_BINARY_SENSOR_MAP: dict[type[Device], list[PetLibroBinarySensorEntityDesc
         ),
         PetLibroBinarySensorEntityDescription[PolarWetFoodFeeder](
             key="enable_low_battery_notice",
+            fields=frozenset({"realInfo"}),
             translation_key="enable_low_battery_notice",
             icon="mdi:battery-alert",
             device_class=BinarySensorDeviceClass.BATTERY,
@@ -319,6 +346,7 @@ DEVICE_BINARY_SENSOR_MAP: dict[type[Device], list[PetLibroBinarySensorEntityDesc
         ),
         PetLibroBinarySensorEntityDescription[PolarWetFoodFeeder](
             key="door_blocked",
+            fields=frozenset({"realInfo"}),
             translation_key="door_blocked",
             icon="mdi:door-closed-lock",
             device_class=BinarySensorDeviceClass.PROBLEM,
@@ -329,6 +357,7 @@ DEVICE_BINARY_SENSOR_MAP: dict[type[Device], list[PetLibroBinarySensorEntityDesc
     DockstreamSmartFountain: [
         PetLibroBinarySensorEntityDescription[DockstreamSmartFountain](
             key="online",
+            fields=frozenset({"realInfo"}),
             translation_key="online",
             icon="mdi:wifi",
             device_class=BinarySensorDeviceClass.CONNECTIVITY,
@@ -339,6 +368,7 @@ DEVICE_BINARY_SENSOR_MAP: dict[type[Device], list[PetLibroBinarySensorEntityDesc
     DockstreamSmartRFIDFountain: [
         PetLibroBinarySensorEntityDescription[DockstreamSmartRFIDFountain](
             key="online",
+            fields=frozenset({"realInfo"}),
             translation_key="online",
             icon="mdi:wifi",
             device_class=BinarySensorDeviceClass.CONNECTIVITY,
@@ -374,7 +404,7 @@ async def async_setup_entry(
 
     # Create binary sensor entities for each device based on the binary sensor map
     entities = [
-        PetLibroBinarySensorEntity(device, hub.coordinator, description)
+        PetLibroBinarySensorEntity(device, hub.coordinator_for(device), description)
         for device in devices  # Iterate through devices from the hub
         for device_type, entity_descriptions in DEVICE_BINARY_SENSOR_MAP.items()
         if isinstance(device, device_type)
@@ -9,7 +9,8 @@ from aiohttp import ClientSession, ClientError
 from collections.abc import Callable, Coroutine
 from dataclasses import dataclass
 from typing import Any, Generic
-from logging import getLogger
+from logging import DEBUG
+from .log import get_logger
 from .const import DOMAIN
 from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
 from homeassistant.const import EntityCategory
@@ -18,7 +19,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.config_entries import ConfigEntry  # Added ConfigEntry import
 from .hub import PetLibroHub  # Adjust the import path as necessary
 
-_LOGGER = getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 from .entity import PetLibroEntity, _DeviceT, PetLibroEntityDescription
 from .devices import Device
@@ -51,18 +52,21 @@ DEVICE_BUTTON_MAP: dict[type[Device], list[PetLibroButtonEntityDescription]] = {
     AirSmartFeeder: [
         PetLibroButtonEntityDescription[AirSmartFeeder](
             key="manual_feed",
+            fields=frozenset({"realInfo"}),
             translation_key="manual_feed",
             set_fn=lambda device: device.set_manual_feed(),
             name="Manual Feed"
         ),
         PetLibroButtonEntityDescription[AirSmartFeeder](
             key="enable_feeding_plan",
+            fields=frozenset({"realInfo"}),
             translation_key="enable_feeding_plan",
             set_fn=lambda device: device.set_feeding_plan(True),
             name="Enable Feeding Plan"
         ),
         PetLibroButtonEntityDescription[AirSmartFeeder](
             key="disable_feeding_plan",
+            fields=frozenset({"realInfo"}),
             translation_key="disable_feeding_plan",
             set_fn=lambda device: device.set_feeding_plan(False),
             name="Disable Feeding Plan"
@@ -71,18 +75,21 @@ DEVICE_BUTTON_MAP: dict[type[Device], list[PetLibroButtonEntityDescription]] = {
     GranarySmartFeeder: [
         PetLibroButtonEntityDescription[GranarySmartFeeder](
             key="manual_feed",
+            fields=frozenset({"realInfo"}),
             translation_key="manual_feed",
             set_fn=lambda device: device.set_manual_feed(),
             name="Manual Feed"
         ),
         PetLibroButtonEntityDescription[GranarySmartFeeder](
             key="enable_feeding_plan",
+            fields=frozenset({"realInfo"}),
             translation_key="enable_feeding_plan",
             set_fn=lambda device: device.set_feeding_plan(True),
             name="Enable Feeding Plan"
         ),
         PetLibroButtonEntityDescription[GranarySmartFeeder](
             key="disable_feeding_plan",
+            fields=frozenset({"realInfo"}),
             translation_key="disable_feeding_plan",
             set_fn=lambda device: device.set_feeding_plan(False),
             name="Disable Feeding Plan"
@@ -91,18 +98,21 @@ DEVICE_BUTTON_MAP: dict[type[Device], list[PetLibroButtonEntityDescription]] = {
     GranarySmartCameraFeeder: [
         PetLibroButtonEntityDescription[GranarySmartCameraFeeder](
             key="manual_feed",
+            fields=frozenset({"realInfo"}),
             translation_key="manual_feed",
             set_fn=lambda device: device.set_manual_feed(),
             name="Manual Feed"
         ),
         PetLibroButtonEntityDescription[GranarySmartCameraFeeder](
             key="enable_feeding_plan",
+            fields=frozenset({"realInfo"}),
             translation_key="enable_feeding_plan",
             set_fn=lambda device: device.set_feeding_plan(True),
             name="Enable Feeding Plan"
         ),
         PetLibroButtonEntityDescription[GranarySmartCameraFeeder](
             key="disable_feeding_plan",
+            fields=frozenset({"realInfo"}),
             translation_key="disable_feeding_plan",
             set_fn=lambda device: device.set_feeding_plan(False),
             name="Disable Feeding Plan"
@@ -111,54 +121,63 @@ DEVICE_BUTTON_MAP: dict[type[Device], list[PetLibroButtonEntityDescription]] = {
     OneRFIDSmartFeeder: [
         PetLibroButtonEntityDescription[OneRFIDSmartFeeder](
             key="manual_feed",
+            fields=frozenset({"realInfo"}),
             translation_key="manual_feed",
             set_fn=lambda device: device.set_manual_feed(),
             name="Manual Feed"
         ),
         PetLibroButtonEntityDescription[OneRFIDSmartFeeder](
             key="enable_feeding_plan",
+            fields=frozenset({"realInfo"}),
             translation_key="enable_feeding_plan",
             set_fn=lambda device: device.set_feeding_plan(True),
             name="Enable Feeding Plan"
         ),
         PetLibroButtonEntityDescription[OneRFIDSmartFeeder](
             key="disable_feeding_plan",
+            fields=frozenset({"realInfo"}),
             translation_key="disable_feeding_plan",
             set_fn=lambda device: device.set_feeding_plan(False),
             name="Disable Feeding Plan"
         ),
         PetLibroButtonEntityDescription[OneRFIDSmartFeeder](
             key="manual_lid_open",
+            fields=frozenset({"realInfo"}),
             translation_key="manual_lid_open",
             set_fn=lambda device: device.set_manual_lid_open(),
             name="Manually Open Lid"
         ),
         PetLibroButtonEntityDescription[OneRFIDSmartFeeder](
             key="display_on",
+            fields=frozenset({"realInfo"}),
             translation_key="display_on",
             set_fn=lambda device: device.set_display_on(),
             name="Turn On Display"
         ),
         PetLibroButtonEntityDescription[OneRFIDSmartFeeder](
             key="display_off",
+            fields=frozenset({"realInfo"}),
             translation_key="display_off",
             set_fn=lambda device: device.set_display_off(),
             name="Turn Off Display"
         ),
         PetLibroButtonEntityDescription[OneRFIDSmartFeeder](
             key="sound_on",
+            fields=frozenset({"realInfo"}),
             translation_key="sound_on",
             set_fn=lambda device: device.set_sound_on(),
             name="Turn On Sound"
         ),
         PetLibroButtonEntityDescription[OneRFIDSmartFeeder](
             key="sound_off",
+            fields=frozenset({"realInfo"}),
             translation_key="sound_off",
             set_fn=lambda device: device.set_sound_off(),
             name="Turn Off Sound"
         ),
         PetLibroButtonEntityDescription[OneRFIDSmartFeeder](
             key="desiccant_reset",
+            fields=frozenset({"realInfo"}),
             translation_key="desiccant_reset",
             set_fn=lambda device: device.set_desiccant_reset(),
             name="Desiccant Replaced"
@@ -191,15 +210,15 @@ class PetLibroButtonEntity(PetLibroEntity[_DeviceT], ButtonEntity):
         _LOGGER.debug("Pressing button: %s for device %s", self.entity_description.name, self.device.name)
 
         # Log available methods for debugging
-        _LOGGER.debug("Available methods for device %s: %s", self.device.name, dir(self.device))
+        if _LOGGER.isEnabledFor(DEBUG):
+            _LOGGER.debug("Available methods for device %s: %s", self.device.name, dir(self.device))
 
         try:
-            await self.entity_description.set_fn(self.device)
-            await self.device.refresh()  # Refresh the device state after the button press
+            await self.entity_description.set_fn(self.device)  # The device confirms its state in the background
             _LOGGER.debug("Successfully pressed button: %s", self.entity_description.name)
         except Exception as e:
             _LOGGER.error(
-                f"Error pressing button {self.entity_description.name} for device {self.device.name}: {e}",
+                "Error pressing button %s for device %s: %s", self.entity_description.name, self.device.name, e,
                 exc_info=True  # Log full traceback for better debugging
             )
 
@@ -229,7 +248,7 @@ async def async_setup_entry(
 
     # Create button entities for each device based on the button map
     entities = [
-        PetLibroButtonEntity(device, hub, description)
+        PetLibroButtonEntity(device, hub.coordinator_for(device), description)
         for device in devices  # Iterate through devices from the hub
         for device_type, entity_descriptions in DEVICE_BUTTON_MAP.items()
         if isinstance(device, device_type)
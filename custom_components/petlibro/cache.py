@@ -0,0 +1,96 @@
+"""Bounded response cache for PETLIBRO API reads."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any, Hashable
+
+FRESH = "fresh"
+STALE = "stale"
+
+
+@dataclass(slots=True)
+class CacheEntry:
+    """A cached response and the moments it stops being fresh and usable."""
+
+    value: Any
+    fresh_until: float
+    stale_until: float
+
+    @property
+    def state(self) -> str | None:
+        """Return FRESH, STALE or None if the entry expired completely."""
+        now = monotonic()
+        if now < self.fresh_until:
+            return FRESH
+        if now < self.stale_until:
+            return STALE
+        return None
+
+
+class ResponseCache:
+    """LRU cache with per-entry TTLs and a stale-while-revalidate window.
+
+    Keys are ``(serial, endpoint)`` tuples so all entries of one device can be dropped at once.
+    """
+
+    def __init__(self, max_size: int = 256) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[tuple[str, Hashable], CacheEntry] = OrderedDict()
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, serial: str, endpoint: Hashable) -> tuple[Any, str | None]:
+        """Look up an entry, returning its value and FRESH, STALE or None on a miss."""
+        key = (serial, endpoint)
+        entry = self._entries.get(key)
+        state = entry.state if entry is not None else None
+
+        if state is None:
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None, None
+
+        self._entries.move_to_end(key)
+        if state == FRESH:
+            self.hits += 1
+        else:
+            self.stale_hits += 1
+        return entry.value, state
+
+    def set(self, serial: str, endpoint: Hashable, value: Any, ttl: float, stale_ttl: float = 0) -> None:
+        """Store a value that stays fresh for ``ttl`` and may be served stale for ``stale_ttl`` more seconds."""
+        now = monotonic()
+        key = (serial, endpoint)
+        self._entries[key] = CacheEntry(value, now + ttl, now + ttl + stale_ttl)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, serial: str, endpoints: tuple[Hashable, ...] | None = None) -> None:
+        """Drop the given endpoints (or every endpoint) cached for a device."""
+        for key in [key for key in self._entries if key[0] == serial]:
+            if endpoints is None or key[1] in endpoints:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return the cache counters."""
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "stale_hits": self.stale_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
@@ -0,0 +1,94 @@
+"""Endpoints each PETLIBRO model and firmware actually supports."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from time import time
+from typing import Any
+
+
+@dataclass(slots=True)
+class EndpointRecord:
+    """Refusals of an endpoint in a row, and until when it is skipped (wall clock, 0 when it is not)."""
+
+    misses: int = 0
+    skip_until: float = 0.0
+
+
+class EndpointCapabilities:
+    """Learn which endpoints are worth calling for each device profile.
+
+    A profile identifies a model and firmware, e.g. ``PLAF103/1.2.3``. After ``max_misses`` refusals
+    in a row (answers classified FATAL, not network or login failures) an endpoint is skipped for
+    ``recheck_after`` seconds, then called once again; a single answer, even an empty one, makes it
+    supported again. The records survive restarts through
+    ``as_dict`` and ``load``, so they use wall clock time.
+    """
+
+    def __init__(self, max_misses: int, recheck_after: float) -> None:
+        self.max_misses = max_misses
+        self.recheck_after = recheck_after
+        self._records: dict[tuple[str, str], EndpointRecord] = {}
+        self.skipped = 0
+        self.changed = False  # Set when the records differ from the persisted ones
+
+    def should_skip(self, profile: str, endpoint: str) -> bool:
+        """Return True if the endpoint is known to be unsupported by the profile and not due for a re-check."""
+        record = self._records.get((profile, endpoint))
+        if record is None or record.skip_until <= time():
+            return False
+        self.skipped += 1
+        return True
+
+    def record(self, profile: str, endpoint: str, supported: bool) -> bool:
+        """Record an answer or a refusal and return True if it made the endpoint skipped."""
+        key = (profile, endpoint)
+        if supported:
+            if self._records.pop(key, None) is not None:
+                self.changed = True
+            return False
+
+        record = self._records.setdefault(key, EndpointRecord())
+        record.misses += 1
+        self.changed = True
+        if record.misses < self.max_misses:
+            return False
+        record.skip_until = time() + self.recheck_after
+        return True
+
+    def unsupported(self) -> dict[str, list[str]]:
+        """Return the endpoints currently skipped, by profile."""
+        now = time()
+        result: dict[str, list[str]] = {}
+        for (profile, endpoint), record in self._records.items():
+            if record.skip_until > now:
+                result.setdefault(profile, []).append(endpoint)
+        return result
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the records in a JSON serializable form."""
+        return {
+            "endpoints": [
+                {"profile": profile, "endpoint": endpoint, "misses": record.misses, "skip_until": record.skip_until}
+                for (profile, endpoint), record in self._records.items()
+            ]
+        }
+
+    def load(self, data: dict[str, Any] | None) -> None:
+        """Restore the records saved by as_dict, ignoring malformed ones."""
+        for item in (data or {}).get("endpoints", []):
+            try:
+                self._records[(str(item["profile"]), str(item["endpoint"]))] = EndpointRecord(
+                    int(item["misses"]), float(item["skip_until"])
+                )
+            except (KeyError, TypeError, ValueError):
+                continue
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Return the discovery counters."""
+        return {
+            "known": len(self._records),
+            "unsupported": sum(len(endpoints) for endpoints in self.unsupported().values()),
+            "skipped": self.skipped,
+        }
@@ -0,0 +1,44 @@
+"""JSON encoding and decoding of PETLIBRO API payloads.
+
+Uses orjson when it is installed (it ships with Home Assistant) and the standard library otherwise.
+"""
+
+from __future__ import annotations
+
+import json
+
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+if orjson is not None:
+
+    def dumps(obj: Any) -> bytes:
+        """Encode a request body."""
+        return orjson.dumps(obj)
+
+    def dumps_sorted(obj: Any) -> bytes:
+        """Encode with sorted keys, so equal objects always give equal bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS, default=str)
+
+    def loads(raw: bytes) -> Any:
+        """Decode a response body."""
+        return orjson.loads(raw)
+
+else:
+
+    def dumps(obj: Any) -> bytes:
+        """Encode a request body."""
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def dumps_sorted(obj: Any) -> bytes:
+        """Encode with sorted keys, so equal objects always give equal bytes."""
+        return json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str).encode()
+
+    def loads(raw: bytes) -> Any:
+        """Decode a response body."""
+        return json.loads(raw)
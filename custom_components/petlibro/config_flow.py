@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-import logging
+from .log import Secret, get_logger
 from typing import Any, Mapping
 
 import voluptuous as vol
@@ -15,7 +15,7 @@ from .const import DOMAIN
 from .api import PetLibroAPI
 from .exceptions import PetLibroCannotConnect, PetLibroInvalidAuth
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
@@ -123,7 +123,7 @@ class PetlibroConfigFlow(ConfigFlow, domain=DOMAIN):
             )
 
             self.token = await api.login(self.email, self.password)
-            _LOGGER.debug(f"Login successful, token: {self.token}")
+            _LOGGER.debug("Login successful, token: %s", Secret(self.token))
         except PetLibroCannotConnect:
             return "cannot_connect"
         except PetLibroInvalidAuth:
@@ -12,4 +12,70 @@ CONF_REGION = "region"
 PLATFORMS = ["sensor", "switch", "button", "binary_sensor", "number"]  # Add any other platforms as needed
 
 # Update interval for device data in seconds
-UPDATE_INTERVAL_SECONDS = 60  # You can adjust this value based on your needs
\ No newline at end of file
+UPDATE_INTERVAL_SECONDS = 60  # You can adjust this value based on your needs
+
+# Polling cadences of device endpoints, see Device.FLAT_ENDPOINTS and Device.NESTED_ENDPOINTS
+POLL_REALTIME_SECONDS = UPDATE_INTERVAL_SECONDS  # Live state such as online, levels and errors
+POLL_STATUS_SECONDS = 300  # Counters and plans that change a few times a day
+POLL_STATIC_SECONDS = 3600  # Device info and templates that change only when edited
+# Realtime cadence while a feeder is busy or close to a planned feeding, and between known feedings
+POLL_BURST_SECONDS = 15
+POLL_IDLE_SECONDS = 300
+# Burst window around every expected feeding event
+FEEDING_WINDOW_BEFORE_SECONDS = 60
+FEEDING_WINDOW_AFTER_SECONDS = 180
+# Probe interval of an offline or sleeping device, doubled after every probe that finds it still away
+POLL_DORMANT_MIN_SECONDS = 120
+POLL_DORMANT_MAX_SECONDS = 3600
+POLL_TOLERANCE_SECONDS = 5  # An endpoint this close to its interval is polled now rather than a whole tick later
+
+# Delay before the state is read back after a command, to confirm the optimistic update
+COMMAND_CONFIRM_DELAY_SECONDS = 3
+# Operations that may wait for a device at once, see DeviceQueue
+DEVICE_QUEUE_MAX_DEPTH = 8
+# Quiet period after which the last value of a burst of changes to the same setting is sent
+COMMAND_DEBOUNCE_SECONDS = 0.5
+# Failed refreshes in a row after which a device is quarantined, and its probe intervals, see DeviceHealth.
+# A failing optional endpoint is retried at the same intervals, see Device.refresh
+QUARANTINE_AFTER_FAILURES = 3
+QUARANTINE_MIN_SECONDS = 300
+QUARANTINE_MAX_SECONDS = 3600
+
+# Refusals in a row (not empty answers) after which an endpoint is skipped for a device model and
+# firmware, how long until it is tried again, and where that knowledge is persisted
+CAPABILITY_MAX_MISSES = 3
+CAPABILITY_RECHECK_SECONDS = 6 * 3600
+CAPABILITY_STORE_KEY = "petlibro.capabilities"
+CAPABILITY_STORE_VERSION = 1
+CAPABILITY_SAVE_DELAY_SECONDS = 60
+
+# Account-wide request budgets (requests per second and burst size)
+RATE_LIMIT_READS_PER_SECOND = 4
+RATE_LIMIT_READ_BURST = 8
+RATE_LIMIT_COMMANDS_PER_SECOND = 1
+RATE_LIMIT_COMMAND_BURST = 3
+# Pause applied after a 429 response without a usable Retry-After header
+RATE_LIMIT_DEFAULT_RETRY_AFTER_SECONDS = 5
+
+# Retries of failed requests, with exponential backoff and jitter
+RETRY_MAX_ATTEMPTS = 3
+RETRY_BASE_DELAY_SECONDS = 0.5
+RETRY_MAX_DELAY_SECONDS = 8
+# Consecutive transient failures after which requests fail fast, and for how long
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
+CIRCUIT_BREAKER_RESET_SECONDS = 60
+# How long command outcomes are remembered by requestId
+COMMAND_LEDGER_TTL_SECONDS = 300
+# Sends of a command carrying a requestId, each after the previous one failed with every retry
+COMMAND_SEND_ATTEMPTS = 2
+
+# Connection pool of the dedicated PetLibro cloud session
+HTTP_CONNECTIONS_PER_HOST = 8
+HTTP_KEEPALIVE_SECONDS = UPDATE_INTERVAL_SECONDS + 15  # Outlive the poll interval so every poll finds a warm connection
+HTTP_DNS_CACHE_SECONDS = 300
+HTTP_CONNECT_TIMEOUT_SECONDS = 10
+HTTP_REQUEST_TIMEOUT_SECONDS = 20
+HTTP_WARM_CONNECTIONS = 4
+
+# Log only every Nth per-device debug message (1 logs everything), see log.set_device_sampling
+DEBUG_SAMPLE_EVERY = 1
@@ -0,0 +1,61 @@
+"""Expected effect of the PETLIBRO commands on the device state.
+
+Commands are keyed by their PetLibroAPI method. A patch maps an endpoint to the model attributes the
+command changes, with TOP_LEVEL standing for the fields merged into the top level of the device data.
+Commands changing the same setting are debounced together, only the last value of a burst is sent.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+from .device_queue import PRIORITY_FEED
+
+TOP_LEVEL = None
+
+Patch = dict[str | None, dict[str, Any]]
+
+# Commands without an entry (manual feed, lid opening, ...) change nothing that can be predicted
+COMMAND_PATCHES: dict[str, Callable[..., Patch]] = {
+    "set_feeding_plan": lambda enable: {"realInfo": {"enable_feeding_plan": enable}},
+    "set_child_lock": lambda enable: {"realInfo": {"child_lock_switch": enable}},
+    "set_light_enable": lambda enable: {"realInfo": {"enable_light": enable}},
+    "set_light_switch": lambda enable: {"realInfo": {"light_switch": enable}},
+    "set_sound_enable": lambda enable: {"realInfo": {"enable_sound": enable}},
+    "set_sound_switch": lambda enable: {"realInfo": {"sound_switch": enable}},
+    "set_sound_level": lambda value: {"getAttributeSetting": {"volume": int(value)}},
+    "set_desiccant_frequency": lambda value: {"realInfo": {"change_desiccant_frequency": int(value)}},
+    "set_display_on": lambda: {"realInfo": {"screen_display_switch": True}},
+    "set_display_off": lambda: {"realInfo": {"screen_display_switch": False}},
+    "set_sound_on": lambda: {"realInfo": {"sound_switch": True}},
+    "set_sound_off": lambda: {"realInfo": {"sound_switch": False}},
+}
+
+# Priority of commands in the DeviceQueue; the others run with PRIORITY_SETTING
+COMMAND_PRIORITIES: dict[str, int] = {
+    "set_manual_feed": PRIORITY_FEED,
+}
+
+# Commands the API runs at most once per requestId; one is made per call of run_command, and kept when resending it
+REQUEST_ID_COMMANDS: frozenset[str] = frozenset({
+    "set_manual_feed",
+    "set_desiccant_reset",
+    "set_desiccant_frequency",
+})
+
+# Setting changed by each command; actions (manual feed, lid opening, ...) are never debounced
+COMMAND_SETTINGS: dict[str, str] = {
+    "set_feeding_plan": "feeding_plan",
+    "set_child_lock": "child_lock",
+    "set_light_enable": "light_enable",
+    "set_light_switch": "light_switch",
+    "set_sound_enable": "sound_enable",
+    "set_sound_switch": "sound_switch",
+    "set_sound_on": "sound_switch",
+    "set_sound_off": "sound_switch",
+    "set_display_on": "display",
+    "set_display_off": "display",
+    "set_sound_level": "volume",
+    "set_desiccant_frequency": "desiccant_frequency",
+}
@@ -1,49 +1,478 @@
-from logging import getLogger
-from typing import cast
+import asyncio
+import dataclasses
+
+from ..log import get_logger
+from collections.abc import Iterable, Iterator, Mapping
+from contextlib import contextmanager
+from datetime import datetime, time, timezone
+from itertools import count
+from time import monotonic
+from typing import Any, cast
+from zoneinfo import ZoneInfo
 
 from homeassistant.components.sensor import SensorEntity
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
+from .commands import COMMAND_PATCHES, COMMAND_PRIORITIES, COMMAND_SETTINGS, REQUEST_ID_COMMANDS, TOP_LEVEL, Patch
+from .device_health import DeviceHealth
+from .device_queue import PRIORITY_READ, PRIORITY_SETTING, DeviceQueue
 from .event import Event, EVENT_UPDATE
-from ..api import PetLibroAPI
+from .models import AttributeSettings, FeedingPlanToday, GrainStatus, RealInfo, WetFeedingPlan, parse_endpoint
+from ..api import PetLibroAPI, new_request_id
+from ..const import (
+    COMMAND_CONFIRM_DELAY_SECONDS,
+    COMMAND_DEBOUNCE_SECONDS,
+    COMMAND_SEND_ATTEMPTS,
+    DEVICE_QUEUE_MAX_DEPTH,
+    FEEDING_WINDOW_AFTER_SECONDS,
+    FEEDING_WINDOW_BEFORE_SECONDS,
+    POLL_BURST_SECONDS,
+    POLL_DORMANT_MAX_SECONDS,
+    POLL_DORMANT_MIN_SECONDS,
+    POLL_IDLE_SECONDS,
+    POLL_REALTIME_SECONDS,
+    POLL_STATIC_SECONDS,
+    POLL_STATUS_SECONDS,
+    POLL_TOLERANCE_SECONDS,
+    QUARANTINE_MAX_SECONDS,
+    QUARANTINE_MIN_SECONDS,
+)
+from ..retry import RETRYABLE, classify
+
+_LOGGER = get_logger(__name__)
 
-_LOGGER = getLogger(__name__)
+# Key reported as changed when the refresh health of a device changed, see Device.record_refresh
+HEALTH_FIELD = "refreshHealth"
 
 
 class Device(Event):
+    # Endpoints whose data is merged into the top level of the device data, with their poll interval in
+    # seconds. An endpoint also in NESTED_ENDPOINTS is only stored as its model.
+    FLAT_ENDPOINTS: Mapping[str, int] = {
+        "baseInfo": POLL_STATIC_SECONDS,
+        "realInfo": POLL_REALTIME_SECONDS,
+        "getAttributeSetting": POLL_STATUS_SECONDS,
+    }
+    # Endpoints whose data is stored under the endpoint name, parsed into their model, with their poll interval in seconds
+    NESTED_ENDPOINTS: Mapping[str, int] = {}
+    # The single endpoint read to check whether an offline or sleeping device is back
+    PROBE_ENDPOINT = "realInfo"
+
     def __init__(self, data: dict, api: PetLibroAPI):
         super().__init__()
         self._data: dict = {}
         self.api = api
+        self._polled_at: dict[str, float] = {}  # Last successful fetch per endpoint
+        self._endpoint_failures: dict[str, int] = {}  # Failed fetches in a row per endpoint
+        self._retry_at: dict[str, float] = {}  # When a failing optional endpoint is tried again
+        self.queue = DeviceQueue(DEVICE_QUEUE_MAX_DEPTH)  # Serializes commands, reads wait for them
+        self.health = DeviceHealth()  # Quarantines the device while its refreshes keep failing
+        self._batches: dict[asyncio.Task | None, set[str]] = {}  # Changes collected by the open batch of each task
+        self._confirmation: asyncio.Task | None = None
+        self._confirm_endpoints: set[str] | None = set()  # None confirms every endpoint
+        self._setting_versions: dict[str, int] = {}  # Latest call per debounced setting
+        self._setting_rollbacks: dict[str, dict] = {}  # State before the current burst per setting
+        self._pending_patches: dict[int, Patch] = {}  # Patches of the commands not answered yet
+        self._reads: list[dict[int, Patch]] = []  # Patches of the commands answered during each read in flight
+        self._command_ids = count()
+        self._dormant_backoff = 0.0  # Probe interval while offline or asleep, 0 while awake
+        self._probe_at = 0.0
 
         self.update_data(data)
 
     def update_data(self, data: dict) -> None:
-        """Save the device info from a data dictionary."""
+        """Save the device info from a data dictionary.
+
+        Listeners are only notified when a value actually changed, with the set of changed keys.
+        """
         try:
-            _LOGGER.debug("Updating data with new information.")
+            changed = frozenset(
+                key for key, value in data.items()
+                if key not in self._data or self._data[key] != value
+            )
+            if not changed:
+                _LOGGER.device_debug(self.serial, "No changes in the new data.")
+                return
+            _LOGGER.device_debug(self.serial, "Updating data with new information: %s", sorted(changed))
             self._data.update(data)
-            self.emit(EVENT_UPDATE)
-            _LOGGER.debug("Data updated successfully.")
+            self._notify(changed)
+            _LOGGER.device_debug(self.serial, "Data updated successfully.")
         except Exception as e:
-            _LOGGER.error(f"Error updating data: {e}")
-            _LOGGER.debug(f"Partial data: {data.get('deviceSn', 'Unknown Serial')}")
+            _LOGGER.error("Error updating data: %s", e)
+            _LOGGER.debug("Partial data: %s", data.get('deviceSn', 'Unknown Serial'))
+
+    def _notify(self, changed: frozenset[str]) -> None:
+        """Emit an update for the changed keys, or collect them while the current task has a batch open."""
+        if self._batches and (changes := self._batches.get(asyncio.current_task())) is not None:
+            changes.update(changed)
+            return
+        self.emit(EVENT_UPDATE, changed=changed)
+
+    def record_refresh(self, error: BaseException | None = None) -> None:
+        """Record the outcome of a polling refresh in the device health.
+
+        Logs a quarantine and a release once; the health entities are notified through HEALTH_FIELD.
+        """
+        previous = self.health.stats
+        if error is None:
+            if self.health.record_success():
+                _LOGGER.info("Device %s responds again, leaving quarantine.", self.serial)
+        elif self.health.record_failure(error):
+            _LOGGER.warning(
+                "Device %s failed %s refreshes in a row, probing it less often: %s",
+                self.serial, self.health.consecutive_failures, error
+            )
+        if self.health.stats != previous:
+            self._notify(frozenset({HEALTH_FIELD}))
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Collect the updates made inside the block and emit a single event for all of them when it ends.
 
-    async def refresh(self):
-        """Refresh the device data from the API."""
+        Batches can be nested and may span awaits; the event is emitted when the outermost one ends.
+        Only the updates of the task opening the batch are collected, those of other tasks meanwhile,
+        such as optimistic command updates, are emitted right away.
+        """
+        task = asyncio.current_task()
+        if task in self._batches:
+            yield
+            return
+        changes = self._batches[task] = set()
         try:
-            data = {}
-            data.update(await self.api.device_base_info(self.serial))
-            data.update(await self.api.device_real_info(self.serial))
-            data.update(await self.api.device_attribute_settings(self.serial))
-            self.update_data(data)
-        except Exception as e:
-            _LOGGER.error(f"Failed to refresh device data: {e}")
+            yield
+        finally:
+            del self._batches[task]
+            if changes:
+                self.emit(EVENT_UPDATE, changed=frozenset(changes))
+
+    def is_active(self) -> bool:
+        """Return True while the device is busy, e.g. dispensing food, and its state changes quickly."""
+        return False
+
+    def expected_events(self) -> list[datetime]:
+        """Return the known moments the device changes state, such as planned feedings.
+
+        By default the execution times of today's feeding plan, for the devices polling feedingPlanTodayNew.
+        """
+        plan = self.feeding_plan_today
+        if plan.all_skipped or not plan.plans:
+            return []
+        try:
+            device_timezone = ZoneInfo(self._data.get("timezone"))
+        except (TypeError, ValueError, KeyError):
+            return []
+        today = datetime.now(device_timezone).date()
+        events = []
+        for item in plan.plans:
+            try:
+                events.append(datetime.combine(today, time.fromisoformat(item.get("executionTime")), device_timezone))
+            except (AttributeError, TypeError, ValueError):
+                continue
+        return events
+
+    def realtime_interval(self, now: datetime) -> float:
+        """Return the current poll interval of the realtime endpoints, following the feeding timeline.
+
+        Polls in short bursts while the device is active and around expected events, and slowly in
+        between. Devices without a timeline keep POLL_REALTIME_SECONDS.
+        """
+        if self.is_active():
+            return POLL_BURST_SECONDS
+        events = self.expected_events()
+        if not events:
+            return POLL_REALTIME_SECONDS
+
+        interval = POLL_IDLE_SECONDS
+        for event in events:
+            until = (event - now).total_seconds()
+            if -FEEDING_WINDOW_AFTER_SECONDS <= until <= FEEDING_WINDOW_BEFORE_SECONDS:
+                return POLL_BURST_SECONDS
+            if until > 0:
+                # Wake up when the burst window of the next event opens
+                interval = min(interval, max(POLL_BURST_SECONDS, until - FEEDING_WINDOW_BEFORE_SECONDS))
+        return interval
+
+    @property
+    def poll_intervals(self) -> dict[str, float]:
+        """Return the current poll interval of every endpoint the device uses."""
+        intervals = dict(self.FLAT_ENDPOINTS)
+        for endpoint, interval in self.NESTED_ENDPOINTS.items():
+            intervals[endpoint] = min(interval, intervals.get(endpoint, interval))
+        realtime = self.realtime_interval(datetime.now(timezone.utc))
+        return {
+            endpoint: realtime if interval == POLL_REALTIME_SECONDS else interval
+            for endpoint, interval in intervals.items()
+        }
+
+    def is_dormant(self) -> bool:
+        """Return True while the device reports being offline or in sleep mode."""
+        if (real_info := self._data.get("realInfo")) is not None:
+            return not real_info.online or real_info.whether_in_sleep_mode
+        return self._data.get("online") is False or self._data.get("whetherInSleepMode") is True
+
+    def due_endpoints(self) -> list[str]:
+        """Return the endpoints whose poll interval has passed, or that were never fetched.
+
+        Once fully fetched, a dormant device is only probed through PROBE_ENDPOINT, at intervals
+        doubling from POLL_DORMANT_MIN_SECONDS to POLL_DORMANT_MAX_SECONDS. Full polling resumes as
+        soon as it reports being back.
+        """
+        now = monotonic()
+        if self.is_dormant() and self._polled_at.keys() | self._retry_at.keys() >= self.poll_intervals.keys():
+            if not self._dormant_backoff:
+                _LOGGER.debug("Device %s is offline or asleep, polling it less often.", self.serial)
+                self._dormant_backoff = POLL_DORMANT_MIN_SECONDS
+                self._probe_at = now + self._dormant_backoff
+            if now < self._probe_at - POLL_TOLERANCE_SECONDS:
+                return []
+            self._dormant_backoff = min(self._dormant_backoff * 2, POLL_DORMANT_MAX_SECONDS)
+            self._probe_at = now + self._dormant_backoff
+            return [self.PROBE_ENDPOINT]
+        if self._dormant_backoff:
+            _LOGGER.debug("Device %s is back, resuming full polling.", self.serial)
+            self._dormant_backoff = 0.0
+        return [
+            endpoint for endpoint, interval in self.poll_intervals.items()
+            if self._due_in(endpoint, interval, now) <= POLL_TOLERANCE_SECONDS
+        ]
+
+    def seconds_until_due(self) -> float:
+        """Return the time until the next endpoint of the device, or its next probe, is due."""
+        now = monotonic()
+        if self._dormant_backoff and self.is_dormant():
+            return max(0.0, self._probe_at - now)
+        return max(0.0, min(
+            self._due_in(endpoint, interval, now) for endpoint, interval in self.poll_intervals.items()
+        ))
+
+    def _due_in(self, endpoint: str, interval: float, now: float) -> float:
+        """Return the time until an endpoint is due, negative when overdue and 0 when never fetched."""
+        due_in = interval - (now - self._polled_at[endpoint]) if endpoint in self._polled_at else 0.0
+        return max(due_in, self._retry_at.get(endpoint, now) - now)
+
+    async def refresh(self, endpoints: Iterable[str] | None = None, fresh: bool = False) -> list[BaseException]:
+        """Refresh the device data from the API.
+
+        Fetches the given endpoints, or every endpoint when none are given. Scheduled polls pass
+        ``fresh`` to bypass the response cache, so their data is never older than the poll. The
+        endpoints are fetched concurrently and the answers are merged in a single update; an endpoint
+        that fails keeps its previous data. A failing core endpoint (see PetLibroAPI.CORE_ENDPOINTS)
+        stays due and its error is returned, to count towards the quarantine of the device. A failing
+        optional endpoint backs off on its own instead. Raises if no endpoint answered and a core
+        endpoint failed.
+        """
+        endpoints = list(self.poll_intervals if endpoints is None else dict.fromkeys(endpoints))
+        profile = self.capability_profile
+        for endpoint in [endpoint for endpoint in endpoints if not self.api.endpoint_supported(profile, endpoint)]:
+            # Known to be refused by this model and firmware, counts as polled until its next interval
+            _LOGGER.device_debug(self.serial, "Skipping %s for %s, not supported by %s.", endpoint, self.serial, profile)
+            self._polled_at[endpoint] = monotonic()
+            endpoints.remove(endpoint)
+        if not endpoints:
+            return []
+        answered_patches: dict[int, Patch] = {}
+        self._reads.append(answered_patches)
+        try:
+            async with self.queue.slot(PRIORITY_READ):
+                started_at = monotonic()
+                results = await asyncio.gather(
+                    *(self.api.device_endpoint(self.serial, endpoint, profile, fresh) for endpoint in endpoints),
+                    return_exceptions=True
+                )
+        finally:
+            self._reads.remove(answered_patches)
+
+        core = {*self.api.CORE_ENDPOINTS, self.PROBE_ENDPOINT}
+        data = {}
+        nested = {}
+        errors = []
+        answered = 0
+        for endpoint, result in zip(endpoints, results):
+            if isinstance(result, BaseException):
+                failures = self._endpoint_failures[endpoint] = self._endpoint_failures.get(endpoint, 0) + 1
+                if failures == 1:
+                    _LOGGER.error("Failed to refresh %s for %s: %s", endpoint, self.serial, result)
+                else:
+                    _LOGGER.device_debug(
+                        self.serial, "Failed to refresh %s for %s %s times in a row: %s",
+                        endpoint, self.serial, failures, result
+                    )
+                if endpoint in core:
+                    errors.append(result)
+                else:
+                    self._retry_at[endpoint] = monotonic() + min(
+                        QUARANTINE_MIN_SECONDS * 2 ** (failures - 1), QUARANTINE_MAX_SECONDS
+                    )
+                continue
+            if self._endpoint_failures.pop(endpoint, None):
+                _LOGGER.info("Refreshing %s for %s works again.", endpoint, self.serial)
+            self._retry_at.pop(endpoint, None)
+            self._polled_at[endpoint] = started_at
+            answered += 1
+            if endpoint in self.NESTED_ENDPOINTS:
+                nested[endpoint] = parse_endpoint(endpoint, result)
+            else:
+                data.update(result or {})
+
+        if not answered:
+            if errors:
+                raise errors[0]
+            return []
+
+        data.update(nested)
+        # Commands do not wait for reads: one sent while this read was in flight may have reached the
+        # device after the endpoint answered, its patch must not be undone
+        for _, patch in sorted({**answered_patches, **self._pending_patches}.items()):
+            data.update(self._patch_update(patch, data))
+        self.update_data(data)
+        return errors
+
+    async def run_command(self, command: str, *args: Any) -> Any:
+        """Send a command through the PetLibroAPI method of that name.
+
+        The expected result is shown right away and rolled back if the command fails. Once the API
+        acknowledged the command, the state is read back in the background to confirm it. Changes to
+        a setting are debounced: only the last of a burst is sent, the superseded calls return None.
+        """
+        # A confirmation read now could overwrite the new state with the old one
+        self._cancel_confirmation()
+
+        patch = COMMAND_PATCHES[command](*args) if command in COMMAND_PATCHES else {}
+        command_id = next(self._command_ids)
+        self._pending_patches[command_id] = patch  # Re-applied to reads until the command is answered
+        try:
+            previous = self._apply_patch(patch)
+
+            if (setting := COMMAND_SETTINGS.get(command)) is not None:
+                previous = self._setting_rollbacks.setdefault(setting, previous)
+                version = self._setting_versions[setting] = self._setting_versions.get(setting, 0) + 1
+                try:
+                    await asyncio.sleep(COMMAND_DEBOUNCE_SECONDS)
+                except asyncio.CancelledError:
+                    if self._setting_versions[setting] == version:
+                        self.update_data(self._setting_rollbacks.pop(setting))
+                    raise
+                if self._setting_versions[setting] != version:
+                    _LOGGER.device_debug(self.serial, "Dropping %s%s for %s, superseded by a newer value", command, args, self.serial)
+                    return None
+                del self._setting_rollbacks[setting]
+
+            try:
+                async with self.queue.slot(COMMAND_PRIORITIES.get(command, PRIORITY_SETTING)):
+                    # A read may have finished while the command waited
+                    self._apply_patch(patch)
+                    result = await self._send_command(command, args)
+                for answered_patches in self._reads:
+                    answered_patches[command_id] = patch
+            except BaseException:
+                self.update_data(previous)
+                self.confirm_later(())  # Still confirm earlier commands
+                raise
+        finally:
+            self._pending_patches.pop(command_id, None)
+        self.confirm_later(self.api.COMMAND_ENDPOINTS.get(command))
+        return result
+
+    async def _send_command(self, command: str, args: tuple) -> Any:
+        """Call the PetLibroAPI method of a command, resending it after a transient failure if it is safe.
+
+        A command of REQUEST_ID_COMMANDS gets a single requestId, kept by every send: the API runs
+        it once and the session ledger answers a send of a command that already succeeded, so a
+        resend never feeds twice. Other commands are sent once.
+        """
+        if command not in REQUEST_ID_COMMANDS:
+            return await getattr(self.api, command)(self.serial, *args)
+        request_id = new_request_id()
+        for attempt in range(1, COMMAND_SEND_ATTEMPTS + 1):
+            try:
+                return await getattr(self.api, command)(self.serial, *args, request_id=request_id)
+            except Exception as err:
+                if attempt == COMMAND_SEND_ATTEMPTS or classify(err) != RETRYABLE:
+                    raise
+                _LOGGER.warning("Sending %s to %s failed (%s), sending it again", command, self.serial, err)
+
+    def _apply_patch(self, patch: Patch) -> dict:
+        """Apply an optimistic patch and return the data needed to undo it."""
+        previous = {}
+        for endpoint, changes in patch.items():
+            if endpoint is TOP_LEVEL:
+                previous.update({key: self._data[key] for key in changes if key in self._data})
+            elif endpoint in self._data:
+                previous[endpoint] = self._data[endpoint]
+        if update := self._patch_update(patch, self._data):
+            self.update_data(update)
+        return previous
+
+    @staticmethod
+    def _patch_update(patch: Patch, data: Mapping[str, Any]) -> dict:
+        """Return the update applying a patch to the endpoints present in the data."""
+        update = {}
+        for endpoint, changes in patch.items():
+            if endpoint is TOP_LEVEL:
+                update.update(changes)
+            elif endpoint in data:
+                update[endpoint] = dataclasses.replace(data[endpoint], **changes)
+        return update
+
+    def confirm_later(self, endpoints: Iterable[str] | None = None) -> None:
+        """Read the given endpoints (or all of them) back shortly, e.g. after a command.
+
+        A confirmation that has not run yet is replaced by one covering the endpoints of both.
+        """
+        self._cancel_confirmation()
+        if endpoints is None or self._confirm_endpoints is None:
+            self._confirm_endpoints = None
+        else:
+            self._confirm_endpoints.update(endpoints)
+        self._confirmation = asyncio.get_running_loop().create_task(self._confirm())
+
+    async def _confirm(self) -> None:
+        await asyncio.sleep(COMMAND_CONFIRM_DELAY_SECONDS)
+        endpoints = self._confirm_endpoints
+        if endpoints is not None:
+            # Only the endpoints this model uses
+            endpoints = [endpoint for endpoint in self.poll_intervals if endpoint in endpoints]
+        try:
+            await self.refresh(endpoints)
+        except Exception as err:
+            _LOGGER.warning("Could not confirm the state of %s after a command: %s", self.serial, err)
+        # Only once the read is over, a confirmation cancelled during it leaves its endpoints to the next one
+        self._confirm_endpoints = set()
+
+    def _cancel_confirmation(self) -> None:
+        """Cancel a pending or running confirmation; its endpoints stay queued for the next one."""
+        if self._confirmation is not None:
+            self._confirmation.cancel()
+            self._confirmation = None
+
+    def shutdown(self) -> None:
+        """Cancel the background work of the device."""
+        self._cancel_confirmation()
 
     def build_sensors(self, coordinator: DataUpdateCoordinator[bool]) -> list[SensorEntity]:
         _LOGGER.debug("device has no sensors")
         return []
 
+    @property
+    def real_info(self) -> RealInfo:
+        return self._data.get("realInfo", RealInfo.EMPTY)
+
+    @property
+    def grain_status(self) -> GrainStatus:
+        return self._data.get("grainStatus", GrainStatus.EMPTY)
+
+    @property
+    def attribute_settings(self) -> AttributeSettings:
+        return self._data.get("getAttributeSetting", AttributeSettings.EMPTY)
+
+    @property
+    def feeding_plan_today(self) -> FeedingPlanToday:
+        return self._data.get("feedingPlanTodayNew", FeedingPlanToday.EMPTY)
+
+    @property
+    def wet_feeding_plan(self) -> WetFeedingPlan:
+        return self._data.get("wetFeedingPlan", WetFeedingPlan.EMPTY)
+
     @property
     def serial(self) -> str:
         return cast(str, self._data.get("deviceSn"))
@@ -68,6 +497,13 @@ class Device(Event):
     def software_version(self) -> str:
         return cast(str, self._data.get("softwareVersion"))
 
+    @property
+    def capability_profile(self) -> str | None:
+        """Return the model and firmware the API learns the supported endpoints of."""
+        if not self.model:
+            return None
+        return f"{self.model}/{self.software_version or 'unknown'}"
+
     @property
     def hardware_version(self) -> str:
         return cast(str, self._data.get("hardwareVersion"))
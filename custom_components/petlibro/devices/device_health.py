@@ -0,0 +1,71 @@
+"""Refresh health of a single PETLIBRO device."""
+
+from __future__ import annotations
+
+from time import monotonic
+
+from ..const import QUARANTINE_AFTER_FAILURES, QUARANTINE_MAX_SECONDS, QUARANTINE_MIN_SECONDS
+
+HEALTH_OK = "ok"
+HEALTH_FAILING = "failing"
+HEALTH_QUARANTINED = "quarantined"
+
+
+class DeviceHealth:
+    """Track the refresh failures of a device and quarantine it when they keep coming.
+
+    After ``QUARANTINE_AFTER_FAILURES`` failed refreshes in a row the device is only probed, first
+    after QUARANTINE_MIN_SECONDS, then at doubling intervals up to QUARANTINE_MAX_SECONDS. The first
+    successful refresh releases it.
+    """
+
+    def __init__(self) -> None:
+        self.consecutive_failures = 0
+        self.total_failures = 0
+        self.last_error: str | None = None
+        self._backoff = 0.0
+        self._probe_at = 0.0
+
+    @property
+    def quarantined(self) -> bool:
+        return bool(self._backoff)
+
+    @property
+    def state(self) -> str:
+        if self.quarantined:
+            return HEALTH_QUARANTINED
+        return HEALTH_FAILING if self.consecutive_failures else HEALTH_OK
+
+    def probe_due(self) -> bool:
+        """Return True when a quarantined device should be tried again."""
+        return monotonic() >= self._probe_at
+
+    def record_success(self) -> bool:
+        """Record a successful refresh and return True if it released the device from quarantine."""
+        released = self.quarantined
+        self.consecutive_failures = 0
+        self._backoff = 0.0
+        return released
+
+    def record_failure(self, error: BaseException) -> bool:
+        """Record a failed refresh and return True if it put the device in quarantine."""
+        self.consecutive_failures += 1
+        self.total_failures += 1
+        self.last_error = str(error) or type(error).__name__
+        if self.consecutive_failures < QUARANTINE_AFTER_FAILURES:
+            return False
+        entered = not self.quarantined
+        self._backoff = min(self._backoff * 2, QUARANTINE_MAX_SECONDS) if self._backoff else QUARANTINE_MIN_SECONDS
+        self._probe_at = monotonic() + self._backoff
+        return entered
+
+    @property
+    def stats(self) -> dict[str, float | int | str | None]:
+        """Return the health metrics."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.consecutive_failures,
+            "total_failures": self.total_failures,
+            "last_error": self.last_error,
+            "next_probe_in": round(max(0.0, self._probe_at - monotonic())) if self.quarantined else None,
+        }
@@ -0,0 +1,101 @@
+"""Serialized, prioritized access to a single PETLIBRO device."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from itertools import count
+from time import monotonic
+
+from ..exceptions import PetLibroQueueFullError
+
+PRIORITY_FEED = 0  # Manual feeding, the pet is waiting
+PRIORITY_SETTING = 1  # Other commands
+PRIORITY_READ = 2  # Polling and confirmation reads
+
+PRIORITY_NAMES = {
+    PRIORITY_FEED: "feed",
+    PRIORITY_SETTING: "setting",
+    PRIORITY_READ: "read",
+}
+
+
+class DeviceQueue:
+    """Run one command at a time on a device, the most urgent waiting one first.
+
+    Commands of the same priority run in arrival order. Reads wait until no command runs or waits,
+    then run alongside each other without holding the device: a read retrying a slow endpoint never
+    delays a command. At most ``max_depth`` operations may wait, further ones are rejected with
+    PetLibroQueueFullError.
+    """
+
+    def __init__(self, max_depth: int) -> None:
+        self.max_depth = max_depth
+        self._busy = False
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._sequence = count()
+        self.completed = {name: 0 for name in PRIORITY_NAMES.values()}
+        self.rejected = 0
+        self.max_wait = 0.0
+        self._total_wait = 0.0
+
+    @property
+    def depth(self) -> int:
+        """Return the number of operations waiting."""
+        return sum(1 for *_, waiter in self._waiters if not waiter.done())
+
+    @asynccontextmanager
+    async def slot(self, priority: int) -> AsyncIterator[None]:
+        """Wait for the device to be free for an operation of the given priority."""
+        read = priority == PRIORITY_READ
+        queued_at = monotonic()
+        if self._busy or self.depth:
+            if self.depth >= self.max_depth:
+                self.rejected += 1
+                raise PetLibroQueueFullError(f"Too many operations waiting for the device ({self.depth})")
+            waiter = asyncio.get_running_loop().create_future()
+            heapq.heappush(self._waiters, (priority, next(self._sequence), waiter))
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled() and not read:
+                    self._release()  # The slot was handed over just before the cancellation
+                raise
+        elif not read:
+            self._busy = True
+
+        wait = monotonic() - queued_at
+        self._total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        try:
+            yield
+        finally:
+            self.completed[PRIORITY_NAMES[priority]] += 1
+            if not read:
+                self._release()
+
+    def _release(self) -> None:
+        """Hand the device over to the most urgent waiting command, or let every waiting read run."""
+        while self._waiters:
+            priority, _, waiter = heapq.heappop(self._waiters)
+            if not waiter.done():
+                waiter.set_result(None)
+                if priority != PRIORITY_READ:
+                    return
+        self._busy = False
+
+    @property
+    def stats(self) -> dict[str, float]:
+        """Return the queue metrics."""
+        completed = sum(self.completed.values())
+        return {
+            "depth": self.depth,
+            "busy": self._busy,
+            **{f"completed_{name}": value for name, value in self.completed.items()},
+            "rejected": self.rejected,
+            "average_wait": round(self._total_wait / completed, 3) if completed else 0.0,
+            "max_wait": round(self.max_wait, 3),
+        }
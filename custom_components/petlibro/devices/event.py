@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Collection, Iterable
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -13,26 +13,32 @@ EVENT_UPDATE = "update"
 class Event:
     """Abstract event class properties and methods."""
 
-    _listeners: dict[str, list[Callable]] = field(default_factory=dict)
+    _listeners: dict[str, list[tuple[Callable, frozenset[str] | None]]] = field(default_factory=dict)
 
-    def emit(self, event_name: str, *args: Any, **kwargs: Any) -> None:
-        """Run all callbacks for an event."""
-        for listener in self._listeners.get(event_name, []):
+    def emit(self, event_name: str, *args: Any, changed: Collection[str] | None = None, **kwargs: Any) -> None:
+        """Run all callbacks for an event.
+
+        With ``changed``, callbacks registered for specific fields only run if one of them changed.
+        """
+        for listener, fields in list(self._listeners.get(event_name, [])):
+            if changed is not None and fields is not None and fields.isdisjoint(changed):
+                continue
             try:
                 listener(*args, **kwargs)
             except:  # pragma: no cover # pylint: disable=bare-except # noqa: E722
                 pass
 
     def on(  # pylint: disable=invalid-name
-        self, event_name: str, callback: Callable
+        self, event_name: str, callback: Callable, fields: Iterable[str] | None = None
     ) -> Callable:
-        """Register an event callback."""
+        """Register an event callback, optionally only for changes of some fields."""
         listeners: list = self._listeners.setdefault(event_name, [])
-        listeners.append(callback)
+        listener = (callback, frozenset(fields) if fields is not None else None)
+        listeners.append(listener)
 
         def unsubscribe() -> None:
             """Unsubscribe listeners."""
-            if callback in listeners:
-                listeners.remove(callback)
+            if listener in listeners:
+                listeners.remove(listener)
 
         return unsubscribe
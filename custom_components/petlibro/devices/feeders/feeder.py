@@ -2,6 +2,7 @@
 from typing import Optional, cast
 from . import Device
 from ..device import Device
+from ...const import POLL_STATUS_SECONDS
 
 
 UNITS = {
@@ -21,11 +22,9 @@ UNITS_RATIO = {
 class Feeder(Device):
     """Generic PETLIBRO feeder device"""
 
-    async def refresh(self):
-        await super().refresh()
-        self.update_data({
-            "feedingPlanTodayNew": await self.api.device_feeding_plan_today_new(self.serial)
-        })
+    NESTED_ENDPOINTS = {
+        "feedingPlanTodayNew": POLL_STATUS_SECONDS,
+    }
 
     @property
     def unit_id(self) -> int | None:
@@ -47,20 +46,17 @@ class Feeder(Device):
         return self._data.get("enableFeedingPlan", False)
 
     async def set_feeding_plan(self, value: bool):
-        await self.api.set_device_feeding_plan(self.serial, value)
-        await self.refresh()
+        await self.run_command("set_device_feeding_plan", value)
 
     @property
     def feeding_plan_today_all(self) -> bool:
-        return not cast(bool, self._data.get("feedingPlanTodayNew", {}).get("allSkipped"))
+        return not cast(bool, self.feeding_plan_today.all_skipped)
 
     async def set_feeding_plan_today_all(self, value: bool):
-        await self.api.set_device_feeding_plan_today_all(self.serial, value)
-        await self.refresh()
+        await self.run_command("set_device_feeding_plan_today_all", value)
 
     async def set_manual_feed(self):
-        await self.api.set_device_manual_feeding(self.serial)
-        await self.refresh()
+        await self.run_command("set_device_manual_feeding")
 
     def convert_unit(self, value: int) -> int:
         """
@@ -4,90 +4,80 @@ from ...api import make_api_call
 from aiohttp import ClientSession, ClientError
 from ...exceptions import PetLibroAPIError
 from ..device import Device
+from ..models import or_default
+from ...const import POLL_REALTIME_SECONDS, POLL_STATUS_SECONDS
 from typing import cast
-from logging import getLogger
+from ...log import get_logger
 
-_LOGGER = getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 class OneRFIDSmartFeeder(Device):
-    async def refresh(self):
-        """Refresh the device data from the API."""
-        try:
-            await super().refresh()  # This calls the refresh method in GranaryFeeder (which also inherits from Device)
-    
-            # Fetch specific data for this device
-            grain_status = await self.api.device_grain_status(self.serial)
-            real_info = await self.api.device_real_info(self.serial)
-            attribute_settings = await self.api.device_attribute_settings(self.serial)
-    
-            # Update internal data with fetched API data
-            self.update_data({
-                "grainStatus": grain_status or {},
-                "realInfo": real_info or {},
-                "getAttributeSetting": attribute_settings or {}
-            })
-        except PetLibroAPIError as err:
-            _LOGGER.error(f"Error refreshing data for OneRFIDSmartFeeder: {err}")
+    NESTED_ENDPOINTS = {
+        "grainStatus": POLL_STATUS_SECONDS,
+        "realInfo": POLL_REALTIME_SECONDS,
+        "feedingPlanTodayNew": POLL_STATUS_SECONDS,  # Feeding times for the realtime cadence
+        "getAttributeSetting": POLL_STATUS_SECONDS,
+    }
 
     @property
     def available(self) -> bool:
-        _LOGGER.debug(f"Device {self.device.name} availability: {self.device.online}")
+        _LOGGER.debug("Device %s availability: %s", self.device.name, self.device.online)
         return self.device.online if hasattr(self.device, 'online') else True
 
     @property
     def today_feeding_quantities(self) -> list[int]:
-        return self._data.get("grainStatus", {}).get("todayFeedingQuantities", [])
+        return self.grain_status.today_feeding_quantities
 
     @property
     def today_feeding_quantity(self) -> int:
-        return self._data.get("grainStatus", {}).get("todayFeedingQuantity", 0)
+        return self.grain_status.today_feeding_quantity
 
     @property
     def today_feeding_times(self) -> int:
-        return self._data.get("grainStatus", {}).get("todayFeedingTimes", 0)
+        return self.grain_status.today_feeding_times
 
     @property
     def today_eating_times(self) -> int:
-        return self._data.get("grainStatus", {}).get("todayEatingTimes", 0)
+        return self.grain_status.today_eating_times
 
     @property
     def today_eating_time(self) -> int:
-        return self._data.get("grainStatus", {}).get("petEatingTime", 0)
+        return self.grain_status.pet_eating_time
 
     @property
     def feeding_plan_state(self) -> bool:
         """Return the state of the feeding plan, based on API data."""
-        return bool(self._data.get("enableFeedingPlan", False))
+        return bool(self.real_info.enable_feeding_plan)
 
     @property
     def battery_state(self) -> str:
-        return cast(str, self._data.get("realInfo", {}).get("batteryState", "unknown"))
+        return cast(str, self.real_info.battery_state)
 
     @property
     def door_state(self) -> bool:
-        return bool(self._data.get("realInfo", {}).get("barnDoorState", False))
+        return bool(self.real_info.barn_door_state)
 
     @property
     def food_dispenser_state(self) -> bool:
-        return not bool(self._data.get("realInfo", {}).get("grainOutletState", True))
+        return not bool(self.real_info.grain_outlet_state)
 
     @property
     def door_blocked(self) -> bool:
-        return bool(self._data.get("realInfo", {}).get("barnDoorError", False))
+        return bool(or_default(self.real_info.barn_door_error, False))
 
     @property
     def food_low(self) -> bool:
-        return not bool(self._data.get("realInfo", {}).get("surplusGrain", True))
+        return not bool(self.real_info.surplus_grain)
 
     @property
     def unit_type(self) -> int:
-        return self._data.get("realInfo", {}).get("unitType", 1)
+        return or_default(self.real_info.unit_type, 1)
 
     @property
     def battery_display_type(self) -> float:
         """Get the battery percentage state."""
         try:
-            value = str(self._data.get("realInfo", {}).get("batteryDisplayType", "percentage"))
+            value = str(self.real_info.battery_display_type)
             # Attempt to convert the value to a float
             return cast(float, float(value))
         except (TypeError, ValueError):
@@ -96,260 +86,247 @@ class OneRFIDSmartFeeder(Device):
 
     @property
     def online(self) -> bool:
-        return bool(self._data.get("realInfo", {}).get("online", False))
+        return bool(self.real_info.online)
 
     @property
     def running_state(self) -> bool:
-        return self._data.get("realInfo", {}).get("runningState", "IDLE") == "RUNNING"
+        return or_default(self.real_info.running_state, "IDLE") == "RUNNING"
+
+    def is_active(self) -> bool:
+        return self.running_state
 
     @property
     def whether_in_sleep_mode(self) -> bool:
-        return bool(self._data.get("realInfo", {}).get("whetherInSleepMode", False))
+        return bool(self.real_info.whether_in_sleep_mode)
 
     @property
     def enable_low_battery_notice(self) -> bool:
-        return bool(self._data.get("realInfo", {}).get("enableLowBatteryNotice", False))
+        return bool(or_default(self.real_info.enable_low_battery_notice, False))
 
     @property
     def enable_power_change_notice(self) -> bool:
-        return bool(self._data.get("realInfo", {}).get("enablePowerChangeNotice", False))
+        return bool(self.real_info.enable_power_change_notice)
 
     @property
     def enable_grain_outlet_blocked_notice(self) -> bool:
-        return bool(self._data.get("realInfo", {}).get("enableGrainOutletBlockedNotice", False))
+        return bool(self.real_info.enable_grain_outlet_blocked_notice)
 
     @property
     def device_sn(self) -> str:
-        return self._data.get("realInfo", {}).get("deviceSn", "unknown")
+        return self.real_info.device_sn
 
     @property
     def mac_address(self) -> str:
-        return self._data.get("realInfo", {}).get("mac", "unknown")
+        return self.real_info.mac
 
     @property
     def wifi_ssid(self) -> str:
-        return self._data.get("realInfo", {}).get("wifiSsid", "unknown")
+        return or_default(self.real_info.wifi_ssid, "unknown")
 
     @property
     def wifi_rssi(self) -> int:
-        return self._data.get("realInfo", {}).get("wifiRssi", -100)
+        return self.real_info.wifi_rssi
 
     @property
     def electric_quantity(self) -> int:
-        return self._data.get("realInfo", {}).get("electricQuantity", 0)
+        return self.real_info.electric_quantity
 
     @property
     def enable_feeding_plan(self) -> bool:
-        return self._data.get("realInfo", {}).get("enableFeedingPlan", False)
+        return self.real_info.enable_feeding_plan
 
     @property
     def enable_sound(self) -> bool:
-        return self._data.get("realInfo", {}).get("enableSound", False)
+        return self.real_info.enable_sound
 
     @property
     def enable_light(self) -> bool:
-        return self._data.get("realInfo", {}).get("enableLight", False)
+        return self.real_info.enable_light
 
     @property
     def vacuum_state(self) -> bool:
-        return self._data.get("realInfo", {}).get("vacuumState", False)
+        return self.real_info.vacuum_state
 
     @property
     def pump_air_state(self) -> bool:
-        return self._data.get("realInfo", {}).get("pumpAirState", False)
+        return self.real_info.pump_air_state
 
     @property
     def cover_close_speed(self) -> str:
-        return self._data.get("realInfo", {}).get("coverCloseSpeed", "unknown")
+        return self.real_info.cover_close_speed
 
     @property
     def enable_re_grain_notice(self) -> bool:
-        return self._data.get("realInfo", {}).get("enableReGrainNotice", False)
+        return self.real_info.enable_re_grain_notice
 
     @property
     def child_lock_switch(self) -> bool:
-        return self._data.get("realInfo", {}).get("childLockSwitch", False)
+        return self.real_info.child_lock_switch
 
     @property
     def close_door_time_sec(self) -> int:
-        return self._data.get("realInfo", {}).get("closeDoorTimeSec", 0)
+        return self.real_info.close_door_time_sec
 
     @property
     def display_switch(self) -> bool:
-        return bool(self._data.get("realInfo", {}).get("screenDisplaySwitch", False))
+        return bool(self.real_info.screen_display_switch)
 
     @property
     def child_lock_switch(self) -> bool:
-        return not self._data.get("realInfo", {}).get("childLockSwitch", False)
+        return not self.real_info.child_lock_switch
 
     @property
     def remaining_desiccant(self) -> str:
         """Get the remaining desiccant days."""
-        return cast(str, self._data.get("remainingDesiccantDays", "unknown"))
+        return cast(str, or_default(self.real_info.remaining_desiccant_days, "unknown"))
     
     @property
     def desiccant_frequency(self) -> float:
-        return self._data.get("realInfo", {}).get("changeDesiccantFrequency", 0)
+        return self.real_info.change_desiccant_frequency
 
     async def set_desiccant_frequency(self, value: float) -> None:
-        _LOGGER.debug(f"Setting desiccant frequency to {value} for {self.serial}")
+        _LOGGER.debug("Setting desiccant frequency to %s for %s", value, self.serial)
         try:
-            await self.api.set_desiccant_frequency(self.serial, value)
-            await self.refresh()  # Refresh the state after the action
+            await self.run_command("set_desiccant_frequency", value)
         except aiohttp.ClientError as err:
-            _LOGGER.error(f"Failed to set desiccant frequency for {self.serial}: {err}")
+            _LOGGER.error("Failed to set desiccant frequency for %s: %s", self.serial, err)
             raise PetLibroAPIError(f"Error setting desiccantfrequency: {err}")
     def sound_switch(self) -> bool:
-        return self._data.get("realInfo", {}).get("soundSwitch", False)
+        return self.real_info.sound_switch
 
     @property
     def sound_level(self) -> float:
-        return self._data.get("getAttributeSetting", {}).get("volume", 0)
+        return self.attribute_settings.volume
 
     async def set_sound_level(self, value: float) -> None:
-        _LOGGER.debug(f"Setting sound level to {value} for {self.serial}")
+        _LOGGER.debug("Setting sound level to %s for %s", value, self.serial)
         try:
-            await self.api.set_sound_level(self.serial, value)
-            await self.refresh()  # Refresh the state after the action
+            await self.run_command("set_sound_level", value)
         except aiohttp.ClientError as err:
-            _LOGGER.error(f"Failed to set sound level for {self.serial}: {err}")
+            _LOGGER.error("Failed to set sound level for %s: %s", self.serial, err)
             raise PetLibroAPIError(f"Error setting sound level: {err}")
 
     # Error-handling updated for set_feeding_plan
     async def set_feeding_plan(self, value: bool) -> None:
-        _LOGGER.debug(f"Setting feeding plan to {value} for {self.serial}")
+        _LOGGER.debug("Setting feeding plan to %s for %s", value, self.serial)
         try:
-            await self.api.set_feeding_plan(self.serial, value)
-            await self.refresh()  # Refresh the state after the action
+            await self.run_command("set_feeding_plan", value)
         except aiohttp.ClientError as err:
-            _LOGGER.error(f"Failed to set feeding plan for {self.serial}: {err}")
+            _LOGGER.error("Failed to set feeding plan for %s: %s", self.serial, err)
             raise PetLibroAPIError(f"Error setting feeding plan: {err}")
 
     # Error-handling updated for set_child_lock
     async def set_child_lock(self, value: bool) -> None:
-        _LOGGER.debug(f"Setting child lock to {value} for {self.serial}")
+        _LOGGER.debug("Setting child lock to %s for %s", value, self.serial)
         try:
-            await self.api.set_child_lock(self.serial, value)
-            await self.refresh()  # Refresh the state after the action
+            await self.run_command("set_child_lock", value)
         except aiohttp.ClientError as err:
-            _LOGGER.error(f"Failed to set child lock for {self.serial}: {err}")
+            _LOGGER.error("Failed to set child lock for %s: %s", self.serial, err)
             raise PetLibroAPIError(f"Error setting child lock: {err}")
 
     # Error-handling updated for set_light_enable
     async def set_light_enable(self, value: bool) -> None:
-        _LOGGER.debug(f"Setting light enable to {value} for {self.serial}")
+        _LOGGER.debug("Setting light enable to %s for %s", value, self.serial)
         try:
-            await self.api.set_light_enable(self.serial, value)
-            await self.refresh()  # Refresh the state after the action
+            await self.run_command("set_light_enable", value)
         except aiohttp.ClientError as err:
-            _LOGGER.error(f"Failed to set light enable for {self.serial}: {err}")
+            _LOGGER.error("Failed to set light enable for %s: %s", self.serial, err)
             raise PetLibroAPIError(f"Error setting light enable: {err}")
 
     # Error-handling updated for set_light_switch
     async def set_light_switch(self, value: bool) -> None:
-        _LOGGER.debug(f"Setting light switch to {value} for {self.serial}")
+        _LOGGER.debug("Setting light switch to %s for %s", value, self.serial)
         try:
-            await self.api.set_light_switch(self.serial, value)
-            await self.refresh()  # Refresh the state after the action
+            await self.run_command("set_light_switch", value)
         except aiohttp.ClientError as err:
-            _LOGGER.error(f"Failed to set light switch for {self.serial}: {err}")
+            _LOGGER.error("Failed to set light switch for %s: %s", self.serial, err)
             raise PetLibroAPIError(f"Error setting light switch: {err}")
 
     # Error-handling updated for set_sound_enable
     async def set_sound_enable(self, value: bool) -> None:
-        _LOGGER.debug(f"Setting sound enable to {value} for {self.serial}")
+        _LOGGER.debug("Setting sound enable to %s for %s", value, self.serial)
         try:
-            await self.api.set_sound_enable(self.serial, value)
-            await self.refresh()  # Refresh the state after the action
+            await self.run_command("set_sound_enable", value)
         except aiohttp.ClientError as err:
-            _LOGGER.error(f"Failed to set sound enable for {self.serial}: {err}")
+            _LOGGER.error("Failed to set sound enable for %s: %s", self.serial, err)
             raise PetLibroAPIError(f"Error setting sound enable: {err}")
 
     # Error-handling updated for set_sound_switch
     async def set_sound_switch(self, value: bool) -> None:
-        _LOGGER.debug(f"Setting sound switch to {value} for {self.serial}")
+        _LOGGER.debug("Setting sound switch to %s for %s", value, self.serial)
         try:
-            await self.api.set_sound_switch(self.serial, value)
-            await self.refresh()  # Refresh the state after the action
+            await self.run_command("set_sound_switch", value)
         except aiohttp.ClientError as err:
-            _LOGGER.error(f"Failed to set sound switch for {self.serial}: {err}")
+            _LOGGER.error("Failed to set sound switch for %s: %s", self.serial, err)
             raise PetLibroAPIError(f"Error setting sound switch: {err}")
 
     # Method for manual feeding
     async def set_manual_feed(self) -> None:
-        _LOGGER.debug(f"Triggering manual feed for {self.serial}")
+        _LOGGER.debug("Triggering manual feed for %s", self.serial)
         try:
-            await self.api.set_manual_feed(self.serial)
-            await self.refresh()  # Refresh the state after the action
+            await self.run_command("set_manual_feed")
         except aiohttp.ClientError as err:
-            _LOGGER.error(f"Failed to trigger manual feed for {self.serial}: {err}")
+            _LOGGER.error("Failed to trigger manual feed for %s: %s", self.serial, err)
             raise PetLibroAPIError(f"Error triggering manual feed: {err}")
 
     # Method for setting the feeding plan
     async def set_feeding_plan(self, value: bool) -> None:
-        _LOGGER.debug(f"Setting feeding plan to {value} for {self.serial}")
+        _LOGGER.debug("Setting feeding plan to %s for %s", value, self.serial)
         try:
-            await self.api.set_feeding_plan(self.serial, value)
-            await self.refresh()  # Refresh the state after the action
+            await self.run_command("set_feeding_plan", value)
         except aiohttp.ClientError as err:
-            _LOGGER.error(f"Failed to set feeding plan for {self.serial}: {err}")
+            _LOGGER.error("Failed to set feeding plan for %s: %s", self.serial, err)
             raise PetLibroAPIError(f"Error setting feeding plan: {err}")
 
     # Method for manual lid opening
     async def set_manual_lid_open(self) -> None:
-        _LOGGER.debug(f"Triggering manual lid opening for {self.serial}")
+        _LOGGER.debug("Triggering manual lid opening for %s", self.serial)
         try:
-            await self.api.set_manual_lid_open(self.serial)
-            await self.refresh()  # Refresh the state after the action
+            await self.run_command("set_manual_lid_open")
         except aiohttp.ClientError as err:
-            _LOGGER.error(f"Failed to trigger manual lid opening for {self.serial}: {err}")
+            _LOGGER.error("Failed to trigger manual lid opening for %s: %s", self.serial, err)
             raise PetLibroAPIError(f"Error triggering manual lid opening: {err}")
 
     # Method for display turn on
     async def set_display_on(self) -> None:
-        _LOGGER.debug(f"Turning on the display matrix for {self.serial}")
+        _LOGGER.debug("Turning on the display matrix for %s", self.serial)
         try:
-            await self.api.set_display_on(self.serial)
-            await self.refresh()  # Refresh the state after the action
+            await self.run_command("set_display_on")
         except aiohttp.ClientError as err:
-            _LOGGER.error(f"Failed to turn on the display for {self.serial}: {err}")
+            _LOGGER.error("Failed to turn on the display for %s: %s", self.serial, err)
             raise PetLibroAPIError(f"Error turning on the display: {err}")
 
     # Method for display matrix turn off
     async def set_display_off(self) -> None:
-        _LOGGER.debug(f"Turning off the display for {self.serial}")
+        _LOGGER.debug("Turning off the display for %s", self.serial)
         try:
-            await self.api.set_display_off(self.serial)
-            await self.refresh()  # Refresh the state after the action
+            await self.run_command("set_display_off")
         except aiohttp.ClientError as err:
-            _LOGGER.error(f"Failed to turn off the display for {self.serial}: {err}")
+            _LOGGER.error("Failed to turn off the display for %s: %s", self.serial, err)
             raise PetLibroAPIError(f"Error turning off the display: {err}")
 
     # Method for sound turn on
     async def set_sound_on(self) -> None:
-        _LOGGER.debug(f"Turning on the sound for {self.serial}")
+        _LOGGER.debug("Turning on the sound for %s", self.serial)
         try:
-            await self.api.set_sound_on(self.serial)
-            await self.refresh()  # Refresh the state after the action
+            await self.run_command("set_sound_on")
         except aiohttp.ClientError as err:
-            _LOGGER.error(f"Failed to turn on the sound for {self.serial}: {err}")
+            _LOGGER.error("Failed to turn on the sound for %s: %s", self.serial, err)
             raise PetLibroAPIError(f"Error turning on the sound: {err}")
 
     # Method for sound turn off
     async def set_sound_off(self) -> None:
-        _LOGGER.debug(f"Turning off the sound for {self.serial}")
+        _LOGGER.debug("Turning off the sound for %s", self.serial)
         try:
-            await self.api.set_sound_off(self.serial)
-            await self.refresh()  # Refresh the state after the action
+            await self.run_command("set_sound_off")
         except aiohttp.ClientError as err:
-            _LOGGER.error(f"Failed to turn off the sound for {self.serial}: {err}")
+            _LOGGER.error("Failed to turn off the sound for %s: %s", self.serial, err)
             raise PetLibroAPIError(f"Error turning off the sound: {err}")
 
     async def set_desiccant_reset(self) -> None:
-        _LOGGER.debug(f"Triggering desiccant reset for {self.serial}")
+        _LOGGER.debug("Triggering desiccant reset for %s", self.serial)
         try:
-            await self.api.set_desiccant_reset(self.serial)
-            await self.refresh()  # Refresh the state after the action
+            await self.run_command("set_desiccant_reset")
         except aiohttp.ClientError as err:
-            _LOGGER.error(f"Failed to trigger desiccant reset for {self.serial}: {err}")
+            _LOGGER.error("Failed to trigger desiccant reset for %s: %s", self.serial, err)
             raise PetLibroAPIError(f"Error triggering desiccant reset: {err}")
\ No newline at end of file
@@ -1,5 +1,5 @@
 from datetime import datetime
-from logging import getLogger
+from ...log import Payload, get_logger
 from typing import Any
 from zoneinfo import ZoneInfo
 
@@ -8,33 +8,58 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 from typing_extensions import override
 
 from ..device import Device
+from ..models import or_default
+from ..event import EVENT_UPDATE
+from ...const import POLL_REALTIME_SECONDS, POLL_STATIC_SECONDS, POLL_STATUS_SECONDS
 from .wet_feeding_entities import WetFeedingPlanPlateSensorEntity
 from ...exceptions import PetLibroAPIError
 from ...sensor import PetLibroSensorEntity, PetLibroDescribedSensorEntity, PetLibroSensorEntityDescription
 
-_LOGGER = getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 
 class PolarWetFoodFeeder(Device):
+    NESTED_ENDPOINTS = {
+        "grainStatus": POLL_STATUS_SECONDS,
+        "realInfo": POLL_REALTIME_SECONDS,
+        "feedingPlanTemplates": POLL_STATIC_SECONDS,
+        "wetFeedingPlan": POLL_STATUS_SECONDS,
+    }
+
+    def __init__(self, data: dict, api):
+        super().__init__(data, api)
+        self._last_plate_position = self.plate_position
+        self.on(EVENT_UPDATE, self._check_plate_rotation, ("realInfo",))
+
+    def _check_plate_rotation(self) -> None:
+        """Read the plan and counters right after the plate rotated, a plate was served or closed."""
+        previous, self._last_plate_position = self._last_plate_position, self.plate_position
+        if previous is not None and self.plate_position != previous:
+            endpoints = ("wetFeedingPlan", "grainStatus")
+            self.api.invalidate_device_cache(self.serial, endpoints)  # Cached before the rotation
+            self.confirm_later(endpoints)
+
     @override
-    async def refresh(self):
-        """Refresh the device data from the API."""
-        try:
-            await super().refresh()
-
-            grain_status = await self.api.device_grain_status(self.serial)
-            real_info = await self.api.device_real_info(self.serial)
-            feeding_plan_templates = await self.api.device_feeding_plan_templates(self.serial)
-            wet_feeding_plan = await self.api.device_wet_feeding_plan(self.serial)
-
-            self.update_data({
-                "grainStatus": grain_status or {},
-                "realInfo": real_info or {},
-                "feedingPlanTemplates": feeding_plan_templates or {},
-                "wetFeedingPlan": wet_feeding_plan or {},
-            })
-        except PetLibroAPIError as err:
-            _LOGGER.error("Error refreshing data for PolarWetFoodFeeder", err)
+    def expected_events(self) -> list[datetime]:
+        """Return the start and end of every plate in the active plan and of the next feeding."""
+        device_timezone = self._data.get("timezone")
+        times = [
+            (plate.get(key), plate.get("timezone", device_timezone))
+            for plate in self.wet_feeding_plan.plan
+            for key in ("executionStartTime", "executionEndTime")
+        ]
+        next_day = self._next_feeding("next_feeding_day", "nextFeedingDay")
+        for attribute, key in (("next_feeding_time", "nextFeedingTime"), ("next_feeding_end_time", "nextFeedingEndTime")):
+            if next_day and (raw_time := self._next_feeding(attribute, key)):
+                times.append((f"{next_day} {raw_time}", device_timezone))
+
+        events = []
+        for raw_time, raw_timezone in times:
+            try:
+                events.append(datetime.strptime(raw_time, "%Y-%m-%d %H:%M").replace(tzinfo=ZoneInfo(raw_timezone)))
+            except (TypeError, ValueError, KeyError):
+                continue
+        return events
 
     @override
     def build_sensors(self, coordinator: DataUpdateCoordinator) -> list[PetLibroSensorEntity]:
@@ -49,18 +74,21 @@ class PolarWetFoodFeeder(Device):
                 for description in [
                 PetLibroSensorEntityDescription[PolarWetFoodFeeder](
                     key="device_sn",
+                    fields=frozenset({"deviceSn"}),
                     translation_key="device_sn",
                     icon="mdi:identifier",
                     name="Device SN"
                 ),
                 PetLibroSensorEntityDescription[PolarWetFoodFeeder](
                     key="mac",
+                    fields=frozenset({"mac"}),
                     translation_key="mac_address",
                     icon="mdi:network",
                     name="MAC Address"
                 ),
                 PetLibroSensorEntityDescription[PolarWetFoodFeeder](
                     key="wifi_rssi",
+                    fields=frozenset({"realInfo"}),
                     translation_key="wifi_rssi",
                     icon="mdi:wifi",
                     native_unit_of_measurement="dBm",
@@ -70,18 +98,21 @@ class PolarWetFoodFeeder(Device):
                 ),
                 PetLibroSensorEntityDescription[PolarWetFoodFeeder](
                     key="wifi_ssid",
+                    fields=frozenset({"realInfo"}),
                     translation_key="wifi_ssid",
                     icon="mdi:wifi",
                     name="Wi-Fi SSID"
                 ),
                 PetLibroSensorEntityDescription[PolarWetFoodFeeder](
                     key="battery_state",
+                    fields=frozenset({"realInfo"}),
                     translation_key="battery_state",
                     icon="mdi:battery",
                     name="Battery Level"
                 ),
                 PetLibroSensorEntityDescription[PolarWetFoodFeeder](
                     key="electric_quantity",
+                    fields=frozenset({"realInfo"}),
                     translation_key="electric_quantity",
                     icon="mdi:battery",
                     native_unit_of_measurement="%",
@@ -91,6 +122,7 @@ class PolarWetFoodFeeder(Device):
                 ),
                 PetLibroSensorEntityDescription[PolarWetFoodFeeder](
                     key="feeding_plan_state",
+                    fields=frozenset({"realInfo"}),
                     translation_key="feeding_plan",
                     icon="mdi:calendar-check",
                     name="Feeding Plan",
@@ -98,6 +130,7 @@ class PolarWetFoodFeeder(Device):
                 ),
                 PetLibroSensorEntityDescription[PolarWetFoodFeeder](
                     key="next_feeding_time",
+                    fields=frozenset({"realInfo", "nextFeedingTime", "nextFeedingDay", "timezone"}),
                     translation_key="next_feeding_time",
                     icon="mdi:clock-outline",
                     name="Feeding Begins",
@@ -105,6 +138,7 @@ class PolarWetFoodFeeder(Device):
                 ),
                 PetLibroSensorEntityDescription[PolarWetFoodFeeder](
                     key="next_feeding_end_time",
+                    fields=frozenset({"realInfo", "nextFeedingEndTime", "nextFeedingDay", "timezone"}),
                     translation_key="next_feeding_end_time",
                     icon="mdi:clock-end",
                     name="Feeding Ends",
@@ -112,6 +146,7 @@ class PolarWetFoodFeeder(Device):
                 ),
                 PetLibroSensorEntityDescription[PolarWetFoodFeeder](
                     key="plate_position",
+                    fields=frozenset({"realInfo"}),
                     translation_key="plate_position",
                     icon="mdi:rotate-3d-variant",
                     name="Plate Position",
@@ -119,6 +154,7 @@ class PolarWetFoodFeeder(Device):
                 ),
                 PetLibroSensorEntityDescription[PolarWetFoodFeeder](
                     key="active_feeding_plan_name",
+                    fields=frozenset({"wetFeedingPlan"}),
                     translation_key="active_feeding_plan_name",
                     icon="mdi:notebook",
                     name="Active feeding plan"
@@ -127,19 +163,23 @@ class PolarWetFoodFeeder(Device):
             ),
         ]
 
+    def _next_feeding(self, attribute: str, key: str) -> str | None:
+        """Return a next feeding field from realInfo, or from the device list entry the device was loaded from."""
+        return or_default(getattr(self.real_info, attribute), self._data.get(key))
+
     def _get_feeding_plan_plate(self, plate_index: int) -> dict[str, Any] | None:
         result = None
-        _LOGGER.debug("Polar: Checking plans: %s", self._data.get("wetFeedingPlan", {}).get("plan", []))
-        for plate in self._data.get("wetFeedingPlan", {}).get("plan", []):
-            _LOGGER.debug("Polar: plate: %s (%s)", plate.get("plate"), type(plate.get("plate")))
+        _LOGGER.device_debug(self.serial, "Polar: Checking plans: %s", Payload(self.wet_feeding_plan.plan))
+        for plate in self.wet_feeding_plan.plan:
+            _LOGGER.device_debug(self.serial, "Polar: plate: %s (%s)", plate.get("plate"), type(plate.get("plate")))
             if plate.get("plate") == plate_index:
                 result = plate
-        _LOGGER.debug("Polar: Plan for plate %s: %s", plate_index, result)
+        _LOGGER.device_debug(self.serial, "Polar: Plan for plate %s: %s", plate_index, Payload(result))
         return result
 
     @property
     def battery_state(self) -> str | None:
-        return self._data.get("batteryState")
+        return self.real_info.battery_state
 
     @property
     def device_sn(self) -> str:
@@ -148,29 +188,29 @@ class PolarWetFoodFeeder(Device):
 
     @property
     def door_blocked(self) -> bool | None:
-        return self._data.get("realInfo", {}).get("barnDoorError")
+        return self.real_info.barn_door_error
 
     @property
     def electric_quantity(self) -> int | None:
         """Electric quantity (battery percentage or power state)."""
-        return self._data.get("electricQuantity")
+        return self.real_info.electric_quantity
 
     @property
     def feeding_plan_state(self) -> bool | None:
         """Return the state of the feeding plan."""
-        return self._data.get("enableFeedingPlan")
+        return self.real_info.enable_feeding_plan
 
     @property
     def active_feeding_plan_name(self) -> str | None:
         """Returns the name of the currently active feeding plan"""
-        return self._data.get("wetFeedingPlan", {}).get("templateName")
+        return self.wet_feeding_plan.template_name
 
     @property
     def next_feeding_time(self) -> datetime | None:
         """Returns the next feeding start date/time as native datetime object. Will return None, if the date/time is
         not parsable."""
-        raw_time = self._data.get("nextFeedingTime")
-        raw_date = self._data.get("nextFeedingDay")
+        raw_time = self._next_feeding("next_feeding_time", "nextFeedingTime")
+        raw_date = self._next_feeding("next_feeding_day", "nextFeedingDay")
         raw_timezone = self._data.get("timezone")
         if None in (raw_time, raw_date, raw_timezone):
             _LOGGER.error("One of the time values is not available: raw_time=%s raw_date=%s raw_timezone=%s", raw_time, raw_date, raw_timezone)
@@ -188,8 +228,8 @@ class PolarWetFoodFeeder(Device):
         """Returns the next feeding start date/time as native datetime object. Will return None, if the date/time is
         not parsable. Assumes that the end time occurs on the same date as the start time, because the API does not
         support feeding times beyond midnight."""
-        raw_time = self._data.get("nextFeedingEndTime")
-        raw_date = self._data.get("nextFeedingDay")
+        raw_time = self._next_feeding("next_feeding_end_time", "nextFeedingEndTime")
+        raw_date = self._next_feeding("next_feeding_day", "nextFeedingDay")
         raw_timezone = self._data.get("timezone")
         if None in (raw_time, raw_date, raw_timezone):
             _LOGGER.error("One of the time values is not available: raw_time=%s raw_date=%s raw_timezone=%s", raw_time, raw_date, raw_timezone)
@@ -205,32 +245,32 @@ class PolarWetFoodFeeder(Device):
     @property
     def online(self) -> bool | None:
         """Returns the online status of the device."""
-        return self._data.get("online")
+        return self.real_info.online
 
     @property
     def online_list(self) -> list:
         """Returns a list of online status records with timestamps."""
-        return self._data.get("realInfo", {}).get("onlineList", [])
+        return self.real_info.online_list
 
     @property
     def plate_position(self) -> int | None:
         """Returns the current position of the plate, if applicable."""
-        return self._data.get("realInfo", {}).get("platePosition")
+        return self.real_info.plate_position
 
     @property
     def unit_type(self) -> int | None:
-        return self._data.get("realInfo", {}).get("unitType")
+        return self.real_info.unit_type
 
     @property
     def enable_low_battery_notice(self) -> bool | None:
-        return self._data.get("realInfo", {}).get("enableLowBatteryNotice")
+        return self.real_info.enable_low_battery_notice
 
     @property
     def wifi_rssi(self) -> int | None:
         """Returns the Wi-Fi's RSSI, also known as signal strength"""
-        return self._data.get("wifiRssi")
+        return self.real_info.wifi_rssi
 
     @property
     def wifi_ssid(self) -> str | None:
         """Returns the Wi-Fi's SSID, also known as the name"""
-        return self._data.get("realInfo", {}).get("wifiSsid")
+        return self.real_info.wifi_ssid
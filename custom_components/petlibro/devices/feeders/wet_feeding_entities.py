@@ -1,7 +1,7 @@
 from datetime import datetime, date
 from decimal import Decimal
 from enum import Enum
-from logging import getLogger
+from ...log import get_logger
 from typing import Any
 from zoneinfo import ZoneInfo
 
@@ -15,7 +15,7 @@ from ...sensor import PetLibroSensorEntity
 
 type NativeValueType = StateType | date | datetime | Decimal
 
-_LOGGER = getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 
 # The value is how the API defines the state
@@ -76,7 +76,7 @@ class WetFeedingPlanPlateSensorEntity(PetLibroSensorEntity[_DeviceT]):
         try:
             return PlateState(state).name
         except ValueError as err:
-            _LOGGER.error("Unexpected plate state received: %s", state, err)
+            _LOGGER.error("Unexpected plate state received: %s (%s)", state, err)
             return None
 
     @property
@@ -4,51 +4,45 @@ from ...api import make_api_call
 from aiohttp import ClientSession, ClientError
 from ...exceptions import PetLibroAPIError
 from ..device import Device
+from ..models import or_default
+from ...const import POLL_REALTIME_SECONDS
 from typing import cast
-from logging import getLogger
+from ...log import get_logger
 
-_LOGGER = getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 class DockstreamSmartRFIDFountain(Device):
     """Represents the Dockstream Smart RFID Fountain device."""
 
-    async def refresh(self):
-        """Refresh the device data from the API."""
-        await super().refresh()  # Call the refresh method from the parent class (Device)
-        
-        # Fetch real info from the API
-        real_info = await self.api.device_real_info(self.serial)
-
-        # Update internal data with fetched API data
-        self.update_data({
-            "realInfo": real_info or {}
-        })
+    NESTED_ENDPOINTS = {
+        "realInfo": POLL_REALTIME_SECONDS,
+    }
 
     @property
     def available(self) -> bool:
-        _LOGGER.debug(f"Device {self.device.name} availability: {self.device.online}")
+        _LOGGER.debug("Device %s availability: %s", self.device.name, self.device.online)
         return self.device.online if hasattr(self.device, 'online') else True
 
     @property
     def device_sn(self) -> str:
         """Return the device serial number."""
-        return self._data.get("realInfo", {}).get("deviceSn", "unknown")
+        return self.real_info.device_sn
 
     @property
     def wifi_ssid(self) -> str:
         """Return the Wi-Fi SSID of the device."""
-        return self._data.get("realInfo", {}).get("wifiSsid", "unknown")
+        return or_default(self.real_info.wifi_ssid, "unknown")
 
     @property
     def online(self) -> bool:
         """Return the online status of the fountain."""
-        return bool(self._data.get("realInfo", {}).get("online", False))
+        return bool(self.real_info.online)
     
     @property
     def battery_display_type(self) -> float:
         """Get the battery percentage state."""
         try:
-            value = str(self._data.get("realInfo", {}).get("batteryDisplayType", "percentage"))
+            value = str(self.real_info.battery_display_type)
             # Attempt to convert the value to a float
             return cast(float, float(value))
         except (TypeError, ValueError):
@@ -58,94 +52,91 @@ class DockstreamSmartRFIDFountain(Device):
     @property
     def wifi_rssi(self) -> int:
         """Get the Wi-Fi signal strength."""
-        return self._data.get("realInfo", {}).get("wifiRssi", -100)
+        return self.real_info.wifi_rssi
     
     @property
     def weight(self) -> float:
         """Get the current weight of the water (in grams)."""
-        return self._data.get("realInfo", {}).get("weight", 0.0)
+        return self.real_info.weight
     
     @property
     def weight_percent(self) -> int:
         """Get the current weight percentage of water."""
-        return self._data.get("realInfo", {}).get("weightPercent", 0)
+        return self.real_info.weight_percent
     
     @property
     def remaining_filter_days(self) -> int:
         """Get the number of days remaining for the filter replacement."""
-        return self._data.get("realInfo", {}).get("remainingReplacementDays", 0)
+        return self.real_info.remaining_replacement_days
     
     @property
     def remaining_cleaning_days(self) -> int:
         """Get the number of days remaining for machine cleaning."""
-        return self._data.get("realInfo", {}).get("remainingCleaningDays", 0)
+        return self.real_info.remaining_cleaning_days
     
     @property
     def vacuum_state(self) -> bool:
         """Check if the vacuum state is active."""
-        return self._data.get("realInfo", {}).get("vacuumState", False)
+        return self.real_info.vacuum_state
     
     @property
     def pump_air_state(self) -> bool:
         """Check if the air pump is active."""
-        return self._data.get("realInfo", {}).get("pumpAirState", False)
+        return self.real_info.pump_air_state
     
     @property
     def barn_door_error(self) -> bool:
         """Check if there's a barn door error."""
-        return self._data.get("realInfo", {}).get("barnDoorError", False)
+        return or_default(self.real_info.barn_door_error, False)
     
     @property
     def running_state(self) -> str:
         """Get the current running state of the device."""
-        return self._data.get("realInfo", {}).get("runningState", "unknown")
+        return or_default(self.real_info.running_state, "unknown")
     
     @property
     def light_switch(self) -> bool:
         """Check if the light is enabled."""
-        return self._data.get("realInfo", {}).get("lightSwitch", False)
+        return self.real_info.light_switch
     
     @property
     def sound_switch(self) -> bool:
         """Check if the sound is enabled."""
-        return self._data.get("realInfo", {}).get("soundSwitch", False)
+        return self.real_info.sound_switch
     
     async def set_light_switch(self, value: bool):
         """Enable or disable the light."""
-        await self.api.set_light_switch(self.serial, value)
-        await self.refresh()
+        await self.run_command("set_light_switch", value)
     
     async def set_sound_switch(self, value: bool):
         """Enable or disable the sound."""
-        await self.api.set_sound_switch(self.serial, value)
-        await self.refresh()
+        await self.run_command("set_sound_switch", value)
     
     async def set_manual_cleaning(self):
         """Trigger manual cleaning action."""
-        await self.api.set_manual_cleaning(self.serial)
-        await self.refresh()
+        await self.run_command("set_manual_cleaning")
     
     @property
     def today_total_ml(self) -> int:
         """Get the total milliliters of water used today."""
-        return self._data.get("realInfo", {}).get("todayTotalMl", 0)
+        return self.real_info.today_total_ml
     
     @property
     def use_water_interval(self) -> int:
         """Get the water usage interval."""
-        return self._data.get("realInfo", {}).get("useWaterInterval", 0)
+        return self.real_info.use_water_interval
     
     @property
     def use_water_duration(self) -> int:
         """Get the water usage duration."""
-        return self._data.get("realInfo", {}).get("useWaterDuration", 0)
+        return self.real_info.use_water_duration
     
     @property
     def filter_replacement_frequency(self) -> int:
         """Get the filter replacement frequency."""
-        return self._data.get("realInfo", {}).get("filterReplacementFrequency", 0)
+        return self.real_info.filter_replacement_frequency
     
     @property
     def machine_cleaning_frequency(self) -> int:
         """Get the machine cleaning frequency."""
-        return self._data.get("realInfo", {}).get("machineCleaningFrequency", 0)
+        return self.real_info.machine_cleaning_frequency
@@ -0,0 +1,194 @@
+"""Typed state of the PETLIBRO device endpoints.
+
+Each endpoint response is parsed once into a frozen, slotted dataclass. Payload keys map to the
+snake_case attribute names, values are coerced to the annotated type and missing or invalid values
+fall back to the attribute default. Keys without an attribute are dropped.
+"""
+
+from __future__ import annotations
+
+import types
+
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass, field, fields
+from typing import Any, ClassVar, TypeVar, Union, get_args, get_origin, get_type_hints
+
+from ..log import get_logger
+
+_LOGGER = get_logger(__name__)
+
+_ModelT = TypeVar("_ModelT", bound="EndpointModel")
+_T = TypeVar("_T")
+
+_COERCERS: dict[type, Callable[[Any], Any]] = {
+    bool: bool,
+    int: int,
+    float: float,
+    str: str,
+    list: list,
+    dict: dict,
+}
+
+
+def _payload_key(name: str) -> str:
+    """Return the camelCase payload key of a snake_case attribute."""
+    first, *rest = name.split("_")
+    return first + "".join(part.title() for part in rest)
+
+
+def _coercer(annotation: Any) -> Callable[[Any], Any]:
+    """Return the function converting a payload value to an annotated type."""
+    if get_origin(annotation) in (Union, types.UnionType):
+        annotation = next(arg for arg in get_args(annotation) if arg is not type(None))
+    return _COERCERS.get(get_origin(annotation) or annotation, lambda value: value)
+
+
+def or_default(value: _T | None, default: _T) -> _T:
+    """Return the value, or the default when the API did not send it."""
+    return default if value is None else value
+
+
+class EndpointModel:
+    """Base class of the endpoint models."""
+
+    __slots__ = ()
+
+    # (attribute, payload key, coercer) of every attribute, set by endpoint_model
+    _PARSERS: ClassVar[tuple[tuple[str, str, Callable[[Any], Any]], ...]] = ()
+    # The model with every attribute at its default, used before the endpoint was fetched
+    EMPTY: ClassVar[Any]
+
+    @classmethod
+    def from_payload(cls: type[_ModelT], payload: Mapping[str, Any] | None) -> _ModelT:
+        """Parse an endpoint response."""
+        values = {}
+        for name, key, coerce in cls._PARSERS:
+            value = payload.get(key) if payload else None
+            if value is None:
+                continue
+            try:
+                values[name] = coerce(value)
+            except (TypeError, ValueError):
+                _LOGGER.debug("Ignoring invalid %s value %r in %s", key, value, cls.__name__)
+        return cls(**values)
+
+
+def endpoint_model(cls: type[_ModelT]) -> type[_ModelT]:
+    """Turn a class into a frozen, slotted endpoint model."""
+    cls = dataclass(frozen=True, slots=True)(cls)
+    hints = get_type_hints(cls)
+    cls._PARSERS = tuple(
+        (model_field.name, _payload_key(model_field.name), _coercer(hints[model_field.name]))
+        for model_field in fields(cls)
+    )
+    cls.EMPTY = cls()
+    return cls
+
+
+@endpoint_model
+class RealInfo(EndpointModel):
+    """Live state from /device/device/realInfo."""
+
+    barn_door_error: bool | None = None
+    barn_door_state: bool = False
+    battery_display_type: str = "percentage"
+    battery_state: str = "unknown"
+    change_desiccant_frequency: int = 0
+    child_lock_switch: bool = False
+    close_door_time_sec: int = 0
+    cover_close_speed: str = "unknown"
+    device_sn: str = "unknown"
+    electric_quantity: int = 0
+    enable_feeding_plan: bool = False
+    enable_grain_outlet_blocked_notice: bool = False
+    enable_light: bool = False
+    enable_low_battery_notice: bool | None = None
+    enable_power_change_notice: bool = False
+    enable_re_grain_notice: bool = False
+    enable_sound: bool = False
+    enable_video_record: bool = False
+    filter_replacement_frequency: int = 0
+    grain_outlet_state: bool = True
+    light_switch: bool = False
+    mac: str = "unknown"
+    machine_cleaning_frequency: int = 0
+    next_feeding_day: str | None = None
+    next_feeding_end_time: str | None = None
+    next_feeding_time: str | None = None
+    night_vision: str = "unknown"
+    online: bool = False
+    online_list: list = field(default_factory=list)
+    plate_position: int | None = None
+    pump_air_state: bool = False
+    remaining_cleaning_days: int = 0
+    remaining_desiccant_days: int | None = None
+    remaining_replacement_days: int = 0
+    resolution: str = "unknown"
+    running_state: str | None = None
+    screen_display_switch: bool = False
+    sound_switch: bool = False
+    surplus_grain: bool = True
+    today_total_ml: int = 0
+    unit_type: int | None = None
+    use_water_duration: int = 0
+    use_water_interval: int = 0
+    vacuum_state: bool = False
+    video_record_mode: str = "unknown"
+    video_record_switch: bool = False
+    weight: float = 0.0
+    weight_percent: int = 0
+    whether_in_sleep_mode: bool = False
+    wifi_rssi: int = -100
+    wifi_ssid: str | None = None
+
+
+@endpoint_model
+class GrainStatus(EndpointModel):
+    """Feeding counters from /device/data/grainStatus."""
+
+    today_feeding_quantities: list[int] = field(default_factory=list)
+    today_feeding_quantity: int = 0
+    today_feeding_times: int = 0
+    today_eating_times: int = 0
+    pet_eating_time: int = 0
+
+
+@endpoint_model
+class AttributeSettings(EndpointModel):
+    """Settings from /device/setting/getAttributeSetting."""
+
+    volume: int = 0
+
+
+@endpoint_model
+class FeedingPlanToday(EndpointModel):
+    """Today's feeding plan from /device/feedingPlan/todayNew."""
+
+    all_skipped: bool | None = None
+    plans: list[dict] = field(default_factory=list)
+
+
+@endpoint_model
+class WetFeedingPlan(EndpointModel):
+    """Active wet feeding plan from /device/wetFeedingPlan/wetListV3."""
+
+    template_name: str | None = None
+    plan: list[dict] = field(default_factory=list)
+
+
+# Models of the endpoints stored under their name; other endpoints are stored as received
+ENDPOINT_MODELS: dict[str, type[EndpointModel]] = {
+    "realInfo": RealInfo,
+    "getAttributeSetting": AttributeSettings,
+    "grainStatus": GrainStatus,
+    "feedingPlanTodayNew": FeedingPlanToday,
+    "wetFeedingPlan": WetFeedingPlan,
+}
+
+
+def parse_endpoint(endpoint: str, payload: Any) -> Any:
+    """Parse a response into the model of its endpoint, if it has one."""
+    model = ENDPOINT_MODELS.get(endpoint)
+    if model is None:
+        return payload or {}
+    return model.from_payload(payload)
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from functools import cached_property
 from typing import Generic, TypeVar
 
+from homeassistant.core import callback
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.entity import EntityDescription
 from homeassistant.helpers.update_coordinator import CoordinatorEntity, DataUpdateCoordinator
@@ -30,6 +32,7 @@ class PetLibroEntity(
         super().__init__(coordinator)
         self.device = device
         self._attr_unique_id = f"{self.device.serial}-{key}"
+        self._last_update_success: bool | None = None
 
     @cached_property
     def device_info(self) -> DeviceInfo | None:
@@ -47,7 +50,20 @@ class PetLibroEntity(
     async def async_added_to_hass(self) -> None:
         """Set up a listener for the entity."""
         await super().async_added_to_hass()
-        self.async_on_remove(self.device.on(EVENT_UPDATE, self.async_write_ha_state))
+        fields = getattr(getattr(self, "entity_description", None), "fields", None)
+        self.async_on_remove(self.device.on(EVENT_UPDATE, self.async_write_ha_state, fields))
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state only when the update result changed, data changes arrive through EVENT_UPDATE."""
+        last_update_success = getattr(self.coordinator, "last_update_success", True)
+        if last_update_success != self._last_update_success:
+            self._last_update_success = last_update_success
+            self.async_write_ha_state()
+
+@dataclass(frozen=True)
 class PetLibroEntityDescription(EntityDescription, Generic[_DeviceT]):
     """PETLIBRO Entity description"""
+
+    # Device data keys the entity reads; it only updates when one of them changes. None means any key.
+    fields: frozenset[str] | None = None
@@ -11,3 +11,35 @@ class PetLibroCannotConnect(PetLibroAPIError):
 
 class PetLibroInvalidAuth(PetLibroAPIError):
     """Error to indicate there is invalid auth."""
+
+
+class PetLibroRateLimitedError(PetLibroAPIError):
+    """Error to indicate the API rejected a request with 429 Too Many Requests."""
+
+    def __init__(self, message: str, retry_after: float) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class PetLibroHTTPStatusError(PetLibroAPIError):
+    """Error to indicate the API answered with an unexpected HTTP status."""
+
+    def __init__(self, message: str, status: int) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+class PetLibroResponseCodeError(PetLibroAPIError):
+    """Error to indicate the API answered with a non-zero response code."""
+
+    def __init__(self, message: str, code: int | None) -> None:
+        super().__init__(message)
+        self.code = code
+
+
+class PetLibroCircuitOpenError(PetLibroCannotConnect):
+    """Error to indicate requests are not sent because the API keeps failing."""
+
+
+class PetLibroQueueFullError(PetLibroAPIError):
+    """Error to indicate too many operations are already waiting for a device."""
@@ -1,22 +1,25 @@
 import asyncio
 
-from logging import getLogger
+from .log import get_logger
 from asyncio import gather
-from collections.abc import Mapping
+from collections.abc import Callable, Mapping
 from typing import List, Any, Optional
 from datetime import datetime, timedelta
-from .const import UPDATE_INTERVAL_SECONDS
+from .const import UPDATE_INTERVAL_SECONDS, POLL_BURST_SECONDS
+from .const import CAPABILITY_SAVE_DELAY_SECONDS, CAPABILITY_STORE_KEY, CAPABILITY_STORE_VERSION
 from homeassistant.core import HomeAssistant
 from homeassistant.const import CONF_REGION, CONF_API_TOKEN
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util.ssl import get_default_context
 from aiohttp import ClientResponseError, ClientConnectorError
 from .api import PetLibroAPI  # Use a relative import if inside the same package
 from .const import DOMAIN, CONF_EMAIL, CONF_PASSWORD  # Import CONF_EMAIL and CONF_PASSWORD
 from .api import PetLibroAPIError
+from .exceptions import PetLibroQueueFullError
 from .devices import Device, product_name_map
 
-_LOGGER = getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 class PetLibroHub:
     """A PetLibro hub wrapper class."""
@@ -46,32 +49,45 @@ class PetLibroHub:
             _LOGGER.error("Region is missing in the configuration entry.")
             raise ValueError("Region is required to initialize PetLibroAPI.")
 
-        _LOGGER.debug(f"Initializing PetLibroAPI with email: {email}, region: {region}")
+        _LOGGER.debug("Initializing PetLibroAPI with email: %s, region: %s", email, region)
 
-        # Initialize the PetLibro API instance
+        # Initialize the PetLibro API instance with its own connection pool, closed in async_unload
         self.api = PetLibroAPI(
-            async_get_clientsession(hass),
+            None,
             hass.config.time_zone,
             region,
             email,
             password,
-            data.get(CONF_API_TOKEN)
+            data.get(CONF_API_TOKEN),
+            ssl_context=get_default_context()
         )
 
-        # Setup DataUpdateCoordinator to periodically refresh device data
+        # Endpoints each model and firmware supports, learned by the API and kept across restarts
+        self._capability_store: Store[dict[str, Any]] = Store(hass, CAPABILITY_STORE_VERSION, CAPABILITY_STORE_KEY)
+
+        # Every device refreshes through its own coordinator, so a slow device cannot hold back the others
+        self.device_coordinators: dict[str, DataUpdateCoordinator[bool]] = {}
+
+        # Account-wide coordinator saving the learned endpoint capabilities and keeping the account view for diagnostics
         self.coordinator = DataUpdateCoordinator(
             hass,
-            _LOGGER,
+            _LOGGER.logger,  # Home Assistant needs a standard logger
             name="petlibro_devices",
             update_method=self.refresh_devices,  # Calls the refresh_devices method
             update_interval=timedelta(seconds=UPDATE_INTERVAL_SECONDS),  # Use defined interval
         )
+        self._unsub_account: Callable[[], None] | None = None  # Set by start_polling once the setup succeeded
 
     async def load_devices(self) -> None:
         """Load devices from the API and initialize them."""
+        try:
+            self.api.capabilities.load(await self._capability_store.async_load())
+        except Exception as ex:
+            _LOGGER.warning("Could not load the known endpoint capabilities: %s", ex)
+
         try:
             device_list = await self.api.list_devices()
-            _LOGGER.debug(f"Fetched {len(device_list)} devices from the API.")
+            _LOGGER.debug("Fetched %s devices from the API.", len(device_list))
 
             if not device_list:
                 _LOGGER.warning("No devices found in the API response.")
@@ -80,103 +96,214 @@ class PetLibroHub:
             for device_data in device_list:
                 device_sn = device_data.get("deviceSn", "unknown")
                 device_name = device_data.get("productName", "unknown")
-                _LOGGER.debug(f"Processing device: {device_name} (Serial: {device_sn})")
+                _LOGGER.debug("Processing device: %s (Serial: %s)", device_name, device_sn)
 
                 # Check if the device is already loaded
                 if device_sn in self.loaded_device_sn:
-                    _LOGGER.debug(f"Device {device_sn} is already loaded, skipping further initialization.")
+                    _LOGGER.debug("Device %s is already loaded, skipping further initialization.", device_sn)
                     continue
 
                 # Create a new device and add it without calling refresh immediately
                 if device_name in product_name_map:
-                    _LOGGER.debug(f"Loading new device: {device_name} (Serial: {device_sn})")
+                    _LOGGER.debug("Loading new device: %s (Serial: %s)", device_name, device_sn)
                     device = product_name_map[device_name](device_data, self.api)
                     self.devices.append(device)  # Add to device list
-                    _LOGGER.debug(f"Successfully loaded device: {device_name} (Serial: {device_sn})")
+                    self.device_coordinators[device_sn] = self._create_device_coordinator(device)
+                    _LOGGER.debug("Successfully loaded device: %s (Serial: %s)", device_name, device_sn)
                 else:
-                    _LOGGER.error(f"Unsupported device found: {device_name} (Serial: {device_sn})")
+                    _LOGGER.error("Unsupported device found: %s (Serial: %s)", device_name, device_sn)
 
                 # Mark the device as loaded to prevent duplicate API calls
                 self.loaded_device_sn.add(device_sn)
                 self.last_refresh_times[device_sn] = datetime.utcnow()  # Set the last refresh time to now
 
-            _LOGGER.debug(f"Final devices loaded: {len(self.devices)} devices")
+            _LOGGER.debug("Final devices loaded: %s devices", len(self.devices))
         except Exception as ex:
-            _LOGGER.error(f"Error while loading devices: {ex}", exc_info=True)
+            _LOGGER.error("Error while loading devices: %s", ex, exc_info=True)
+
+    def _create_device_coordinator(self, device: Device) -> DataUpdateCoordinator[bool]:
+        """Create the coordinator refreshing a single device."""
+        async def refresh() -> bool:
+            return await self.refresh_device(device)
+
+        return DataUpdateCoordinator(
+            self.hass,
+            _LOGGER.logger,
+            name=f"petlibro_device_{device.serial}",
+            update_method=refresh,
+            update_interval=timedelta(seconds=UPDATE_INTERVAL_SECONDS),
+        )
 
-    async def refresh_devices(self) -> bool:
-        """Refresh all known devices from the PETLIBRO API."""
+    def coordinator_for(self, device: Device) -> DataUpdateCoordinator[bool]:
+        """Return the coordinator the entities of a device follow."""
+        return self.device_coordinators[device.serial]
+
+    async def async_first_refresh(self) -> None:
+        """Run the first refresh of the account and of every device.
+
+        Only a failure of the account refresh fails the setup; a failing device is retried on its own.
+        """
+        await self.coordinator.async_config_entry_first_refresh()
+        await gather(*(coordinator.async_refresh() for coordinator in self.device_coordinators.values()))
+
+    def start_polling(self) -> None:
+        """Keep the account coordinator polling, no entity listens to it."""
+        if self._unsub_account is None:
+            self._unsub_account = self.coordinator.async_add_listener(lambda: None)
+
+    async def refresh_devices(self) -> dict[str, Any]:
+        """Save the learned endpoint capabilities and return the account view of all devices, for diagnostics.
+
+        The devices themselves refresh through their own coordinators, see refresh_device.
+        """
         if not self.devices:
             _LOGGER.warning("No devices to refresh.")
-            return False
+            return {}
 
-        try:
-            now = datetime.utcnow()
-            _LOGGER.debug("Starting the refresh process for all devices.")
+        if self.api.session.circuit_breaker.is_open:
+            raise UpdateFailed("PetLibro API is unavailable, skipping this refresh.")
 
-            # Use a list to track refresh tasks and results for logging
-            refresh_tasks = []
-            for device in self.devices:
-                refresh_tasks.append(self._refresh_device_if_needed(device, now))
+        try:
+            if self.api.capabilities.changed:
+                self.api.capabilities.changed = False
+                self._capability_store.async_delay_save(self.api.capabilities.as_dict, CAPABILITY_SAVE_DELAY_SECONDS)
+            return self.account_view()
 
-            # Gather results, allowing for early returns on failures or no-op tasks
-            results = await asyncio.gather(*refresh_tasks, return_exceptions=True)
+        except Exception as ex:
+            _LOGGER.error("Unexpected error during the account refresh: %s", ex, exc_info=True)
+            raise UpdateFailed(f"Unexpected error: {ex}")
 
-            # Log the results of the device refresh attempts
-            for device, result in zip(self.devices, results):
-                if isinstance(result, Exception):
-                    _LOGGER.error(f"Error refreshing {device.name} (Serial: {device.serial}): {result}")
-                else:
-                    _LOGGER.debug(f"Successfully refreshed {device.name} (Serial: {device.serial}).")
+    def account_view(self) -> dict[str, Any]:
+        """Return the refresh state of every device and the account-wide counters."""
+        devices = {}
+        for device in self.devices:
+            coordinator = self.device_coordinators.get(device.serial)
+            devices[device.serial] = {
+                "name": device.name,
+                "last_update_success": coordinator.last_update_success if coordinator else None,
+                "update_interval": coordinator.update_interval.total_seconds() if coordinator and coordinator.update_interval else None,
+                "dormant": device.is_dormant(),
+                "health": device.health.stats,
+                "queue": device.queue.stats,
+            }
+        return {
+            "devices": devices,
+            "cache": self.api.cache_stats,
+            "capabilities": self.api.capabilities.stats,
+        }
 
-            _LOGGER.debug("Device refresh process completed.")
-            return True
+    async def refresh_device(self, device: Device) -> bool:
+        """Refresh a single device; its entities are updated as soon as its own fetch completes."""
+        if self.api.session.circuit_breaker.is_open:
+            # Fail at once instead of timing out
+            raise UpdateFailed("PetLibro API is unavailable, skipping this refresh.")
 
+        try:
+            # The device emits a single update for the whole refresh
+            with device.batch():
+                await self._refresh_device_if_needed(device, datetime.utcnow())
+        except UpdateFailed:
+            # Already logged and recorded in the device health
+            self._schedule_next_refresh(device)
+            raise
         except (PetLibroAPIError, ClientResponseError, ClientConnectorError) as ex:
-            _LOGGER.error(f"API-related error during device refresh: {ex}", exc_info=True)
-            raise UpdateFailed(f"Error updating PetLibro devices: {ex}")
+            _LOGGER.error("API-related error refreshing %s: %s", device.serial, ex, exc_info=True)
+            raise UpdateFailed(f"Error updating PetLibro device {device.serial}: {ex}")
         except Exception as ex:
-            _LOGGER.error(f"Unexpected error during device refresh: {ex}", exc_info=True)
+            _LOGGER.error("Unexpected error refreshing %s: %s", device.serial, ex, exc_info=True)
             raise UpdateFailed(f"Unexpected error: {ex}")
 
+        if not device.health.consecutive_failures:
+            _LOGGER.device_debug(device.serial, "Successfully refreshed %s (Serial: %s).", device.name, device.serial)
+        self._schedule_next_refresh(device)
+        return True
+
+    def _schedule_next_refresh(self, device: Device) -> None:
+        """Refresh a device again when its first endpoint is due, e.g. when a feeding is about to start."""
+        coordinator = self.device_coordinators[device.serial]
+        seconds = min(max(device.seconds_until_due(), POLL_BURST_SECONDS), UPDATE_INTERVAL_SECONDS)
+        if coordinator.update_interval != timedelta(seconds=seconds):
+            _LOGGER.device_debug(device.serial, "Next refresh of %s in %s seconds.", device.serial, seconds)
+            coordinator.update_interval = timedelta(seconds=seconds)
+
     async def _refresh_device_if_needed(self, device: Device, now: datetime) -> None:
-        """Refresh a device only if enough time has passed since the last refresh."""
+        """Refresh a device only if enough time has passed since the last refresh.
+
+        Raises UpdateFailed, after recording the health of the device, when no endpoint answered and a
+        core endpoint failed, or while the device is quarantined, so its coordinator reports the failure.
+        A cycle that returned fresh data never fails the coordinator.
+        """
         device_sn = device.serial
         last_refresh_time = self.last_refresh_times.get(device_sn)
 
         # Log and skip refresh if the device has been recently refreshed
         if last_refresh_time and (now - last_refresh_time) < timedelta(seconds=10):
-            _LOGGER.debug(f"Skipping refresh for {device_sn}, last refreshed at {last_refresh_time}.")
+            _LOGGER.device_debug(device_sn, "Skipping refresh for %s, last refreshed at %s.", device_sn, last_refresh_time)
             return
 
-        try:
-            # Attempt to refresh the device
-            _LOGGER.debug(f"Refreshing device {device_sn}.")
-            await device.refresh()
-            self.last_refresh_times[device_sn] = now  # Update last refresh time
-            _LOGGER.debug(f"Device refresh complete for serial: {device_sn}.")
+        if device.health.quarantined:
+            if not device.health.probe_due():
+                _LOGGER.device_debug(device_sn, "Skipping refresh for %s, it is quarantined.", device_sn)
+                raise UpdateFailed(f"PetLibro device {device_sn} is quarantined: {device.health.last_error}")
+            # A single cheap request tells whether the device responds again
+            endpoints = [device.PROBE_ENDPOINT]
+        else:
+            # Fetch only the endpoints whose poll interval has passed
+            endpoints = device.due_endpoints()
+        if not endpoints:
+            _LOGGER.device_debug(device_sn, "No endpoints due for %s.", device_sn)
+            return
 
+        try:
+            _LOGGER.device_debug(device_sn, "Refreshing %s of device %s.", endpoints, device_sn)
+            errors = await device.refresh(endpoints, fresh=True)  # Due by its own cadence, never served from the cache
+        except PetLibroQueueFullError as ex:
+            # Busy with commands rather than failing, the endpoints stay due for the next cycle
+            _LOGGER.device_debug(device_sn, "Skipping refresh for %s: %s", device_sn, ex)
+            return
         except Exception as ex:
-            _LOGGER.error(f"Error refreshing {device_sn}: {ex}", exc_info=True)
-            raise
+            # The traceback only for the first failure, quarantined devices fail quietly
+            if not device.health.consecutive_failures:
+                _LOGGER.error("Error refreshing %s: %s", device_sn, ex, exc_info=True)
+            elif not device.health.quarantined:
+                _LOGGER.warning("Error refreshing %s again: %s", device_sn, ex)
+            device.record_refresh(ex)
+            raise UpdateFailed(f"Error updating PetLibro device {device_sn}: {ex}") from ex
+        # A core endpoint failing while the others answer counts towards quarantine too, refresh logged it
+        device.record_refresh(errors[0] if errors else None)
+        self.last_refresh_times[device_sn] = now  # Update last refresh time
+        _LOGGER.device_debug(device_sn, "Device refresh complete for serial: %s.", device_sn)
 
     async def get_device(self, serial: str) -> Optional[Device]:
         """Return the device with the specified serial number."""
         device = next((device for device in self.devices if device.serial == serial), None)
         if not device:
-            _LOGGER.debug(f"Device with serial {serial} not found.")
+            _LOGGER.debug("Device with serial %s not found.", serial)
         return device
 
     async def async_refresh(self) -> None:
         """Force a manual refresh of devices."""
         _LOGGER.debug("Manual refresh triggered for PetLibro devices.")
-        await self.coordinator.async_request_refresh()
+        await gather(
+            self.coordinator.async_request_refresh(),
+            *(coordinator.async_request_refresh() for coordinator in self.device_coordinators.values())
+        )
 
     async def async_unload(self) -> bool:
         """Unload the hub and its devices."""
         _LOGGER.debug("Unloading PetLibro Hub and clearing devices.")
+        if self._unsub_account is not None:
+            self._unsub_account()
+            self._unsub_account = None
+        for device in self.devices:
+            device.shutdown()  # Drop pending command confirmations
         self.devices.clear()  # Clears the device list
+        self.device_coordinators.clear()
         self.last_refresh_times.clear()  # Clears refresh times as well
-        
+        try:
+            await self._capability_store.async_save(self.api.capabilities.as_dict())  # Do not lose a pending save
+        finally:
+            await self.api.close()  # Close the dedicated connection pool, even when the save failed
+
         # No need to stop the coordinator explicitly
         return True
\ No newline at end of file
@@ -0,0 +1,143 @@
+"""Logging facade for the PETLIBRO integration.
+
+Every call is guarded by ``isEnabledFor`` and formatted lazily, so disabled levels cost a single
+check. Payloads and secrets are wrapped in helpers that only redact and truncate them when a
+record is actually emitted.
+"""
+
+from __future__ import annotations
+
+import logging
+
+from collections.abc import Iterable
+from typing import Any
+
+from .const import DEBUG_SAMPLE_EVERY
+
+# Keys whose values never appear in logs
+REDACTED_KEYS = frozenset({"token", "password", "email", "appSn"})
+# Longest payload representation written to the log
+MAX_PAYLOAD_LENGTH = 1000
+
+
+def redact(value: Any) -> Any:
+    """Return a copy of a payload with secret values masked."""
+    if isinstance(value, dict):
+        return {
+            key: "**REDACTED**" if key in REDACTED_KEYS and item is not None else redact(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [redact(item) for item in value]
+    return value
+
+
+class Payload:
+    """A payload rendered redacted and truncated, only when the log record is emitted."""
+
+    __slots__ = ("_value",)
+
+    def __init__(self, value: Any) -> None:
+        self._value = value
+
+    def __str__(self) -> str:
+        text = repr(redact(self._value))
+        if len(text) > MAX_PAYLOAD_LENGTH:
+            return f"{text[:MAX_PAYLOAD_LENGTH]}... ({len(text)} chars)"
+        return text
+
+
+class Secret:
+    """A token or password rendered with all but its first characters masked."""
+
+    __slots__ = ("_value",)
+
+    def __init__(self, value: str | None) -> None:
+        self._value = value
+
+    def __str__(self) -> str:
+        if not self._value:
+            return str(self._value)
+        return f"{self._value[:4]}****"
+
+
+class DeviceSampler:
+    """Decide which per-device debug messages are logged.
+
+    Only every ``every``-th message of a device is kept, and only for ``serials`` when given.
+    """
+
+    def __init__(self, every: int = 1, serials: Iterable[str] | None = None) -> None:
+        self.every = max(1, every)
+        self.serials = frozenset(serials) if serials is not None else None
+        self._counts: dict[str, int] = {}
+
+    def __call__(self, serial: str | None) -> bool:
+        if self.serials is not None and serial not in self.serials:
+            return False
+        if self.every == 1:
+            return True
+        count = self._counts.get(serial, 0)
+        self._counts[serial] = count + 1
+        return count % self.every == 0
+
+
+# Shared by every logger of the integration
+device_sampler = DeviceSampler(DEBUG_SAMPLE_EVERY)
+
+
+def set_device_sampling(every: int = 1, serials: Iterable[str] | None = None) -> None:
+    """Log only every ``every``-th debug message per device, optionally only for some devices."""
+    global device_sampler
+    device_sampler = DeviceSampler(every, serials)
+
+
+class PetLibroLogger:
+    """Thin wrapper around a standard logger that skips all work for disabled levels.
+
+    Records are attributed to the caller of the wrapper, not to this module. Home Assistant helpers
+    that expect a standard logger get ``logger``.
+    """
+
+    __slots__ = ("logger",)
+
+    def __init__(self, name: str) -> None:
+        self.logger = logging.getLogger(name)
+
+    def isEnabledFor(self, level: int) -> bool:  # pylint: disable=invalid-name
+        return self.logger.isEnabledFor(level)
+
+    def _log(self, level: int, msg: str, args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+        # Attribute the record to the caller of the public method, on top of any stacklevel it passed
+        kwargs["stacklevel"] = kwargs.get("stacklevel", 1) + 2
+        self.logger._log(level, msg, args, **kwargs)  # pylint: disable=protected-access
+
+    def debug(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self._log(logging.DEBUG, msg, args, kwargs)
+
+    def device_debug(self, serial: str | None, msg: str, *args: Any, **kwargs: Any) -> None:
+        """Log a debug message about one device, subject to the device sampling."""
+        if self.logger.isEnabledFor(logging.DEBUG) and device_sampler(serial):
+            self._log(logging.DEBUG, msg, args, kwargs)
+
+    def info(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        if self.logger.isEnabledFor(logging.INFO):
+            self._log(logging.INFO, msg, args, kwargs)
+
+    def warning(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        if self.logger.isEnabledFor(logging.WARNING):
+            self._log(logging.WARNING, msg, args, kwargs)
+
+    def error(self, msg: str, *args: Any, **kwargs: Any) -> None:
+        if self.logger.isEnabledFor(logging.ERROR):
+            self._log(logging.ERROR, msg, args, kwargs)
+
+    def exception(self, msg: str, *args: Any, exc_info: Any = True, **kwargs: Any) -> None:
+        if self.logger.isEnabledFor(logging.ERROR):
+            self._log(logging.ERROR, msg, args, {**kwargs, "exc_info": exc_info})
+
+
+def get_logger(name: str) -> PetLibroLogger:
+    """Return the integration logger for a module."""
+    return PetLibroLogger(name)
@@ -12,7 +12,7 @@ from collections.abc import Callable
 from functools import cached_property
 from typing import Optional
 from typing import Any
-import logging
+from .log import get_logger
 from .const import DOMAIN
 from homeassistant.components.number import (
     NumberEntity,
@@ -26,7 +26,7 @@ from homeassistant.config_entries import ConfigEntry  # Added ConfigEntry import
 from .hub import PetLibroHub  # Adjust the import path as necessary
 
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 from .devices import Device
 from .devices.device import Device
@@ -67,21 +67,21 @@ class PetLibroNumberEntity(PetLibroEntity[_DeviceT], NumberEntity):
         """Return the current state."""
         state = getattr(self.device, self.entity_description.key, None)
         if state is None:
-            _LOGGER.warning(f"Value '{self.entity_description.key}' is None for device {self.device.name}")
+            _LOGGER.warning("Value '%s' is None for device %s", self.entity_description.key, self.device.name)
             return None
-        _LOGGER.debug(f"Retrieved value for '{self.entity_description.key}', {self.device.name}: {state}")
+        _LOGGER.device_debug(self.device.serial, "Retrieved value for '%s', %s: %s", self.entity_description.key, self.device.name, state)
         return float(state)
     
     async def async_set_native_value(self, value: float) -> None:
         """Set the value of the number."""
-        _LOGGER.debug(f"Setting value {value} for {self.device.name}")
+        _LOGGER.debug("Setting value %s for %s", value, self.device.name)
         try:
             # Regular case for sound_level or other methods that only need a value
-            _LOGGER.debug(f"Calling method with value={value} for {self.device.name}")
+            _LOGGER.debug("Calling method with value=%s for %s", value, self.device.name)
             await self.entity_description.method(self.device, value)
-            _LOGGER.debug(f"Value {value} set successfully for {self.device.name}")
+            _LOGGER.debug("Value %s set successfully for %s", value, self.device.name)
         except Exception as e:
-            _LOGGER.error(f"Error setting value {value} for {self.device.name}: {e}")
+            _LOGGER.error("Error setting value %s for %s: %s", value, self.device.name, e)
 
 DEVICE_NUMBER_MAP: dict[type[Device], list[PetLibroNumberEntityDescription]] = {
     Feeder: [
@@ -89,6 +89,7 @@ DEVICE_NUMBER_MAP: dict[type[Device], list[PetLibroNumberEntityDescription]] = {
     OneRFIDSmartFeeder: [
         PetLibroNumberEntityDescription[OneRFIDSmartFeeder](
             key="desiccant_frequency",
+            fields=frozenset({"realInfo"}),
             translation_key="desiccant_frequency",
             icon="mdi:calendar-alert",
             native_unit_of_measurement="Days",
@@ -102,6 +103,7 @@ DEVICE_NUMBER_MAP: dict[type[Device], list[PetLibroNumberEntityDescription]] = {
         ),
         PetLibroNumberEntityDescription[OneRFIDSmartFeeder](
             key="sound_level",
+            fields=frozenset({"getAttributeSetting"}),
             translation_key="sound_level",
             icon="mdi:volume-high",
             native_unit_of_measurement="%",
@@ -141,7 +143,7 @@ async def async_setup_entry(
 
     # Create number entities for each device based on the number map
     entities = [
-        PetLibroNumberEntity(device, hub, description)
+        PetLibroNumberEntity(device, hub.coordinator_for(device), description)
         for device in devices  # Iterate through devices from the hub
         for device_type, entity_descriptions in DEVICE_NUMBER_MAP.items()
         if isinstance(device, device_type)
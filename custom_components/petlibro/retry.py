@@ -0,0 +1,171 @@
+"""Retry policy, circuit breaker and command ledger for PETLIBRO API requests."""
+
+from __future__ import annotations
+
+import asyncio
+import random
+
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any
+
+import aiohttp
+
+from .exceptions import (
+    PetLibroCircuitOpenError,
+    PetLibroHTTPStatusError,
+    PetLibroRateLimitedError,
+    PetLibroResponseCodeError,
+)
+
+RETRYABLE = "retryable"  # Transient, try again after a backoff
+AUTH = "auth"  # The token was rejected, log in again and retry
+FATAL = "fatal"  # Retrying will not help
+
+# Checked in order, so subclasses must come before their base classes
+EXCEPTION_CLASSES: tuple[tuple[type[BaseException], str], ...] = (
+    (PetLibroRateLimitedError, RETRYABLE),
+    (asyncio.TimeoutError, RETRYABLE),
+    (aiohttp.ServerDisconnectedError, RETRYABLE),
+    (aiohttp.ClientConnectionError, RETRYABLE),
+    (aiohttp.ClientPayloadError, RETRYABLE),
+)
+STATUS_CLASSES: dict[int, str] = {
+    401: AUTH,
+    408: RETRYABLE,
+    429: RETRYABLE,
+    500: RETRYABLE,
+    502: RETRYABLE,
+    503: RETRYABLE,
+    504: RETRYABLE,
+}
+CODE_CLASSES: dict[int, str] = {
+    1009: AUTH,  # NOT_YET_LOGIN
+}
+
+# Failures that happen before the request reaches the API, so even a command that must not run twice can be resent
+NOT_SENT: tuple[type[BaseException], ...] = (
+    PetLibroRateLimitedError,
+    aiohttp.ClientConnectorError,
+)
+
+
+def classify(err: BaseException) -> str:
+    """Return RETRYABLE, AUTH or FATAL for an error raised while sending a request."""
+    if isinstance(err, PetLibroResponseCodeError):
+        return CODE_CLASSES.get(err.code, FATAL)
+    if isinstance(err, PetLibroHTTPStatusError):
+        return STATUS_CLASSES.get(err.status, RETRYABLE if err.status >= 500 else FATAL)
+    for error_type, error_class in EXCEPTION_CLASSES:
+        if isinstance(err, error_type):
+            return error_class
+    return FATAL
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How often and how long to wait before retrying a request."""
+
+    max_attempts: int
+    base_delay: float
+    max_delay: float
+
+    def delay(self, attempt: int, err: BaseException) -> float:
+        """Return the backoff before the given retry (1-based), with full jitter."""
+        if isinstance(err, PetLibroRateLimitedError):
+            return 0  # The rate limiter already holds the request until Retry-After has passed
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+class CircuitBreaker:
+    """Stop sending requests for a while once the cloud keeps failing.
+
+    After ``failure_threshold`` consecutive transient failures the breaker opens and requests fail
+    immediately. Once ``reset_timeout`` has passed a single trial request is let through: success
+    closes the breaker, failure opens it again.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self._opened_at: float | None = None
+        self._trial_running = False
+
+    @property
+    def is_open(self) -> bool:
+        """Return True while requests are being rejected."""
+        return self._opened_at is not None and monotonic() - self._opened_at < self.reset_timeout
+
+    @property
+    def state(self) -> str:
+        """Return closed, open or half_open."""
+        if self._opened_at is None:
+            return "closed"
+        return "open" if self.is_open or self._trial_running else "half_open"
+
+    def before_request(self) -> None:
+        """Raise if the breaker does not let a request through right now."""
+        if self._opened_at is None:
+            return
+        if self.is_open or self._trial_running:
+            raise PetLibroCircuitOpenError("PetLibro API unavailable, not sending requests for now")
+        self._trial_running = True
+
+    def record_success(self) -> None:
+        """Close the breaker after the API answered."""
+        self.failures = 0
+        self._opened_at = None
+        self._trial_running = False
+
+    def record_failure(self) -> None:
+        """Count a transient failure and open the breaker once the threshold is reached."""
+        self.failures += 1
+        if self._trial_running or self.failures >= self.failure_threshold:
+            self._opened_at = monotonic()
+        self._trial_running = False
+
+    def record_cancelled(self) -> None:
+        """Let another trial request through if the current one was cancelled."""
+        self._trial_running = False
+
+
+@dataclass(slots=True)
+class LedgerEntry:
+    """Outcome of a command, kept until ``expires_at``."""
+
+    succeeded: bool
+    result: Any
+    expires_at: float
+
+
+class CommandLedger:
+    """Short-lived record of command outcomes by requestId.
+
+    A command carrying a requestId is executed at most once by the API, so it can be retried
+    freely. Once it succeeded, resending it under the same requestId returns the recorded result
+    without another call.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._entries: dict[str, LedgerEntry] = {}
+
+    def get(self, request_id: str) -> LedgerEntry | None:
+        """Return the recorded outcome of a command, if still known."""
+        self._expire()
+        return self._entries.get(request_id)
+
+    def record(self, request_id: str, succeeded: bool, result: Any = None) -> None:
+        """Record the outcome of a command."""
+        self._expire()
+        self._entries[request_id] = LedgerEntry(succeeded, result, monotonic() + self.ttl)
+
+    def _expire(self) -> None:
+        now = monotonic()
+        for request_id in [key for key, entry in self._entries.items() if entry.expires_at <= now]:
+            del self._entries[request_id]
+
+    def __len__(self) -> int:
+        self._expire()
+        return len(self._entries)
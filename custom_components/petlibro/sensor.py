@@ -4,22 +4,22 @@ from __future__ import annotations
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
-from logging import getLogger
+from .log import get_logger
 from typing import Any
 
 from homeassistant.components.sensor import SensorEntity, SensorEntityDescription
 from homeassistant.components.sensor.const import SensorStateClass, SensorDeviceClass
 from homeassistant.config_entries import ConfigEntry  # Added ConfigEntry import
-from homeassistant.const import UnitOfMass, UnitOfVolume
+from homeassistant.const import EntityCategory, UnitOfMass, UnitOfVolume
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from .const import DOMAIN
 
-_LOGGER = getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
-from .devices.device import Device
+from .devices.device import HEALTH_FIELD, Device
 from .devices.feeders.feeder import Feeder
 from .devices.feeders.air_smart_feeder import AirSmartFeeder
 from .devices.feeders.granary_smart_feeder import GranarySmartFeeder
@@ -60,6 +60,55 @@ class PetLibroSensorEntityDescription(SensorEntityDescription, PetLibroEntityDes
     native_unit_of_measurement_fn: Callable[[_DeviceT], str | None] = lambda _: None
     device_class_fn: Callable[[_DeviceT], SensorDeviceClass | None] = lambda _: None
     should_report: Callable[[_DeviceT], bool] = lambda _: True
+    value_fn: Callable[[_DeviceT], Any] | None = None
+
+
+def _reported_value(description: PetLibroSensorEntityDescription) -> Callable[[Any], Any]:
+    """Read the device attribute named like the sensor, if the description reports it."""
+    key = description.key
+    should_report = description.should_report
+
+    def value(device: Any) -> Any:
+        return getattr(device, key, None) if should_report(device) else None
+
+    return value
+
+
+def _feeding_plan_state(device: Any) -> str:
+    return "On" if getattr(device, "feeding_plan_state", False) else "Off"
+
+
+def _today_feeding_quantity_cups(device: Any) -> str:
+    """Convert the feeding quantity to cups."""
+    conversion_factor = 1 / 24 if getattr(device, "conversion_mode", None) == "1/24" else 1 / 12
+    return f"{round(getattr(device, 'today_feeding_quantity', 0) * conversion_factor, 2)}"
+
+
+def _weight_ounces(device: Any) -> float:
+    """Convert the weight in grams to ounces."""
+    return round(getattr(device, "weight", 0.0) * 0.035274, 2)
+
+
+# Sensors whose state is not the device attribute of the same name, used when the description has no value_fn
+SENSOR_VALUE_FNS: dict[str, Callable[[Any], Any]] = {
+    "feeding_plan_state": _feeding_plan_state,
+    "today_eating_time": lambda device: getattr(device, "today_eating_time", 0),
+    "today_feeding_quantity": _today_feeding_quantity_cups,
+    "wifi_rssi": lambda device: getattr(device, "wifi_rssi", None),
+    "weight": _weight_ounces,
+}
+# Units of sensors, overriding the unit of their description
+SENSOR_UNITS: dict[str, str] = {
+    "temperature": "°F",
+    "today_feeding_quantity": "cups",
+    "today_eating_time": "s",
+    "wifi_rssi": "dBm",
+    "weight": "oz",
+    "use_water_interval": "min",
+    "use_water_duration": "min",
+    "weight_percent": "%",
+    "electric_quantity": "%",
+}
 
 
 class PetLibroSensorEntity(PetLibroEntity[_DeviceT], SensorEntity):
@@ -81,64 +130,19 @@ class PetLibroDescribedSensorEntity(PetLibroSensorEntity[_DeviceT]):
         super().__init__(device, coordinator, description.key)
         self.entity_description = description
 
-        # Dictionary to keep track of the last known state for each sensor key
-        self._last_sensor_state = {}
+        # Resolve how the state and unit are read once, instead of on every state write
+        self._value_fn = description.value_fn or SENSOR_VALUE_FNS.get(description.key) or _reported_value(description)
+        # A static native_unit_of_measurement is not used, changing the unit of existing sensors
+        # would break their long-term statistics
+        if (unit := SENSOR_UNITS.get(description.key)) is not None:
+            self._unit_fn: Callable[[_DeviceT], str | None] = lambda _: unit
+        else:
+            self._unit_fn = description.native_unit_of_measurement_fn
 
     @property
     def native_value(self) -> float | datetime | str | None:
         """Return the state."""
-
-        sensor_key = self.entity_description.key
-
-        # Handle feeding_plan_state as "On" or "Off"
-        if sensor_key == "feeding_plan_state":
-            feeding_plan_active = getattr(self.device, sensor_key, False)
-            # Log only if the state has changed
-            if self._last_sensor_state.get(sensor_key) != feeding_plan_active:
-                _LOGGER.debug(f"Raw {sensor_key} for device {self.device.serial}: {feeding_plan_active}")
-                self._last_sensor_state[sensor_key] = feeding_plan_active
-            return "On" if feeding_plan_active else "Off"
-
-        # Handle today_eating_time as raw seconds value
-        elif sensor_key == "today_eating_time":
-            eating_time_seconds = getattr(self.device, sensor_key, 0)
-            return eating_time_seconds
-
-        # Handle today_feeding_quantity as raw numeric value, converting to cups
-        elif sensor_key == "today_feeding_quantity":
-            feeding_quantity = getattr(self.device, sensor_key, 0)
-            # Determine the conversion factor based on device-specific attributes or context
-            conversion_factor = 1 / 12  # Default conversion factor
-            if hasattr(self.device, "conversion_mode") and self.device.conversion_mode == "1/24":
-                conversion_factor = 1 / 24
-
-            cups = feeding_quantity * conversion_factor
-            return f"{round(cups, 2)}"
-
-        # Handle wifi_rssi to display only the numeric value
-        elif sensor_key == "wifi_rssi":
-            wifi_rssi = getattr(self.device, sensor_key, None)
-            if wifi_rssi is not None:
-                if self._last_sensor_state.get(sensor_key) != wifi_rssi:
-                    _LOGGER.debug(f"Raw {sensor_key} for device {self.device.serial}: {wifi_rssi}")
-                    self._last_sensor_state[sensor_key] = wifi_rssi
-                return wifi_rssi
-
-        # Handle weight in grams and convert to ounces
-        elif sensor_key == "weight":
-            weight_in_grams = getattr(self.device, sensor_key, 0.0)
-            ounces = round(weight_in_grams * 0.035274, 2)
-            return ounces
-
-        # Default behavior for other sensors
-        if self.entity_description.should_report(self.device):
-            val = getattr(self.device, sensor_key, None)
-            # Log only if the state has changed
-            if self._last_sensor_state.get(sensor_key) != val:
-                _LOGGER.debug(f"Raw {sensor_key} for device {self.device.serial}: {val}")
-                self._last_sensor_state[sensor_key] = val
-            return val
-        return None
+        return self._value_fn(self.device)
 
     @property
     def icon(self) -> str | None:
@@ -150,32 +154,7 @@ class PetLibroDescribedSensorEntity(PetLibroSensorEntity[_DeviceT]):
     @property
     def native_unit_of_measurement(self) -> str | None:
         """Return the native unit of measurement to use in the frontend, if any."""
-        # For temperature, display as Fahrenheit
-        if self.entity_description.key == "temperature":
-            return "°F"
-        # For today_feeding_quantity, display as cups in the frontend
-        if self.entity_description.key == "today_feeding_quantity":
-            return "cups"
-        # For today_eating_time, display as seconds in the frontend
-        elif self.entity_description.key == "today_eating_time":
-            return "s"
-        # For wifi_rssi, display as dBm
-        elif self.entity_description.key == "wifi_rssi":
-            return "dBm"
-        # For weight, display as ounces in the frontend
-        elif self.entity_description.key == "weight":
-            return "oz"
-        # For use_water_interval and use_water_duration, display as minutes
-        elif self.entity_description.key in ["use_water_interval", "use_water_duration"]:
-            return "min"
-        # For weight_percent, display as a percentage
-        elif self.entity_description.key == "weight_percent":
-            return "%"
-        # For electric_quantity, display as a percentage
-        elif self.entity_description.key == "electric_quantity":
-            return "%"
-        # Default behavior for other sensors
-        return self.entity_description.native_unit_of_measurement_fn(self.device)
+        return self._unit_fn(self.device)
 
     @property
     def device_class(self) -> SensorDeviceClass | None:
@@ -185,30 +164,59 @@ class PetLibroDescribedSensorEntity(PetLibroSensorEntity[_DeviceT]):
         return super().device_class
 
 
+class PetLibroHealthSensorEntity(PetLibroDescribedSensorEntity[Device]):
+    """Refresh health of a device, with its failure counters as attributes."""
+
+    @property
+    def available(self) -> bool:
+        """Stay available while the refreshes fail, which is when the health matters."""
+        return True
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        return self.device.health.stats
+
+
+# Added to every device
+HEALTH_SENSOR_DESCRIPTION = PetLibroSensorEntityDescription[Device](
+    key="refresh_health",
+    fields=frozenset({HEALTH_FIELD}),
+    translation_key="refresh_health",
+    icon="mdi:heart-pulse",
+    name="Refresh Health",
+    entity_category=EntityCategory.DIAGNOSTIC,
+    value_fn=lambda device: device.health.state,
+)
+
+
 DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
     Feeder: [
     ],
     AirSmartFeeder: [
         PetLibroSensorEntityDescription[AirSmartFeeder](
             key="device_sn",
+            fields=frozenset({"realInfo"}),
             translation_key="device_sn",
             icon="mdi:identifier",
             name="Device SN"
         ),
         PetLibroSensorEntityDescription[AirSmartFeeder](
             key="mac",
+            fields=frozenset({"mac"}),
             translation_key="mac_address",
             icon="mdi:network",
             name="MAC Address"
         ),
         PetLibroSensorEntityDescription[AirSmartFeeder](
             key="wifi_ssid",
+            fields=frozenset({"realInfo"}),
             translation_key="wifi_ssid",
             icon="mdi:wifi",
             name="Wi-Fi SSID"
         ),
         PetLibroSensorEntityDescription[AirSmartFeeder](
             key="wifi_rssi",
+            fields=frozenset({"realInfo"}),
             translation_key="wifi_rssi",
             icon="mdi:wifi",
             native_unit_of_measurement="dBm",
@@ -218,12 +226,14 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[AirSmartFeeder](
             key="battery_state",
+            fields=frozenset({"realInfo"}),
             translation_key="battery_state",
             icon="mdi:battery",
             name="Battery Level"
         ),
         PetLibroSensorEntityDescription[AirSmartFeeder](
             key="electric_quantity",
+            fields=frozenset({"realInfo"}),
             translation_key="electric_quantity",
             icon="mdi:battery",
             native_unit_of_measurement="%",
@@ -233,6 +243,7 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[AirSmartFeeder](
             key="feeding_plan_state",
+            fields=frozenset({"realInfo"}),
             translation_key="feeding_plan_state",
             icon="mdi:calendar-check",
             name="Feeding Plan State",
@@ -240,6 +251,7 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[AirSmartFeeder](
             key="today_feeding_quantity",
+            fields=frozenset({"grainStatus", "realInfo"}),
             translation_key="today_feeding_quantity",
             icon="mdi:scale",
             native_unit_of_measurement_fn=unit_of_measurement_feeder,
@@ -249,6 +261,7 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[AirSmartFeeder](
             key="today_feeding_times",
+            fields=frozenset({"grainStatus"}),
             translation_key="today_feeding_times",
             icon="mdi:history",
             state_class=SensorStateClass.TOTAL_INCREASING,
@@ -256,6 +269,7 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[AirSmartFeeder](
             key="child_lock_switch",
+            fields=frozenset({"realInfo"}),
             translation_key="child_lock_switch",
             icon="mdi:lock",
             name="Buttons Lock"
@@ -264,24 +278,28 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
     GranarySmartFeeder: [
         PetLibroSensorEntityDescription[GranarySmartFeeder](
             key="device_sn",
+            fields=frozenset({"realInfo"}),
             translation_key="device_sn",
             icon="mdi:identifier",
             name="Device SN"
         ),
         PetLibroSensorEntityDescription[GranarySmartFeeder](
             key="mac",
+            fields=frozenset({"mac"}),
             translation_key="mac_address",
             icon="mdi:network",
             name="MAC Address"
         ),
         PetLibroSensorEntityDescription[GranarySmartFeeder](
             key="wifi_ssid",
+            fields=frozenset({"realInfo"}),
             translation_key="wifi_ssid",
             icon="mdi:wifi",
             name="Wi-Fi SSID"
         ),
         PetLibroSensorEntityDescription[GranarySmartFeeder](
             key="wifi_rssi",
+            fields=frozenset({"realInfo"}),
             translation_key="wifi_rssi",
             icon="mdi:wifi",
             native_unit_of_measurement="dBm",
@@ -291,18 +309,21 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[GranarySmartFeeder](
             key="remaining_desiccant",
+            fields=frozenset({"realInfo"}),
             translation_key="remaining_desiccant",
             icon="mdi:package",
             name="Remaining Desiccant Days"
         ),
         PetLibroSensorEntityDescription[GranarySmartFeeder](
             key="battery_state",
+            fields=frozenset({"realInfo"}),
             translation_key="battery_state",
             icon="mdi:battery",
             name="Battery Level"
         ),
         PetLibroSensorEntityDescription[GranarySmartFeeder](
             key="electric_quantity",
+            fields=frozenset({"realInfo"}),
             translation_key="electric_quantity",
             icon="mdi:battery",
             native_unit_of_measurement="%",
@@ -312,6 +333,7 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[GranarySmartFeeder](
             key="feeding_plan_state",
+            fields=frozenset({"realInfo"}),
             translation_key="feeding_plan_state",
             icon="mdi:calendar-check",
             name="Feeding Plan State",
@@ -319,6 +341,7 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[GranarySmartFeeder](
             key="today_feeding_quantity",
+            fields=frozenset({"grainStatus", "realInfo"}),
             translation_key="today_feeding_quantity",
             icon="mdi:scale",
             native_unit_of_measurement_fn=unit_of_measurement_feeder,
@@ -328,6 +351,7 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[GranarySmartFeeder](
             key="today_feeding_times",
+            fields=frozenset({"grainStatus"}),
             translation_key="today_feeding_times",
             icon="mdi:history",
             state_class=SensorStateClass.TOTAL_INCREASING,
@@ -335,6 +359,7 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[GranarySmartFeeder](
             key="child_lock_switch",
+            fields=frozenset({"realInfo"}),
             translation_key="child_lock_switch",
             icon="mdi:lock",
             name="Buttons Lock"
@@ -343,24 +368,28 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
     GranarySmartCameraFeeder: [
         PetLibroSensorEntityDescription[GranarySmartCameraFeeder](
             key="device_sn",
+            fields=frozenset({"realInfo"}),
             translation_key="device_sn",
             icon="mdi:identifier",
             name="Device SN"
         ),
         PetLibroSensorEntityDescription[GranarySmartCameraFeeder](
             key="mac_address",
+            fields=frozenset({"realInfo"}),
             translation_key="mac_address",
             icon="mdi:network",
             name="MAC Address"
         ),
         PetLibroSensorEntityDescription[GranarySmartCameraFeeder](
             key="wifi_ssid",
+            fields=frozenset({"realInfo"}),
             translation_key="wifi_ssid",
             icon="mdi:wifi",
             name="Wi-Fi SSID"
         ),
         PetLibroSensorEntityDescription[GranarySmartCameraFeeder](
             key="wifi_rssi",
+            fields=frozenset({"realInfo"}),
             translation_key="wifi_rssi",
             icon="mdi:wifi",
             native_unit_of_measurement="dBm",
@@ -370,6 +399,7 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[GranarySmartCameraFeeder](
             key="remaining_desiccant",
+            fields=frozenset({"realInfo"}),
             translation_key="remaining_desiccant",
             icon="mdi:package",
             native_unit_of_measurement="days",
@@ -377,12 +407,14 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[GranarySmartCameraFeeder](
             key="battery_state",
+            fields=frozenset({"realInfo"}),
             translation_key="battery_state",
             icon="mdi:battery",
             name="Battery Level"
         ),
         PetLibroSensorEntityDescription[GranarySmartCameraFeeder](
             key="electric_quantity",
+            fields=frozenset({"realInfo"}),
             translation_key="electric_quantity",
             icon="mdi:battery",
             native_unit_of_measurement="%",
@@ -392,6 +424,7 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[GranarySmartCameraFeeder](
             key="feeding_plan_state",
+            fields=frozenset({"realInfo"}),
             translation_key="feeding_plan_state",
             icon="mdi:calendar-check",
             name="Feeding Plan State",
@@ -399,6 +432,7 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[GranarySmartCameraFeeder](
             key="today_feeding_quantity",
+            fields=frozenset({"grainStatus", "realInfo"}),
             translation_key="today_feeding_quantity",
             icon="mdi:scale",
             native_unit_of_measurement_fn=unit_of_measurement_feeder,
@@ -408,6 +442,7 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[GranarySmartCameraFeeder](
             key="today_feeding_times",
+            fields=frozenset({"grainStatus"}),
             translation_key="today_feeding_times",
             icon="mdi:history",
             state_class=SensorStateClass.TOTAL_INCREASING,
@@ -415,12 +450,14 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[GranarySmartCameraFeeder](
             key="child_lock_switch",
+            fields=frozenset({"realInfo"}),
             translation_key="child_lock_switch",
             icon="mdi:lock",
             name="Buttons Lock"
         ),
         PetLibroSensorEntityDescription[GranarySmartCameraFeeder](
             key="resolution",
+            fields=frozenset({"realInfo"}),
             translation_key="resolution",
             icon="mdi:camera",
             name="Camera Resolution",
@@ -428,6 +465,7 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[GranarySmartCameraFeeder](
             key="night_vision",
+            fields=frozenset({"realInfo"}),
             translation_key="night_vision",
             icon="mdi:weather-night",
             name="Night Vision Mode",
@@ -435,6 +473,7 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[GranarySmartCameraFeeder](
             key="enable_video_record",
+            fields=frozenset({"realInfo"}),
             translation_key="enable_video_record",
             icon="mdi:video",
             name="Video Recording Enabled",
@@ -442,6 +481,7 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[GranarySmartCameraFeeder](
             key="video_record_switch",
+            fields=frozenset({"realInfo"}),
             translation_key="video_record_switch",
             icon="mdi:video-outline",
             name="Video Recording Switch",
@@ -449,6 +489,7 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[GranarySmartCameraFeeder](
             key="video_record_mode",
+            fields=frozenset({"realInfo"}),
             translation_key="video_record_mode",
             icon="mdi:motion-sensor",
             name="Video Recording Mode",
@@ -458,24 +499,28 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
     OneRFIDSmartFeeder: [
         PetLibroSensorEntityDescription[OneRFIDSmartFeeder](
             key="device_sn",
+            fields=frozenset({"realInfo"}),
             translation_key="device_sn",
             icon="mdi:identifier",
             name="Device SN"
         ),
         PetLibroSensorEntityDescription[OneRFIDSmartFeeder](
             key="mac",
+            fields=frozenset({"mac"}),
             translation_key="mac_address",
             icon="mdi:network",
             name="MAC Address"
         ),
         PetLibroSensorEntityDescription[OneRFIDSmartFeeder](
             key="wifi_ssid",
+            fields=frozenset({"realInfo"}),
             translation_key="wifi_ssid",
             icon="mdi:wifi",
             name="Wi-Fi SSID"
         ),
         PetLibroSensorEntityDescription[OneRFIDSmartFeeder](
             key="wifi_rssi",
+            fields=frozenset({"realInfo"}),
             translation_key="wifi_rssi",
             icon="mdi:wifi",
             native_unit_of_measurement="dBm",
@@ -485,18 +530,21 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[OneRFIDSmartFeeder](
             key="remaining_desiccant",
+            fields=frozenset({"realInfo"}),
             translation_key="remaining_desiccant",
             icon="mdi:package",
             name="Remaining Desiccant Days"
         ),
         PetLibroSensorEntityDescription[OneRFIDSmartFeeder](
             key="battery_state",
+            fields=frozenset({"realInfo"}),
             translation_key="battery_state",
             icon="mdi:battery",
             name="Battery Level"
         ),
         PetLibroSensorEntityDescription[OneRFIDSmartFeeder](
             key="electric_quantity",
+            fields=frozenset({"realInfo"}),
             translation_key="electric_quantity",
             icon="mdi:battery",
             native_unit_of_measurement="%",
@@ -506,6 +554,7 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[OneRFIDSmartFeeder](
             key="feeding_plan_state",
+            fields=frozenset({"realInfo"}),
             translation_key="feeding_plan_state",
             icon="mdi:calendar-check",
             name="Feeding Plan State",
@@ -513,6 +562,7 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[OneRFIDSmartFeeder](
             key="today_feeding_quantity",
+            fields=frozenset({"grainStatus", "realInfo"}),
             translation_key="today_feeding_quantity",
             icon="mdi:scale",
             native_unit_of_measurement_fn=unit_of_measurement_feeder,
@@ -522,6 +572,7 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[OneRFIDSmartFeeder](
             key="today_feeding_times",
+            fields=frozenset({"grainStatus"}),
             translation_key="today_feeding_times",
             icon="mdi:history",
             state_class=SensorStateClass.TOTAL_INCREASING,
@@ -529,6 +580,7 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[OneRFIDSmartFeeder](
             key="today_eating_times",
+            fields=frozenset({"grainStatus"}),
             translation_key="today_eating_times",
             icon="mdi:history",
             state_class=SensorStateClass.TOTAL_INCREASING,
@@ -536,6 +588,7 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[OneRFIDSmartFeeder](
             key="today_eating_time",
+            fields=frozenset({"grainStatus"}),
             translation_key="today_eating_time",
             native_unit_of_measurement="s",
             icon="mdi:history",
@@ -546,24 +599,28 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
     DockstreamSmartFountain: [
         PetLibroSensorEntityDescription[DockstreamSmartFountain](
             key="device_sn",
+            fields=frozenset({"realInfo"}),
             translation_key="device_sn",
             icon="mdi:identifier",
             name="Device SN"
         ),
         PetLibroSensorEntityDescription[DockstreamSmartFountain](
             key="mac",
+            fields=frozenset({"mac"}),
             translation_key="mac_address",
             icon="mdi:network",
             name="MAC Address"
         ),
         PetLibroSensorEntityDescription[DockstreamSmartFountain](
             key="wifi_ssid",
+            fields=frozenset({"realInfo"}),
             translation_key="wifi_ssid",
             icon="mdi:wifi",
             name="Wi-Fi SSID"
         ),
         PetLibroSensorEntityDescription[DockstreamSmartFountain](
             key="wifi_rssi",
+            fields=frozenset({"realInfo"}),
             translation_key="wifi_rssi",
             icon="mdi:wifi",
             native_unit_of_measurement="dBm",
@@ -573,12 +630,14 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[DockstreamSmartFountain](
             key="remaining_cleaning_days",
+            fields=frozenset({"realInfo"}),
             translation_key="remaining_cleaning_days",
             icon="mdi:package",
             name="Remaining Cleaning Days"
         ),
         PetLibroSensorEntityDescription[DockstreamSmartFountain](
             key="weight",
+            fields=frozenset({"realInfo"}),
             translation_key="weight",
             icon="mdi:scale",
             native_unit_of_measurement="oz",
@@ -588,6 +647,7 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[DockstreamSmartFountain](
             key="weight_percent",
+            fields=frozenset({"realInfo"}),
             translation_key="weight_percent",
             icon="mdi:scale",
             native_unit_of_measurement="%",
@@ -596,6 +656,7 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[DockstreamSmartFountain](
             key="use_water_interval",
+            fields=frozenset({"realInfo"}),
             translation_key="use_water_interval",
             icon="mdi:water",
             native_unit_of_measurement="min",
@@ -603,6 +664,7 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[DockstreamSmartFountain](
             key="use_water_duration",
+            fields=frozenset({"realInfo"}),
             translation_key="use_water_duration",
             icon="mdi:water",
             native_unit_of_measurement="min",
@@ -610,6 +672,7 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[DockstreamSmartFountain](
             key="remaining_filter_days",
+            fields=frozenset({"realInfo"}),
             translation_key="remaining_filter_days",
             icon="mdi:package",
             native_unit_of_measurement="days",
@@ -619,24 +682,28 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
     DockstreamSmartRFIDFountain: [
         PetLibroSensorEntityDescription[DockstreamSmartRFIDFountain](
             key="device_sn",
+            fields=frozenset({"realInfo"}),
             translation_key="device_sn",
             icon="mdi:identifier",
             name="Device SN"
         ),
         PetLibroSensorEntityDescription[DockstreamSmartRFIDFountain](
             key="mac",
+            fields=frozenset({"mac"}),
             translation_key="mac_address",
             icon="mdi:network",
             name="MAC Address"
         ),
         PetLibroSensorEntityDescription[DockstreamSmartRFIDFountain](
             key="wifi_ssid",
+            fields=frozenset({"realInfo"}),
             translation_key="wifi_ssid",
             icon="mdi:wifi",
             name="Wi-Fi SSID"
         ),
         PetLibroSensorEntityDescription[DockstreamSmartRFIDFountain](
             key="wifi_rssi",
+            fields=frozenset({"realInfo"}),
             translation_key="wifi_rssi",
             icon="mdi:wifi",
             native_unit_of_measurement="dBm",
@@ -646,12 +713,14 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[DockstreamSmartRFIDFountain](
             key="remaining_cleaning_days",
+            fields=frozenset({"realInfo"}),
             translation_key="remaining_cleaning_days",
             icon="mdi:package",
             name="Remaining Cleaning Days"
         ),
         PetLibroSensorEntityDescription[DockstreamSmartRFIDFountain](
             key="weight",
+            fields=frozenset({"realInfo"}),
             translation_key="weight",
             icon="mdi:scale",
             native_unit_of_measurement="oz",
@@ -661,6 +730,7 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[DockstreamSmartRFIDFountain](
             key="weight_percent",
+            fields=frozenset({"realInfo"}),
             translation_key="weight_percent",
             icon="mdi:scale",
             native_unit_of_measurement="%",
@@ -669,6 +739,7 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[DockstreamSmartRFIDFountain](
             key="use_water_interval",
+            fields=frozenset({"realInfo"}),
             translation_key="use_water_interval",
             icon="mdi:water",
             native_unit_of_measurement="min",
@@ -676,6 +747,7 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
         ),
         PetLibroSensorEntityDescription[DockstreamSmartRFIDFountain](
             key="use_water_duration",
+            fields=frozenset({"realInfo"}),
             translation_key="use_water_duration",
             icon="mdi:water",
             native_unit_of_measurement="min",
@@ -692,6 +764,7 @@ DEVICE_SENSOR_MAP: dict[type[Device], list[PetLibroSensorEntityDescription]] = {
 #        ),
         PetLibroSensorEntityDescription[DockstreamSmartRFIDFountain](
             key="remaining_filter_days",
+            fields=frozenset({"realInfo"}),
             translation_key="remaining_filter_days",
             icon="mdi:package",
             native_unit_of_measurement="days",
@@ -728,19 +801,23 @@ async def async_setup_entry(
     entities = [
         sensor
         for device in devices
-        for sensor in device.build_sensors(hub.coordinator)
+        for sensor in device.build_sensors(hub.coordinator_for(device))
     ]
 
     if not entities:
         # if build_sensors does not return anything, build sensors from the global map
         entities = [
-            PetLibroDescribedSensorEntity(device, hub.coordinator, description)
+            PetLibroDescribedSensorEntity(device, hub.coordinator_for(device), description)
             for device in devices
             for device_type, entity_descriptions in DEVICE_SENSOR_MAP.items()
             if isinstance(device, device_type)
             for description in entity_descriptions
         ]
 
+    entities.extend(
+        PetLibroHealthSensorEntity(device, hub.coordinator_for(device), HEALTH_SENSOR_DESCRIPTION) for device in devices
+    )
+
     if not entities:
         _LOGGER.warning("No sensors added, entities list is empty!")
     else:
@@ -10,7 +10,7 @@ from collections.abc import Callable, Coroutine
 from dataclasses import dataclass
 from functools import cached_property
 from typing import Any, Generic
-import logging
+from .log import get_logger
 from .const import DOMAIN
 from homeassistant.components.switch import SwitchEntity, SwitchEntityDescription
 from homeassistant.const import EntityCategory
@@ -19,7 +19,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.config_entries import ConfigEntry  # Added ConfigEntry import
 from .hub import PetLibroHub  # Adjust the import path as necessary
 
-_LOGGER = logging.getLogger(__name__)
+_LOGGER = get_logger(__name__)
 
 from .entity import PetLibroEntity, _DeviceT, PetLibroEntityDescription
 from .devices import Device
@@ -116,7 +116,7 @@ async def async_setup_entry(
 
     # Create switch entities for each device based on the switch map
     entities = [
-        PetLibroSwitchEntity(device, hub, description)
+        PetLibroSwitchEntity(device, hub.coordinator_for(device), description)
         for device in devices  # Iterate through devices from the hub
         for device_type, entity_descriptions in DEVICE_SWITCH_MAP.items()
         if isinstance(device, device_type)
@@ -0,0 +1,113 @@
+"""Account-wide request throttling for the PETLIBRO cloud."""
+
+from __future__ import annotations
+
+import asyncio
+
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from time import monotonic
+
+READ = "read"
+COMMAND = "command"
+
+
+class TokenBucket:
+    """Token bucket handing out one token per request, in FIFO order."""
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.waiting = 0
+        self._tokens = capacity
+        self._updated_at = monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        self.waiting += 1
+        try:
+            async with self._lock:
+                while True:
+                    self._refill()
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+                    await asyncio.sleep((1 - self._tokens) / self.rate)
+        finally:
+            self.waiting -= 1
+
+    @property
+    def tokens(self) -> float:
+        """Return the number of tokens currently available."""
+        self._refill()
+        return self._tokens
+
+
+class RateLimiter:
+    """Separate read and command budgets, plus a global pause honouring Retry-After."""
+
+    def __init__(self, read_rate: float, read_burst: float, command_rate: float, command_burst: float,
+                 default_retry_after: float) -> None:
+        self.buckets = {
+            READ: TokenBucket(read_rate, read_burst),
+            COMMAND: TokenBucket(command_rate, command_burst),
+        }
+        self.default_retry_after = default_retry_after
+        self.throttled = 0  # Number of 429 responses received
+        self._paused_until = 0.0
+
+    async def acquire(self, kind: str) -> None:
+        """Wait for any Retry-After pause to pass, then for a token of the given kind."""
+        while (delay := self._paused_until - monotonic()) > 0:
+            await asyncio.sleep(delay)
+        await self.buckets[kind].acquire()
+
+    def defer(self, retry_after: str | None) -> float:
+        """Pause all requests after a 429 response and return the pause in seconds."""
+        delay = self.parse_retry_after(retry_after)
+        if delay is None:
+            delay = self.default_retry_after
+        self.throttled += 1
+        self._paused_until = max(self._paused_until, monotonic() + delay)
+        return delay
+
+    @staticmethod
+    def parse_retry_after(value: str | None) -> float | None:
+        """Parse a Retry-After header given either in seconds or as an HTTP date."""
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    @property
+    def queue_depth(self) -> int:
+        """Return the number of requests waiting for a token."""
+        return sum(bucket.waiting for bucket in self.buckets.values())
+
+    @property
+    def stats(self) -> dict[str, float]:
+        """Return the limiter state."""
+        return {
+            "queue_depth": self.queue_depth,
+            "read_waiting": self.buckets[READ].waiting,
+            "read_tokens": round(self.buckets[READ].tokens, 2),
+            "command_waiting": self.buckets[COMMAND].waiting,
+            "command_tokens": round(self.buckets[COMMAND].tokens, 2),
+            "throttled": self.throttled,
+            "paused_for": round(max(0.0, self._paused_until - monotonic()), 2),
+        }
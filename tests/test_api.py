@@ -0,0 +1,90 @@
+"""Tests of the PETLIBRO API session."""
+
+from __future__ import annotations
+
+import asyncio
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.petlibro.api import PetLibroAPI, PetLibroSession  # noqa: E402
+from custom_components.petlibro.const import CAPABILITY_MAX_MISSES  # noqa: E402
+from custom_components.petlibro.exceptions import PetLibroAPIError, PetLibroResponseCodeError  # noqa: E402
+from custom_components.petlibro.retry import CircuitBreaker  # noqa: E402
+
+
+def _session(**kwargs) -> PetLibroSession:
+    return PetLibroSession("https://api.example.com", MagicMock(), "user@example.com", "secret", "US", **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_failed_proactive_login_keeps_the_breaker_trial_free():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()  # Half-open right away
+    session = _session(circuit_breaker=breaker)
+    session.set_token("expiring")
+    session._token_lifetime = 0.0
+
+    with patch.object(session, "re_login", AsyncMock(side_effect=PetLibroAPIError("Login failed"))):
+        with pytest.raises(PetLibroAPIError):
+            await session.request("POST", "/device/device/realInfo", json={})
+
+    assert breaker.state == "half_open"
+
+
+@pytest.mark.asyncio
+async def test_cancelled_trial_request_frees_the_breaker():
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    session = _session(circuit_breaker=breaker)
+    session.set_token("valid")
+    sent = asyncio.Event()
+
+    async def hang(*args, **kwargs):
+        sent.set()
+        await asyncio.Event().wait()
+
+    with patch.object(session, "_send", side_effect=hang):
+        request = asyncio.get_running_loop().create_task(session.request("POST", "/device/device/realInfo", json={}))
+        await sent.wait()
+        request.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await request
+
+    assert breaker.state == "half_open"
+    breaker.before_request()  # The next request is the trial
+
+
+@pytest.mark.asyncio
+async def test_command_resent_under_the_same_request_id_is_not_sent_again():
+    api = PetLibroAPI(MagicMock(), "America/Chicago", "US", "user@example.com", "secret")
+    api.session.set_token("valid")
+
+    with patch.object(api.session, "_send", AsyncMock(return_value=0)) as send:
+        assert await api.set_manual_feed("AF0301000000000", request_id="feed") == 0
+        assert await api.set_manual_feed("AF0301000000000", request_id="feed") == 0  # Answered by the ledger
+        assert send.await_count == 1
+
+        await api.set_manual_feed("AF0301000000000", request_id="next feed")
+        assert send.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_only_refusals_make_an_endpoint_unsupported():
+    api = PetLibroAPI(MagicMock(), "America/Chicago", "US", "user@example.com", "secret")
+    profile = "PLAF103/1.0.0"
+
+    with patch.object(api, "_fetch_and_cache", AsyncMock(return_value={})):  # No feeding plan set up
+        for _ in range(CAPABILITY_MAX_MISSES):
+            assert await api.device_endpoint("AF0301000000000", "feedingPlanTodayNew", profile, fresh=True) == {}
+    assert api.endpoint_supported(profile, "feedingPlanTodayNew")
+
+    refused = AsyncMock(side_effect=PetLibroResponseCodeError("Unsupported", 1001))
+    with patch.object(api, "_fetch_and_cache", refused):
+        for _ in range(CAPABILITY_MAX_MISSES):
+            with pytest.raises(PetLibroResponseCodeError):
+                await api.device_endpoint("AF0301000000000", "feedingPlanTodayNew", profile, fresh=True)
+    assert not api.endpoint_supported(profile, "feedingPlanTodayNew")
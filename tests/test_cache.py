@@ -0,0 +1,97 @@
+"""Tests of the PETLIBRO response cache."""
+
+from __future__ import annotations
+
+import asyncio
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.petlibro.api import PetLibroAPI  # noqa: E402
+from custom_components.petlibro.cache import FRESH, STALE, ResponseCache  # noqa: E402
+
+SERIAL = "AF0301000000000"
+REAL_INFO = "/device/device/realInfo"
+
+
+class Clock:
+    """Stand in for time.monotonic in the cache module."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    clock = Clock()
+    with patch("custom_components.petlibro.cache.monotonic", clock):
+        yield clock
+
+
+def test_entry_is_fresh_then_stale_then_expired(clock):
+    cache = ResponseCache()
+    cache.set(SERIAL, "realInfo", {"online": True}, ttl=10, stale_ttl=20)
+
+    assert cache.get(SERIAL, "realInfo") == ({"online": True}, FRESH)
+    clock.now += 10
+    assert cache.get(SERIAL, "realInfo") == ({"online": True}, STALE)
+    clock.now += 20
+    assert cache.get(SERIAL, "realInfo") == (None, None)
+
+    assert cache.stats == {"size": 0, "hits": 1, "stale_hits": 1, "misses": 1, "evictions": 0}
+
+
+def test_entry_without_stale_window_expires_with_its_ttl(clock):
+    cache = ResponseCache()
+    cache.set(SERIAL, "realInfo", {}, ttl=10)
+
+    clock.now += 10
+    assert cache.get(SERIAL, "realInfo") == (None, None)
+
+
+def test_least_recently_used_entry_is_evicted(clock):
+    cache = ResponseCache(max_size=2)
+    cache.set(SERIAL, "realInfo", 1, ttl=10)
+    cache.set(SERIAL, "grainStatus", 2, ttl=10)
+    cache.get(SERIAL, "realInfo")  # Now the most recently used
+    cache.set(SERIAL, "baseInfo", 3, ttl=10)
+
+    assert cache.get(SERIAL, "grainStatus") == (None, None)
+    assert cache.get(SERIAL, "realInfo") == (1, FRESH)
+    assert cache.get(SERIAL, "baseInfo") == (3, FRESH)
+    assert cache.stats["evictions"] == 1
+
+
+def test_invalidate_drops_only_the_given_endpoints_of_the_device(clock):
+    cache = ResponseCache()
+    cache.set(SERIAL, "realInfo", 1, ttl=10)
+    cache.set(SERIAL, "grainStatus", 2, ttl=10)
+    cache.set("OTHER", "realInfo", 3, ttl=10)
+
+    cache.invalidate(SERIAL, ("realInfo",))
+    assert cache.get(SERIAL, "realInfo") == (None, None)
+    assert cache.get(SERIAL, "grainStatus") == (2, FRESH)
+
+    cache.invalidate(SERIAL)
+    assert cache.get(SERIAL, "grainStatus") == (None, None)
+    assert cache.get("OTHER", "realInfo") == (3, FRESH)
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_served_while_revalidating(clock):
+    api = PetLibroAPI(MagicMock(), "America/Chicago", "US", "user@example.com", "secret")
+    api.session.post_serial = AsyncMock(return_value={"online": False})
+    api._cache.set(SERIAL, REAL_INFO, {"online": True}, ttl=0, stale_ttl=60)
+
+    assert await api._cached_read(REAL_INFO, SERIAL) == {"online": True}  # Right away, not waiting for the API
+    assert await api._cached_read(REAL_INFO, SERIAL) == {"online": True}
+    await asyncio.gather(*api._revalidations.values())
+
+    api.session.post_serial.assert_awaited_once_with(REAL_INFO, SERIAL)  # A single background refresh
+    assert await api._cached_read(REAL_INFO, SERIAL) == {"online": False}
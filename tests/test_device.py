@@ -0,0 +1,174 @@
+"""Tests of the PETLIBRO device state and refresh."""
+
+from __future__ import annotations
+
+import asyncio
+
+from datetime import datetime, time
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.petlibro.api import PetLibroAPI  # noqa: E402
+from custom_components.petlibro.const import POLL_BURST_SECONDS, POLL_IDLE_SECONDS  # noqa: E402
+from custom_components.petlibro.devices.event import EVENT_UPDATE  # noqa: E402
+from custom_components.petlibro.devices.models import parse_endpoint  # noqa: E402
+from custom_components.petlibro.devices.feeders.granary_smart_feeder import GranarySmartFeeder  # noqa: E402
+
+DEVICE = {
+    "deviceSn": "AF0301000000000",
+    "productName": "Granary Smart Feeder",
+    "productIdentifier": "PLAF103",
+    "name": "Feeder",
+    "online": True,
+    "timezone": "America/Chicago",
+}
+
+
+class FakeAPI:
+    """Answer the device reads with fixed payloads, raising the ones that are exceptions."""
+
+    CORE_ENDPOINTS = PetLibroAPI.CORE_ENDPOINTS
+    COMMAND_ENDPOINTS = PetLibroAPI.COMMAND_ENDPOINTS
+
+    def __init__(self, payloads: dict) -> None:
+        self.payloads = payloads
+        self.calls: list[str] = []
+        self.gate: asyncio.Event | None = None  # When set, reads wait for it
+
+    def endpoint_supported(self, profile: str | None, endpoint: str) -> bool:
+        return True
+
+    async def device_endpoint(self, serial: str, endpoint: str, profile: str | None = None, fresh: bool = False):
+        self.calls.append(endpoint)
+        if self.gate is not None:
+            await self.gate.wait()
+        payload = self.payloads.get(endpoint, {})
+        if isinstance(payload, Exception):
+            raise payload
+        return payload
+
+    async def set_feeding_plan(self, serial: str, value: bool) -> None:
+        self.calls.append("set_feeding_plan")
+
+    async def set_manual_feed(self, serial: str, request_id: str | None = None) -> int:
+        self.calls.append(f"set_manual_feed {request_id}")
+        if len(self.calls) == 1:
+            raise asyncio.TimeoutError()  # Every retry of the session timed out
+        return 0
+
+
+def _count(device: GranarySmartFeeder, field: str) -> list[int]:
+    """Return a counter of the updates emitted for a field."""
+    counter = [0]
+
+    def listener() -> None:
+        counter[0] += 1
+
+    device.on(EVENT_UPDATE, listener, (field,))
+    return counter
+
+
+@pytest.mark.asyncio
+async def test_batch_collects_only_the_updates_of_its_task():
+    device = GranarySmartFeeder(dict(DEVICE), None)
+    names, online = _count(device, "name"), _count(device, "online")
+    release = asyncio.Event()
+
+    async def poll() -> None:
+        with device.batch():
+            device.update_data({"name": "Polled"})
+            await release.wait()
+
+    task = asyncio.get_running_loop().create_task(poll())
+    await asyncio.sleep(0)
+    device.update_data({"online": False})  # E.g. an optimistic command update
+    assert (names[0], online[0]) == (0, 1)
+
+    release.set()
+    await task
+    assert (names[0], online[0]) == (1, 1)
+
+
+def test_feeding_plan_times_drive_the_realtime_cadence():
+    device = GranarySmartFeeder(dict(DEVICE), None)
+    plans = [{"executionTime": "08:00"}, {"executionTime": "12:00"}, {"executionTime": None}]
+    device.update_data({"feedingPlanTodayNew": parse_endpoint("feedingPlanTodayNew", {"plans": plans})})
+    chicago = ZoneInfo("America/Chicago")
+    today = datetime.now(chicago).date()
+
+    assert device.expected_events() == [
+        datetime.combine(today, time(8), chicago), datetime.combine(today, time(12), chicago)
+    ]
+    assert device.realtime_interval(datetime.combine(today, time(7, 59, 30), chicago)) == POLL_BURST_SECONDS
+    assert device.realtime_interval(datetime.combine(today, time(9), chicago)) == POLL_IDLE_SECONDS
+
+    device.update_data({"feedingPlanTodayNew": parse_endpoint(
+        "feedingPlanTodayNew", {"allSkipped": True, "plans": plans}
+    )})
+    assert device.expected_events() == []
+
+
+@pytest.mark.asyncio
+async def test_refresh_stores_nested_endpoints_only_as_their_model():
+    api = FakeAPI({
+        "baseInfo": {"softwareVersion": "2.0.0"},
+        "realInfo": {"online": True, "wifiRssi": -40, "enableFeedingPlan": True, "remainingDesiccantDays": 12},
+    })
+    device = GranarySmartFeeder(dict(DEVICE), api)
+    await device.refresh()
+
+    assert (device.wifi_rssi, device.feeding_plan_state, device.remaining_desiccant) == (-40, True, 12)
+    assert device.software_version == "2.0.0"
+    assert "wifiRssi" not in device._data
+
+
+@pytest.mark.asyncio
+async def test_confirmation_cancelled_during_its_read_keeps_its_endpoints():
+    api = FakeAPI({})
+    api.gate = asyncio.Event()
+    device = GranarySmartFeeder(dict(DEVICE), api)
+
+    with patch("custom_components.petlibro.devices.device.COMMAND_CONFIRM_DELAY_SECONDS", 0):
+        device.confirm_later(("realInfo",))
+        await asyncio.sleep(0.01)
+        assert api.calls == ["realInfo"]
+
+        device.confirm_later(("grainStatus",))  # Cancels the running read
+        api.gate.set()
+        await device._confirmation
+
+    assert sorted(api.calls[1:]) == ["grainStatus", "realInfo"]
+
+
+@pytest.mark.asyncio
+async def test_command_does_not_wait_for_a_read_and_survives_it():
+    api = FakeAPI({"realInfo": {"enableFeedingPlan": False}})
+    api.gate = asyncio.Event()
+    device = GranarySmartFeeder(dict(DEVICE), api)
+
+    read = asyncio.get_running_loop().create_task(device.refresh(["realInfo"]))
+    await asyncio.sleep(0)
+    with patch("custom_components.petlibro.devices.device.COMMAND_DEBOUNCE_SECONDS", 0):
+        await asyncio.wait_for(device.set_feeding_plan(True), 1)  # Sent while the read is in flight
+    api.gate.set()
+    await read
+    device._cancel_confirmation()
+
+    assert api.calls == ["realInfo", "set_feeding_plan"]
+    assert device.feeding_plan_state  # The answer read before the command does not undo it
+
+
+@pytest.mark.asyncio
+async def test_command_is_resent_under_the_request_id_of_its_first_send():
+    api = FakeAPI({})
+    device = GranarySmartFeeder(dict(DEVICE), api)
+
+    await device.set_manual_feed()
+    device._cancel_confirmation()
+
+    first, second = api.calls
+    assert first == second and first != "set_manual_feed None"
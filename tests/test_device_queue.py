@@ -0,0 +1,133 @@
+"""Tests of the per-device operation queue."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.petlibro.devices.device_queue import (  # noqa: E402
+    PRIORITY_FEED,
+    PRIORITY_READ,
+    PRIORITY_SETTING,
+    DeviceQueue,
+)
+from custom_components.petlibro.exceptions import PetLibroQueueFullError  # noqa: E402
+
+
+async def _run(queue: DeviceQueue, priority: int, name: str, order: list[str], release: asyncio.Event | None = None) -> None:
+    async with queue.slot(priority):
+        order.append(name)
+        if release is not None:
+            await release.wait()
+
+
+def _start(*coroutines) -> list[asyncio.Task]:
+    return [asyncio.get_running_loop().create_task(coroutine) for coroutine in coroutines]
+
+
+@pytest.mark.asyncio
+async def test_feed_runs_before_settings_and_settings_before_reads():
+    queue = DeviceQueue(max_depth=10)
+    order: list[str] = []
+    release = asyncio.Event()
+    tasks = _start(_run(queue, PRIORITY_SETTING, "running", order, release))
+    await asyncio.sleep(0)
+
+    tasks += _start(
+        _run(queue, PRIORITY_READ, "read", order),
+        _run(queue, PRIORITY_SETTING, "setting 1", order),
+        _run(queue, PRIORITY_FEED, "feed", order),
+        _run(queue, PRIORITY_SETTING, "setting 2", order),
+    )
+    await asyncio.sleep(0)
+    assert queue.depth == 4
+    release.set()
+    await asyncio.gather(*tasks)
+
+    assert order == ["running", "feed", "setting 1", "setting 2", "read"]
+    assert queue.stats["completed_read"] == 1 and not queue.stats["busy"]
+
+
+@pytest.mark.asyncio
+async def test_commands_do_not_wait_for_reads():
+    queue = DeviceQueue(max_depth=10)
+    order: list[str] = []
+    release = asyncio.Event()
+    reads = _start(_run(queue, PRIORITY_READ, "read 1", order, release), _run(queue, PRIORITY_READ, "read 2", order, release))
+    await asyncio.sleep(0)
+
+    await asyncio.wait_for(_run(queue, PRIORITY_FEED, "feed", order), 1)
+    release.set()
+    await asyncio.gather(*reads)
+
+    assert order == ["read 1", "read 2", "feed"]
+
+
+@pytest.mark.asyncio
+async def test_operations_beyond_max_depth_are_rejected():
+    queue = DeviceQueue(max_depth=1)
+    order: list[str] = []
+    release = asyncio.Event()
+    tasks = _start(_run(queue, PRIORITY_SETTING, "running", order, release), _run(queue, PRIORITY_READ, "read", order))
+    await asyncio.sleep(0)
+
+    with pytest.raises(PetLibroQueueFullError):
+        await _run(queue, PRIORITY_FEED, "feed", order)
+    assert queue.stats["rejected"] == 1
+
+    release.set()
+    await asyncio.gather(*tasks)
+    assert order == ["running", "read"]
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_the_queue_consistent():
+    queue = DeviceQueue(max_depth=10)
+    order: list[str] = []
+    release = asyncio.Event()
+    running, cancelled, waiting = _start(
+        _run(queue, PRIORITY_SETTING, "running", order, release),
+        _run(queue, PRIORITY_FEED, "cancelled", order),
+        _run(queue, PRIORITY_SETTING, "waiting", order),
+    )
+    await asyncio.sleep(0)
+
+    cancelled.cancel()
+    await asyncio.gather(cancelled, return_exceptions=True)
+    assert queue.depth == 1
+    release.set()
+    await asyncio.gather(running, waiting)
+
+    assert order == ["running", "waiting"]
+    assert (queue.depth, queue.stats["busy"]) == (0, False)
+
+
+@pytest.mark.asyncio
+async def test_command_cancelled_once_handed_the_device_passes_it_on():
+    queue = DeviceQueue(max_depth=10)
+    order: list[str] = []
+    release = asyncio.Event()
+    running, handed, waiting = _start(
+        _run(queue, PRIORITY_SETTING, "running", order, release),
+        _run(queue, PRIORITY_FEED, "handed", order),
+        _run(queue, PRIORITY_SETTING, "waiting", order),
+    )
+    await asyncio.sleep(0)
+
+    release_device = queue._release
+
+    def release_then_cancel() -> None:
+        release_device()  # Hands the device to the feed, cancelled before it resumes
+        queue._release = release_device
+        handed.cancel()
+
+    queue._release = release_then_cancel
+    release.set()
+    await asyncio.gather(running, handed, return_exceptions=True)
+    await asyncio.wait_for(waiting, 1)  # Would wait forever for a device nobody holds
+
+    assert order == ["running", "waiting"]
+    assert not queue.stats["busy"]
@@ -0,0 +1,69 @@
+"""Tests of the entity descriptions."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.petlibro import binary_sensor, button, number, sensor  # noqa: E402
+
+DEVICE = {
+    "deviceSn": "AF0301000000000",
+    "productName": "Smart Feeder",
+    "productIdentifier": "PLAF103",
+    "name": "Feeder",
+    "mac": "AA:BB:CC:DD:EE:00",
+    "online": True,
+    "timezone": "America/Chicago",
+}
+
+# Entity class and the properties making up its state, for each platform
+PLATFORMS = [
+    (binary_sensor.DEVICE_BINARY_SENSOR_MAP, binary_sensor.PetLibroBinarySensorEntity, ("is_on", "available")),
+    (button.DEVICE_BUTTON_MAP, button.PetLibroButtonEntity, ("available",)),
+    (number.DEVICE_NUMBER_MAP, number.PetLibroNumberEntity, ("native_value", "available")),
+    (sensor.DEVICE_SENSOR_MAP, sensor.PetLibroDescribedSensorEntity,
+     ("native_value", "native_unit_of_measurement", "device_class", "available")),
+]
+
+
+class ReadKeys(dict):
+    """Device data recording the keys read."""
+
+    def __init__(self, data: dict) -> None:
+        super().__init__(data)
+        self.read: set[str] = set()
+
+    def get(self, key, default=None):
+        self.read.add(key)
+        return super().get(key, default)
+
+    def __getitem__(self, key):
+        self.read.add(key)
+        return super().__getitem__(key)
+
+    def __contains__(self, key) -> bool:
+        self.read.add(key)
+        return super().__contains__(key)
+
+
+@pytest.mark.parametrize(("device_type", "entity_type", "properties", "description"), [
+    pytest.param(device_type, entity_type, properties, description, id=f"{device_type.__name__}-{description.key}")
+    for device_map, entity_type, properties in PLATFORMS
+    for device_type, descriptions in device_map.items()
+    for description in descriptions
+])
+def test_description_fields_cover_the_data_its_state_reads(device_type, entity_type, properties, description):
+    device = device_type(dict(DEVICE), None)
+    entity = entity_type(device, MagicMock(), description)
+    device._data = data = ReadKeys(device._data)
+
+    for name in properties:
+        getattr(entity, name)
+
+    assert description.fields is not None
+    # The number entities log the device name and serial, which do not change their state
+    assert data.read - {"deviceSn", "name"} <= description.fields
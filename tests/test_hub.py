@@ -0,0 +1,141 @@
+"""Tests of the PETLIBRO hub refresh cycle, against a fake PETLIBRO cloud."""
+
+from __future__ import annotations
+
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest_asyncio = pytest.importorskip("pytest_asyncio")
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers import frame  # noqa: E402
+from homeassistant.helpers.update_coordinator import UpdateFailed  # noqa: E402
+
+from custom_components.petlibro import async_setup_entry  # noqa: E402
+from custom_components.petlibro.api import PetLibroAPIError  # noqa: E402
+from custom_components.petlibro.devices.device_queue import PRIORITY_SETTING  # noqa: E402
+from custom_components.petlibro.const import (  # noqa: E402
+    CONF_EMAIL, CONF_PASSWORD, DOMAIN, QUARANTINE_AFTER_FAILURES
+)
+from custom_components.petlibro.hub import PetLibroHub  # noqa: E402
+
+SERIAL = "AF0301000000000"
+DEVICE = {
+    "deviceSn": SERIAL,
+    "productName": "Granary Smart Feeder",
+    "productIdentifier": "PLAF103",
+    "name": "Feeder",
+    "mac": "AA:BB:CC:DD:EE:00",
+    "online": True,
+    "softwareVersion": "1.0.0",
+    "timezone": "America/Chicago",
+}
+
+
+async def _cloud(method: str, url: str, **kwargs: Any) -> Any:
+    """Answer the requests of the hub like the PETLIBRO cloud does."""
+    if url == "/device/device/list":
+        return [DEVICE]
+    return {"deviceSn": SERIAL, "online": True}
+
+
+@pytest_asyncio.fixture
+async def hass(tmp_path):
+    hass = HomeAssistant(str(tmp_path))
+    hass.config.time_zone = "America/Chicago"
+    frame.async_setup(hass)
+    yield hass
+    await hass.async_stop(force=True)
+
+
+@pytest_asyncio.fixture
+async def hub(hass):
+    hub = PetLibroHub(hass, {CONF_EMAIL: "user@example.com", CONF_PASSWORD: "secret", "region": "US"})
+    with patch.object(hub.api.session, "request", side_effect=_cloud):
+        await hub.load_devices()
+        yield hub
+    await hub.async_unload()
+
+
+@pytest.mark.asyncio
+async def test_failed_setup_leaves_no_polling_hub_behind(hass):
+    entry = MagicMock(entry_id="entry", data={CONF_EMAIL: "user@example.com", CONF_PASSWORD: "secret", "region": "US"})
+    hubs = []
+
+    async def unreachable(hub: PetLibroHub) -> None:
+        hubs.append(hub)
+        raise PetLibroAPIError("Cannot reach the cloud")
+
+    with patch.object(PetLibroHub, "load_devices", autospec=True, side_effect=unreachable):
+        assert not await async_setup_entry(hass, entry)
+
+    hub, = hubs
+    assert entry.entry_id not in hass.data[DOMAIN]
+    assert not hub.coordinator._listeners
+    assert hub.api.session.websession.closed  # The connection pool owned by the hub
+
+
+@pytest.mark.asyncio
+async def test_refresh_devices(hub):
+    view = await hub.refresh_devices()
+
+    assert list(view["devices"]) == [SERIAL]
+    assert view["devices"][SERIAL]["health"]["state"] == "ok"
+    assert view["cache"] == hub.api.cache_stats
+    assert view["capabilities"] == hub.api.capabilities.stats
+
+
+@pytest.mark.asyncio
+async def test_refresh_device_fails_when_every_endpoint_fails(hub):
+    device = hub.devices[0]
+    hub.last_refresh_times.clear()  # Not just loaded
+
+    async def offline(method: str, url: str, **kwargs: Any) -> Any:
+        raise PetLibroAPIError("Device is offline")
+
+    with patch.object(hub.api.session, "request", side_effect=offline):
+        for _ in range(QUARANTINE_AFTER_FAILURES):
+            with pytest.raises(UpdateFailed):
+                await hub.refresh_device(device)
+
+    assert device.health.quarantined
+    # A quarantined device not due for a probe keeps failing its coordinator
+    with pytest.raises(UpdateFailed):
+        await hub.refresh_device(device)
+
+
+@pytest.mark.asyncio
+async def test_failing_optional_endpoint_does_not_quarantine(hub):
+    device = hub.devices[0]
+
+    async def no_settings(method: str, url: str, **kwargs: Any) -> Any:
+        if url == "/device/setting/getAttributeSetting":
+            raise PetLibroAPIError("Not supported")
+        return await _cloud(method, url, **kwargs)
+
+    with patch.object(hub.api.session, "request", side_effect=no_settings):
+        for _ in range(QUARANTINE_AFTER_FAILURES + 1):
+            hub.last_refresh_times.clear()
+            device._polled_at.clear()  # Every endpoint due again
+            assert await hub.refresh_device(device)
+            # Backed off on its own, not retried by the next cycle
+            assert "getAttributeSetting" not in device.due_endpoints()
+            device._retry_at.clear()
+
+    assert device.health.state == "ok"
+
+
+@pytest.mark.asyncio
+async def test_full_queue_skips_the_refresh_without_failing(hub):
+    device = hub.devices[0]
+    hub.last_refresh_times.clear()
+    device.queue.max_depth = 0
+
+    async with device.queue.slot(PRIORITY_SETTING):  # A command running, no room for the read
+        assert await hub.refresh_device(device)
+
+    assert device.health.state == "ok" and not device.health.consecutive_failures
+    assert device.due_endpoints()  # Left for the next cycle
@@ -0,0 +1,105 @@
+"""Tests of the typed endpoint models."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.petlibro.devices.feeders.granary_smart_feeder import GranarySmartFeeder  # noqa: E402
+from custom_components.petlibro.devices.models import (  # noqa: E402
+    AttributeSettings,
+    FeedingPlanToday,
+    GrainStatus,
+    RealInfo,
+    WetFeedingPlan,
+    or_default,
+    parse_endpoint,
+)
+
+# The defaults the devices read with payload.get(key, default) before the endpoints had models
+OLD_DEFAULTS = {
+    RealInfo: {
+        "barnDoorState": False, "batteryDisplayType": "percentage", "batteryState": "unknown",
+        "changeDesiccantFrequency": 0, "childLockSwitch": False, "closeDoorTimeSec": 0,
+        "coverCloseSpeed": "unknown", "deviceSn": "unknown", "electricQuantity": 0, "enableFeedingPlan": False,
+        "enableGrainOutletBlockedNotice": False, "enableLight": False, "enablePowerChangeNotice": False,
+        "enableReGrainNotice": False, "enableSound": False, "enableVideoRecord": False,
+        "filterReplacementFrequency": 0, "grainOutletState": True, "lightSwitch": False, "mac": "unknown",
+        "machineCleaningFrequency": 0, "nightVision": "unknown", "online": False, "onlineList": [],
+        "pumpAirState": False, "remainingCleaningDays": 0, "remainingReplacementDays": 0, "resolution": "unknown",
+        "screenDisplaySwitch": False, "soundSwitch": False, "surplusGrain": True, "todayTotalMl": 0,
+        "useWaterDuration": 0, "useWaterInterval": 0, "vacuumState": False, "videoRecordMode": "unknown",
+        "videoRecordSwitch": False, "weight": 0.0, "weightPercent": 0, "whetherInSleepMode": False,
+        "wifiRssi": -100,
+    },
+    GrainStatus: {
+        "todayFeedingQuantities": [], "todayFeedingQuantity": 0, "todayFeedingTimes": 0,
+        "todayEatingTimes": 0, "petEatingTime": 0,
+    },
+    AttributeSettings: {"volume": 0},
+    WetFeedingPlan: {"plan": []},
+}
+
+DEVICE = {
+    "deviceSn": "AF0301000000000",
+    "productName": "Granary Smart Feeder",
+    "productIdentifier": "PLAF103",
+    "name": "Feeder",
+}
+
+
+@pytest.mark.parametrize("model", list(OLD_DEFAULTS))
+def test_missing_keys_keep_the_old_defaults(model):
+    parsed = model.from_payload({})
+    for name, key, _ in model._PARSERS:
+        if key in OLD_DEFAULTS[model]:
+            assert getattr(parsed, name) == OLD_DEFAULTS[model][key], key
+    assert model.from_payload(None) == parsed == model.EMPTY
+
+
+def test_defaults_that_differ_by_device_are_given_where_read():
+    # Unset in the model, each device passes its old default to or_default
+    device = GranarySmartFeeder(dict(DEVICE), None)
+
+    assert device.unit_type == 1
+    assert device.wifi_ssid == "unknown"
+    assert device.running_state is False  # Read as "IDLE"
+    assert device.enable_low_battery_notice is False
+    assert device.remaining_desiccant == "unknown"
+
+
+def test_payload_values_are_coerced_to_the_annotated_types():
+    real_info = RealInfo.from_payload({
+        "online": 1, "wifiRssi": "-55", "weight": "12.5", "wifiSsid": "home", "unitType": 2, "unknownKey": "dropped",
+    })
+
+    assert (real_info.online, real_info.wifi_rssi, real_info.weight) == (True, -55, 12.5)
+    assert (real_info.wifi_ssid, real_info.unit_type) == ("home", 2)
+    assert not hasattr(real_info, "unknown_key")
+
+
+def test_values_of_the_wrong_type_fall_back_to_the_default():
+    real_info = RealInfo.from_payload({"wifiRssi": "strong", "electricQuantity": [80], "weight": {}})
+
+    assert (real_info.wifi_rssi, real_info.electric_quantity, real_info.weight) == (-100, 0, 0.0)
+
+
+def test_explicit_null_is_a_missing_value():
+    assert RealInfo.from_payload({"wifiRssi": None, "unitType": None}) == RealInfo.EMPTY
+
+
+def test_parse_endpoint():
+    plan = parse_endpoint("feedingPlanTodayNew", {"allSkipped": False, "plans": [{"executionTime": "08:00"}]})
+    assert plan == FeedingPlanToday(all_skipped=False, plans=[{"executionTime": "08:00"}])
+
+    assert parse_endpoint("realInfo", None) == RealInfo.EMPTY
+    # Endpoints without a model are kept as received
+    assert parse_endpoint("baseInfo", {"softwareVersion": "1.0.0"}) == {"softwareVersion": "1.0.0"}
+    assert parse_endpoint("baseInfo", None) == {}
+
+
+def test_or_default():
+    assert or_default(None, "unknown") == "unknown"
+    assert or_default(0, 1) == 0  # Only a missing value is replaced, not a falsy one
+    assert or_default(False, True) is False
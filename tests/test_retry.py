@@ -0,0 +1,142 @@
+"""Tests of the PETLIBRO retry policy, circuit breaker and command ledger."""
+
+from __future__ import annotations
+
+import asyncio
+
+from unittest.mock import patch
+
+import aiohttp
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.petlibro.exceptions import (  # noqa: E402
+    PetLibroCircuitOpenError,
+    PetLibroHTTPStatusError,
+    PetLibroRateLimitedError,
+    PetLibroResponseCodeError,
+)
+from custom_components.petlibro.retry import (  # noqa: E402
+    AUTH,
+    FATAL,
+    RETRYABLE,
+    CircuitBreaker,
+    CommandLedger,
+    RetryPolicy,
+    classify,
+)
+
+
+class Clock:
+    """Stand in for time.monotonic in the retry module."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    clock = Clock()
+    with patch("custom_components.petlibro.retry.monotonic", clock):
+        yield clock
+
+
+@pytest.mark.parametrize(("err", "expected"), [
+    (PetLibroResponseCodeError("Not logged in", 1009), AUTH),
+    (PetLibroResponseCodeError("Unsupported", 1001), FATAL),
+    (PetLibroResponseCodeError("No code", None), FATAL),
+    (PetLibroHTTPStatusError("Unauthorized", 401), AUTH),
+    (PetLibroHTTPStatusError("Too many requests", 429), RETRYABLE),
+    (PetLibroHTTPStatusError("Bad gateway", 502), RETRYABLE),
+    (PetLibroHTTPStatusError("Insufficient storage", 507), RETRYABLE),  # Any other 5xx
+    (PetLibroHTTPStatusError("Not found", 404), FATAL),
+    (PetLibroRateLimitedError("Throttled", 5), RETRYABLE),
+    (asyncio.TimeoutError(), RETRYABLE),
+    (aiohttp.ServerDisconnectedError(), RETRYABLE),
+    (aiohttp.ClientPayloadError(), RETRYABLE),
+    (ValueError("Bad JSON"), FATAL),
+])
+def test_classify(err, expected):
+    assert classify(err) == expected
+
+
+def test_backoff_grows_with_full_jitter_up_to_its_maximum():
+    policy = RetryPolicy(max_attempts=5, base_delay=1, max_delay=8)
+    err = asyncio.TimeoutError()
+
+    with patch("custom_components.petlibro.retry.random.uniform", side_effect=lambda low, high: high):
+        assert [policy.delay(attempt, err) for attempt in range(1, 6)] == [1, 2, 4, 8, 8]
+    for attempt in range(1, 6):
+        assert 0 <= policy.delay(attempt, err) <= 8
+
+
+def test_rate_limited_retry_does_not_back_off():
+    # The rate limiter already holds the retry until Retry-After has passed
+    assert RetryPolicy(5, 1, 8).delay(3, PetLibroRateLimitedError("Throttled", 5)) == 0
+
+
+def test_breaker_opens_after_the_threshold_and_lets_one_trial_through(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    for _ in range(2):
+        breaker.before_request()
+        breaker.record_failure()
+    assert breaker.state == "closed"
+
+    breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(PetLibroCircuitOpenError):
+        breaker.before_request()
+
+    clock.now += 60
+    assert breaker.state == "half_open"
+    breaker.before_request()  # The trial
+    with pytest.raises(PetLibroCircuitOpenError):
+        breaker.before_request()  # Only one at a time
+
+    breaker.record_success()
+    assert (breaker.state, breaker.failures) == ("closed", 0)
+    breaker.before_request()
+
+
+def test_failed_trial_opens_the_breaker_again(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=60)
+    for _ in range(3):
+        breaker.record_failure()
+    clock.now += 60
+
+    breaker.before_request()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    clock.now += 59
+    with pytest.raises(PetLibroCircuitOpenError):
+        breaker.before_request()
+
+
+def test_cancelled_trial_lets_another_one_through(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=60)
+    breaker.record_failure()
+    clock.now += 60
+
+    breaker.before_request()
+    breaker.record_cancelled()
+    assert breaker.state == "half_open"
+    breaker.before_request()  # Not rejected as a second trial
+    breaker.record_success()
+    assert breaker.state == "closed"
+
+
+def test_ledger_forgets_outcomes_after_its_ttl(clock):
+    ledger = CommandLedger(ttl=30)
+    ledger.record("request", True, {"ok": True})
+
+    entry = ledger.get("request")
+    assert (entry.succeeded, entry.result) == (True, {"ok": True})
+    assert ledger.get("other") is None
+
+    clock.now += 30
+    assert ledger.get("request") is None
+    assert len(ledger) == 0
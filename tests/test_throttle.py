@@ -0,0 +1,99 @@
+"""Tests of the PETLIBRO request throttling."""
+
+from __future__ import annotations
+
+import asyncio
+
+from unittest.mock import patch
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.petlibro.throttle import COMMAND, READ, RateLimiter, TokenBucket  # noqa: E402
+
+_sleep = asyncio.sleep
+
+
+class Clock:
+    """Stand in for time.monotonic and asyncio.sleep in the throttle module, sleeping without waiting."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+        self.slept: list[float] = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    async def sleep(self, delay: float) -> None:
+        self.slept.append(delay)
+        self.now += delay
+        await _sleep(0)
+
+
+@pytest.fixture
+def clock():
+    clock = Clock()
+    with patch("custom_components.petlibro.throttle.monotonic", clock), \
+            patch("custom_components.petlibro.throttle.asyncio.sleep", clock.sleep):
+        yield clock
+
+
+def test_bucket_refills_at_its_rate_up_to_its_capacity(clock):
+    bucket = TokenBucket(rate=2, capacity=4)
+    bucket._tokens = 0
+
+    clock.now += 1
+    assert bucket.tokens == 2
+    clock.now += 10
+    assert bucket.tokens == 4
+
+
+@pytest.mark.asyncio
+async def test_bucket_waits_for_the_next_token(clock):
+    bucket = TokenBucket(rate=2, capacity=1)
+
+    await bucket.acquire()
+    assert clock.slept == []  # The burst is available right away
+    await bucket.acquire()
+    assert clock.slept == [0.5]
+
+
+@pytest.mark.asyncio
+async def test_retry_after_pauses_every_request(clock):
+    limiter = RateLimiter(10, 10, 1, 1, default_retry_after=30)
+
+    assert limiter.defer("5") == 5
+    assert limiter.stats["paused_for"] == 5
+    await limiter.acquire(COMMAND)
+    assert clock.slept == [5]
+
+    assert limiter.defer(None) == 30  # No header, the default pause
+    await limiter.acquire(READ)
+    assert clock.slept == [5, 30]
+    assert limiter.throttled == 2
+
+
+def test_retry_after_parsing():
+    assert RateLimiter.parse_retry_after("12") == 12
+    assert RateLimiter.parse_retry_after("-3") == 0
+    assert RateLimiter.parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0  # In the past
+    assert RateLimiter.parse_retry_after("soon") is None
+    assert RateLimiter.parse_retry_after(None) is None
+
+
+@pytest.mark.asyncio
+async def test_queue_depth_counts_the_requests_waiting_for_a_token():
+    limiter = RateLimiter(read_rate=0.001, read_burst=1, command_rate=0.001, command_burst=1, default_retry_after=30)
+    await limiter.acquire(READ)
+    await limiter.acquire(COMMAND)
+
+    waiting = [asyncio.get_running_loop().create_task(limiter.acquire(kind)) for kind in (READ, READ, COMMAND)]
+    await asyncio.sleep(0)
+    assert limiter.queue_depth == 3
+    assert (limiter.stats["read_waiting"], limiter.stats["command_waiting"]) == (2, 1)
+
+    for task in waiting:
+        task.cancel()
+    await asyncio.gather(*waiting, return_exceptions=True)
+    assert limiter.queue_depth == 0